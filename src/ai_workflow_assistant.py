@@ -8,40 +8,237 @@ Desenvolvido por: Marduka & Gustavo
 Projeto: ELIS-V1 - Passo 5
 """
 
+import asyncio
 import json
 import os
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import re
+from collections import deque
 from datetime import datetime
 
+from intent_matcher import CompiledIntentMatcher
+from fuzzy_matcher import DEFAULT_MAX_CANDIDATES, FuzzyTermIndex
+from keyword_automaton import WorkflowKeywordIndex
+from suggestion_ranker import DEFAULT_MIN_SCORE, DEFAULT_TOP_K, SuggestionRanker
+from log_writer import shared_log_writer
+from log_stats import LogStatsIndex
+from log_analytics import LogFilter, analyze_logs, default_log_paths, format_report
+from step_engine import DEFAULT_MAX_WORKERS, StepEngine, build_step_graph
+from workflow_actions import ActionContext, ActionRunner
+from async_runner import WorkflowRunner
+from execution_plan import ExecutionPlan, compile_plan
+from output_capture import DEFAULT_BUFFER_BYTES, DEFAULT_LOG_CHUNK_BYTES
+from config_snapshot import ConfigSnapshot
+from config_watcher import DEFAULT_POLL_INTERVAL, ConfigWatcher
+from assistant_daemon import AssistantDaemon
+from ai_workflow_client import send_request
+from telemetry import ProfileSession, WorkflowRun, WorkflowTelemetry
+from routing_cache import DEFAULT_MAX_ENTRIES as DEFAULT_CACHE_ENTRIES, RoutingCache
+from scheduler import SCHEDULER_STATE_NAME, JobScheduler, load_scheduler_state
+from monitor_jobs import MonitorJobs
+from usage_stats import DEFAULT_HALF_LIFE_DAYS, USAGE_FILE_NAME, UsageCounters
+from job_queue import ResourceClaim, WorkflowJobQueue
+from text_normalization import routing_key, routing_key_mode, text_normalizer
+
 class AIWorkflowAssistant:
     """
     Assistente inteligente para reconhecimento e execução de fluxos de trabalho.
     """
     
-    def __init__(self, config_file: str = "workflow-config.json"):
+    def __init__(self, config_file: str = "workflow-config.json", verbose: bool = True,
+                 use_snapshot: bool = True):
         """
         Inicializa o assistente com arquivo de configuração.
         
         Args:
             config_file: Caminho para o arquivo de configuração dos fluxos
+            verbose: Se deve exibir o banner de inicialização
+            use_snapshot: Se deve usar o snapshot compilado da configuração
         """
         self.project_root = Path(__file__).parent.parent
         self.config_file = self.project_root / config_file
-        self.log_file = self.project_root / "workflow-automation.log"
+        self.log_file = self.config_file.parent / "workflow-automation.log"
+        self.metrics_file = self.config_file.parent / "workflow-metrics.json"
+        self.usage_file = self.config_file.parent / USAGE_FILE_NAME
+        
+        self.use_snapshot = use_snapshot
+        self._telemetry = None
+        self._usage = None
+        self._usage_priority_cache = (None, None)
+        # (ordem de uso, geração): a geração só muda quando a ordem muda
+        self._usage_generation = (None, 0)
+        self._job_queue = None
+        self._job_queue_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._config_watcher = None
         
-        # Carregar configurações
-        self.config = self._load_config()
+        # Carregar configurações e índices de reconhecimento (via snapshot, se válido)
+        started = time.perf_counter()
+        self._load_config_and_indexes(use_snapshot)
+        self.load_stats['seconds'] = time.perf_counter() - started
+        self.notification_config = self._load_notification_config()
+        self.routing_cache = self._create_routing_cache()
         
         # Inicializar sistema de logs
         self._setup_logging()
         
-        print(f"🤖 AI Workflow Assistant inicializado")
-        print(f"📁 Projeto: {self.config['project_info']['name']}")
-        print(f"🔧 Fluxos disponíveis: {len(self.config['ai_workflow_mapping'])}")
+        if verbose:
+            print(f"🤖 AI Workflow Assistant inicializado")
+            print(f"📁 Projeto: {self.config['project_info']['name']}")
+            print(f"🔧 Fluxos disponíveis: {len(self.config['ai_workflow_mapping'])}")
+    
+    def _load_config_and_indexes(self, use_snapshot: bool = True):
+        """
+        Carrega a configuração e compila os índices derivados dela.
+        
+        Com `use_snapshot`, usa o snapshot ao lado do JSON quando ele ainda
+        corresponde ao arquivo (mtime/tamanho ou hash do conteúdo).
+        
+        Args:
+            use_snapshot: Se deve usar (e atualizar) o snapshot compilado
+        """
+        loaded = ConfigSnapshot(self.config_file).load(self._compile_indexes) if use_snapshot else None
+        
+        if loaded:
+            config, indexes, source = loaded
+        else:
+            config = self._load_config()
+            indexes = self._compile_indexes(config)
+            source = 'json'
+        
+        self._swap_state(config, indexes)
+        self.load_stats = {'source': source, 'seconds': 0.0}
+    
+    def _swap_state(self, config: Dict, indexes: Dict):
+        """
+        Publica uma nova configuração e seus índices de uma só vez.
+        
+        O estado é um único dicionário trocado por atribuição (atômica), de modo
+        que uma solicitação em andamento continua usando o estado que obteve.
+        Os planos de execução dos scripts não vão para o snapshot: cada estado
+        começa sem planos e `_execution_plan` compila e guarda o de cada
+        operação no primeiro uso, verificando o disco naquele momento.
+        """
+        previous = getattr(self, '_state', None)
+        state = {'config': config, 'version': previous['version'] + 1 if previous else 1}
+        state.update(indexes)
+        state['plans'] = {}
+        self._state = state
+    
+    @property
+    def config(self) -> Dict:
+        return self._state['config']
+    
+    @property
+    def intent_matcher(self) -> CompiledIntentMatcher:
+        return self._state['intent_matcher']
+    
+    @property
+    def keyword_index(self) -> WorkflowKeywordIndex:
+        return self._state['keyword_index']
+    
+    @property
+    def suggestion_ranker(self) -> SuggestionRanker:
+        return self._state['suggestion_ranker']
+    
+    @property
+    def config_version(self) -> int:
+        """
+        Número incrementado a cada troca de configuração.
+        """
+        return self._state['version']
+    
+    def reload_config(self) -> Optional[Dict]:
+        """
+        Recarrega `workflow-config.json`, recompilando apenas as intenções e
+        categorias cuja configuração mudou, e troca o estado atomicamente.
+        
+        Returns:
+            Resumo com as intenções e categorias recompiladas, ou None se o arquivo
+            não mudou ou não pôde ser lido (o estado atual é mantido)
+        """
+        with self._reload_lock:
+            previous = self._state
+            
+            def compile_incremental(config: Dict) -> Dict:
+                return self._compile_indexes(config, previous)
+            
+            if self.use_snapshot:
+                loaded = ConfigSnapshot(self.config_file).load(compile_incremental)
+            else:
+                loaded = None
+                try:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        config = json.load(f)
+                    loaded = config, compile_incremental(config), 'json'
+                except (OSError, json.JSONDecodeError):
+                    pass
+            
+            if loaded is None:
+                self._log_activity("Falha ao recarregar configuração: mantendo a versão atual", "WARNING")
+                return None
+            
+            config, indexes, _ = loaded
+            if config == previous['config']:
+                return None
+            
+            self._swap_state(config, indexes)
+            # As entradas antigas já seriam descartadas pela versão; liberar a memória de uma vez
+            self.routing_cache.clear()
+        
+        summary = {
+            'version': self.config_version,
+            'intents': list(getattr(indexes['intent_matcher'], 'recompiled', [])),
+            'categories': list(getattr(indexes['keyword_index'], 'recompiled', []))
+        }
+        self._log_activity(f"Configuração recarregada (versão {summary['version']}): "
+                           f"{len(summary['intents'])} intenção(ões) e {len(summary['categories'])} categoria(s) reindexadas")
+        return summary
+    
+    def start_config_watch(self, interval: float = DEFAULT_POLL_INTERVAL,
+                           on_reload: Optional[Callable[[Dict], None]] = None):
+        """
+        Observa `workflow-config.json` e recarrega a configuração quando ele muda.
+        
+        Args:
+            interval: Intervalo de verificação, em segundos
+            on_reload: Função chamada com o resumo de cada recarga bem-sucedida
+        """
+        if self._config_watcher is not None:
+            return
+        
+        def handle_change() -> bool:
+            summary = self.reload_config()
+            if summary and on_reload:
+                on_reload(summary)
+            # Arquivo ilegível (ex.: gravação em andamento): tentar de novo no próximo ciclo
+            return summary is not None or self._config_is_current()
+        
+        self._config_watcher = ConfigWatcher(self.config_file, handle_change, interval)
+        self._config_watcher.start()
+    
+    def stop_config_watch(self):
+        """
+        Interrompe a observação da configuração.
+        """
+        if self._config_watcher is not None:
+            self._config_watcher.stop()
+            self._config_watcher = None
+    
+    def _config_is_current(self) -> bool:
+        """
+        Indica se o arquivo em disco corresponde à configuração carregada.
+        """
+        try:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                return json.load(f) == self.config
+        except (OSError, json.JSONDecodeError):
+            return False
     
     def _load_config(self) -> Dict:
         """
@@ -60,6 +257,20 @@ class AIWorkflowAssistant:
             print(f"❌ Erro ao ler configuração: {e}")
             return self._create_default_config()
     
+    def _load_notification_config(self) -> Dict:
+        """
+        Carrega `notification-config.json` (ao lado da configuração dos fluxos).
+        
+        Returns:
+            Dicionário com configurações de notificação, ou vazio se indisponível
+        """
+        notification_file = self.config_file.parent / "notification-config.json"
+        try:
+            with open(notification_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+    
     def _create_default_config(self) -> Dict:
         """
         Cria configuração padrão caso o arquivo não exista.
@@ -86,7 +297,62 @@ class AIWorkflowAssistant:
         """
         Configura sistema de logs para rastrear execução de fluxos.
         """
-        self.log_enabled = self.config.get('automation_settings', {}).get('logging', {}).get('log_all_workflows', True)
+        logging_config = self.config.get('automation_settings', {}).get('logging', {})
+        self.log_enabled = logging_config.get('log_all_workflows', True)
+        
+        # Escritor persistente em segundo plano (um por arquivo), com rotação por tamanho
+        max_log_size_mb = self.notification_config.get('monitoring', {}).get('max_log_size_mb', 10)
+        self.log_writer = None
+        if self.log_enabled:
+            self.log_writer = shared_log_writer(
+                self.log_file,
+                max_bytes=int(max_log_size_mb * 1024 * 1024),
+                backup_count=logging_config.get('backup_count', 3)
+            )
+    
+    def _compile_indexes(self, config: Dict, previous: Optional[Dict] = None) -> Dict:
+        """
+        Compila as estruturas de busca derivadas da configuração.
+        
+        Args:
+            config: Configuração dos fluxos
+            previous: Estado anterior; intenções e categorias inalteradas são reaproveitadas
+        
+        Returns:
+            Dicionário {nome do índice: índice compilado}
+        """
+        recognition = config.get('ai_recognition_patterns', {})
+        # Minúsculas (padrão) ou, com `normalization.fold_accents`, também sem acentos
+        normalize = text_normalizer(recognition)
+        intent_matcher = CompiledIntentMatcher(recognition.get('intent_detection', {}),
+                                               previous and previous.get('intent_matcher'), normalize)
+        keyword_index = WorkflowKeywordIndex(config.get('ai_workflow_mapping', {}),
+                                             previous and previous.get('keyword_index'), normalize)
+        
+        # Camada aproximada: vocabulário com as palavras dos padrões e das palavras-chave
+        fuzzy_index = None
+        fuzzy_config = recognition.get('fuzzy_matching', {})
+        if fuzzy_config.get('enabled', True):
+            vocabulary = list(intent_matcher.postings)
+            for keyword in keyword_index.automaton.keywords:
+                vocabulary.extend(keyword.split())
+            fuzzy_index = FuzzyTermIndex(vocabulary, fuzzy_config.get('max_candidates', DEFAULT_MAX_CANDIDATES),
+                                         previous and previous.get('fuzzy_index'))
+        
+        suggestions_config = config.get('automation_settings', {}).get('smart_suggestions', {})
+        suggestion_ranker = SuggestionRanker(keyword_index,
+                                             suggestions_config.get('top_k', DEFAULT_TOP_K),
+                                             suggestions_config.get('min_score', DEFAULT_MIN_SCORE))
+        
+        return {
+            'normalize': normalize,
+            # Espaçamento que a chave do cache pode descartar sem mudar o roteamento
+            'key_whitespace': routing_key_mode(intent_matcher.pattern_texts + keyword_index.automaton.keywords),
+            'intent_matcher': intent_matcher,
+            'keyword_index': keyword_index,
+            'fuzzy_index': fuzzy_index,
+            'suggestion_ranker': suggestion_ranker
+        }
     
     def _log_activity(self, message: str, level: str = "INFO"):
         """
@@ -102,11 +368,7 @@ class AIWorkflowAssistant:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] [{level}] {message}\n"
         
-        try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-        except Exception as e:
-            print(f"⚠️ Erro ao escrever log: {e}")
+        self.log_writer.write(log_entry)
     
     def recognize_intent(self, user_input: str) -> Optional[Tuple[str, float]]:
         """
@@ -118,83 +380,116 @@ class AIWorkflowAssistant:
         Returns:
             Tupla com (ação_identificada, confiança) ou None se não reconhecido
         """
-        user_input_lower = user_input.lower().strip()
-        
-        patterns = self.config.get('ai_recognition_patterns', {}).get('intent_detection', {})
-        
-        best_match = None
-        best_confidence = 0.0
+        return self._recognize(self._state, user_input)
+    
+    def _recognize(self, state: Dict, user_input: str) -> Optional[Tuple[str, float]]:
+        """
+        Reconhece a intenção usando um estado específico da configuração.
+        """
+        priority = self._usage_priority(state)
+        result = state['intent_matcher'].match(user_input, priority.get('patterns'))
+        if result is None:
+            corrected = self._fuzzy_correction(state, user_input)
+            if corrected is not None:
+                result = state['intent_matcher'].match(corrected, priority.get('patterns'))
+        if result is None:
+            return None
         
-        for intent_name, intent_config in patterns.items():
-            patterns_list = intent_config.get('patterns', [])
-            threshold = intent_config.get('confidence_threshold', 0.7)
-            
-            for pattern in patterns_list:
-                # Calcular similaridade simples
-                confidence = self._calculate_similarity(user_input_lower, pattern.lower())
-                
-                if confidence >= threshold and confidence > best_confidence:
-                    best_match = intent_config.get('action')
-                    best_confidence = confidence
+        best_match, best_confidence = result
+        self._log_activity(f"Intent reconhecido: {best_match} (confiança: {best_confidence:.2f})")
+        return best_match, best_confidence
+    
+    def find_workflow_by_keywords(self, user_input: str) -> Optional[Dict]:
+        """
+        Encontra fluxo de trabalho baseado em palavras-chave.
         
-        if best_match:
-            self._log_activity(f"Intent reconhecido: {best_match} (confiança: {best_confidence:.2f})")
-            return best_match, best_confidence
+        Args:
+            user_input: Entrada do usuário
         
-        return None
+        Returns:
+            Configuração do fluxo encontrado ou None
+        """
+        return self._find_workflow(self._state, user_input)
     
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
+    def _find_workflow(self, state: Dict, user_input: str) -> Optional[Dict]:
+        """
+        Busca o fluxo por palavras-chave usando um estado específico da configuração.
         """
-        Calcula similaridade simples entre dois textos.
+        keyword_index = state['keyword_index']
+        operations = self._usage_priority(state).get('operations')
+        workflow = self._workflow_info(keyword_index, keyword_index.first_match(user_input, operations))
+        if workflow is None:
+            corrected = self._fuzzy_correction(state, user_input)
+            if corrected is not None:
+                workflow = self._workflow_info(keyword_index, keyword_index.first_match(corrected, operations))
+        if workflow:
+            self._log_activity(f"Fluxo encontrado: {workflow['category']}.{workflow['operation']}")
+        return workflow
+    
+    def _fuzzy_correction(self, state: Dict, user_input: str) -> Optional[str]:
+        """
+        Corrige erros de digitação da entrada com o índice de trigramas.
         
-        Args:
-            text1: Primeiro texto
-            text2: Segundo texto
+        Usado apenas quando a busca exata falha.
         
         Returns:
-            Valor de similaridade entre 0 e 1
+            Entrada normalizada e corrigida, ou None se não houver correção
+        """
+        fuzzy_index = state.get('fuzzy_index')
+        if fuzzy_index is None:
+            return None
+        
+        result = fuzzy_index.correct(state['normalize'](user_input))
+        if result is None:
+            return None
+        
+        corrected, corrections = result
+        self._log_activity("Correção aproximada: " + ", ".join(f"{word} -> {term}" for word, term in corrections))
+        return corrected
+    
+    def _fuzzy_fallback(self, state: Dict, user_input: str, intent: Optional[Tuple[str, float]],
+                        workflow: Optional[Dict]) -> Tuple[Optional[Tuple[str, float]], Optional[Dict], Optional[str]]:
         """
-        # Verificar se o padrão está contido no texto
-        if text2 in text1:
-            return 0.9
+        Repete com a entrada corrigida apenas as buscas exatas que falharam.
         
-        # Verificar palavras-chave
-        words1 = set(text1.split())
-        words2 = set(text2.split())
+        Returns:
+            Tupla (intenção, fluxo, entrada corrigida ou None)
+        """
+        if intent is not None and workflow is not None:
+            return intent, workflow, None
         
-        if not words2:
-            return 0.0
+        corrected = self._fuzzy_correction(state, user_input)
+        if corrected is None:
+            return intent, workflow, None
         
-        intersection = words1.intersection(words2)
-        return len(intersection) / len(words2)
+        priority = self._usage_priority(state)
+        if intent is None:
+            intent = state['intent_matcher'].match(corrected, priority.get('patterns'))
+        if workflow is None:
+            keyword_index = state['keyword_index']
+            workflow = self._workflow_info(keyword_index, keyword_index.first_match(corrected, priority.get('operations')))
+        return intent, workflow, corrected
     
-    def find_workflow_by_keywords(self, user_input: str) -> Optional[Dict]:
+    def _workflow_info(self, keyword_index: WorkflowKeywordIndex, operation_index: int) -> Optional[Dict]:
         """
-        Encontra fluxo de trabalho baseado em palavras-chave.
+        Monta as informações do fluxo a partir do índice da operação.
         
         Args:
-            user_input: Entrada do usuário
+            keyword_index: Índice de palavras-chave do estado em uso
+            operation_index: Índice da operação no índice de palavras-chave (-1 se nenhuma)
         
         Returns:
-            Configuração do fluxo encontrado ou None
+            Informações do fluxo ou None
         """
-        user_input_lower = user_input.lower()
-        
-        # Buscar em todas as categorias de operações
-        for category_name, category in self.config.get('ai_workflow_mapping', {}).items():
-            for operation_name, operation in category.items():
-                keywords = operation.get('keywords', [])
-                
-                for keyword in keywords:
-                    if keyword.lower() in user_input_lower:
-                        self._log_activity(f"Fluxo encontrado: {category_name}.{operation_name}")
-                        return {
-                            'category': category_name,
-                            'operation': operation_name,
-                            'config': operation
-                        }
+        if operation_index < 0:
+            return None
         
-        return None
+        category_name, operation_name, operation = keyword_index.operations[operation_index]
+        return {
+            'category': category_name,
+            'operation': operation_name,
+            'config': operation
+        }
     
     def execute_workflow(self, workflow_info: Dict, interactive: bool = True) -> bool:
         """
@@ -207,12 +502,38 @@ class AIWorkflowAssistant:
         Returns:
             True se executado com sucesso, False caso contrário
         """
+        config = workflow_info['config']
+        operation_name = workflow_info['operation']
+        run = WorkflowRun(operation_name)
+        # Estado do Git compartilhado pelas pré e pós-ações desta execução
+        context = ActionContext(self.project_root, operation_name, log=self._log_activity)
+        
         try:
-            config = workflow_info['config']
-            operation_name = workflow_info['operation']
-            
             print(f"\n🔄 Fluxo identificado: {config['description']}")
             
+            # Verificar se o fluxo pode rodar antes de qualquer efeito colateral
+            # (pré-ações como `backup_current_state` gravam no repositório)
+            script_path = config.get('script')
+            parameters = config.get('parameters', '')
+            workflow_name = config.get('workflow')
+            definition = self.config.get('workflow_definitions', {}).get(workflow_name)
+            plan = None
+            
+            if definition is not None:
+                try:
+                    build_step_graph(definition.get('steps', []))
+                except ValueError as e:
+                    print(f"❌ Definição inválida: {e}")
+                    self._log_activity(f"Definição {workflow_name} de {operation_name} inválida: {e}", "ERROR")
+                    return False
+            elif script_path:
+                plan = self._execution_plan(workflow_info)
+                if not plan.valid:
+                    for error in plan.errors:
+                        print(f"❌ {error[0].upper()}{error[1:]}")
+                    self._log_activity(f"Plano de execução de {operation_name} inválido: {'; '.join(plan.errors)}", "ERROR")
+                    return False
+            
             if interactive:
                 confirm = input(f"Deseja executar este fluxo? (s/N): ").lower().strip()
                 if confirm not in ['s', 'sim', 'y', 'yes']:
@@ -222,51 +543,49 @@ class AIWorkflowAssistant:
             # Executar pré-ações
             pre_actions = config.get('pre_actions', [])
             if pre_actions:
-                print("📋 Executando pré-ações...")
-                for action in pre_actions:
-                    print(f"   ⚡ {action}")
-                    self._execute_pre_action(action)
-            
-            # Executar script principal
-            script_path = config.get('script')
-            parameters = config.get('parameters', '')
+                with run.phase('pre_actions') as phase:
+                    print("📋 Executando pré-ações...")
+                    report = self._run_actions(pre_actions, context)
+                    phase['status'] = 'success' if report['success'] else 'failed'
+                
+                if not report['success']:
+                    print("❌ Pré-ação falhou: fluxo interrompido")
+                    self._log_activity(f"Pré-ações de {operation_name} falharam", "ERROR")
+                    return False
             
-            if script_path:
-                full_script_path = self.project_root / script_path
+            # Executar script principal (ou a definição nativa do fluxo, quando existir)
+            if definition is not None:
+                with run.phase('definition') as phase:
+                    report = self.run_workflow_definition(workflow_name, interactive)
+                    phase['status'] = 'success' if report['success'] else 'failed'
                 
-                if full_script_path.exists():
-                    print(f"🚀 Executando: {script_path} {parameters}")
-                    
-                    # Determinar como executar baseado na extensão
-                    if script_path.endswith('.ps1'):
-                        cmd = f'powershell -ExecutionPolicy Bypass -File "{full_script_path}" {parameters}'
-                    elif script_path.endswith('.bat'):
-                        cmd = f'"{full_script_path}" {parameters}'
-                    else:
-                        cmd = f'"{full_script_path}" {parameters}'
-                    
-                    result = subprocess.run(cmd, shell=True, cwd=self.project_root, 
-                                          capture_output=False, text=True)
-                    
-                    if result.returncode == 0:
-                        print("✅ Fluxo executado com sucesso!")
-                        self._log_activity(f"Fluxo {operation_name} executado com sucesso")
-                    else:
-                        print(f"❌ Erro na execução (código: {result.returncode})")
-                        self._log_activity(f"Erro na execução do fluxo {operation_name}: código {result.returncode}", "ERROR")
-                        return False
+                if report['success']:
+                    print("✅ Fluxo executado com sucesso!")
+                    self._log_activity(f"Fluxo {operation_name} executado com sucesso")
                 else:
-                    print(f"❌ Script não encontrado: {full_script_path}")
-                    self._log_activity(f"Script não encontrado: {script_path}", "ERROR")
+                    print(f"❌ Erro na execução do fluxo {workflow_name}")
+                    self._log_activity(f"Erro na execução do fluxo {operation_name}: {report['error'] or 'etapa falhou'}", "ERROR")
                     return False
             
-            # Executar pós-ações
+            elif plan is not None:
+                print(f"🚀 Executando: {script_path} {parameters}")
+                
+                with run.phase('script') as phase:
+                    report = asyncio.run(self._create_runner().run(
+                        operation_name, plan.argv, config.get('timeout_seconds')))
+                    phase['exit_code'] = report['returncode']
+                    phase['status'] = self._script_status(report)
+                
+                if not self._report_script_run(report):
+                    return False
+            
+            # Executar pós-ações (o fluxo pode ter alterado o repositório: reler o estado do Git)
             post_actions = config.get('post_actions', [])
             if post_actions:
-                print("📋 Executando pós-ações...")
-                for action in post_actions:
-                    print(f"   ⚡ {action}")
-                    self._execute_post_action(action)
+                context.git.invalidate()
+                with run.phase('post_actions') as phase:
+                    print("📋 Executando pós-ações...")
+                    phase['status'] = 'success' if self._run_actions(post_actions, context)['success'] else 'failed'
             
             return True
             
@@ -274,34 +593,345 @@ class AIWorkflowAssistant:
             print(f"❌ Erro na execução do fluxo: {e}")
             self._log_activity(f"Erro na execução: {e}", "ERROR")
             return False
+        
+        finally:
+            if run.phases:
+                self.telemetry.record(run)
+                self._log_activity(f"Fases de {operation_name}: {run.summary()} (total {run.elapsed:.3f}s)")
     
-    def _execute_pre_action(self, action: str):
+    @property
+    def telemetry(self) -> WorkflowTelemetry:
         """
-        Executa uma pré-ação específica.
+        Agregados de telemetria das execuções (carregados na primeira utilização).
+        """
+        if self._telemetry is None:
+            self._telemetry = WorkflowTelemetry(self.metrics_file)
+        return self._telemetry
+    
+    @property
+    def job_queue(self) -> WorkflowJobQueue:
+        """
+        Fila de execução com exclusão por recurso (criada na primeira utilização).
+        """
+        with self._job_queue_lock:
+            if self._job_queue is None:
+                settings = self.config.get('automation_settings', {}).get('job_queue', {})
+                self._job_queue = WorkflowJobQueue(settings.get('max_workers', DEFAULT_MAX_WORKERS))
+            return self._job_queue
+    
+    def submit_workflow(self, workflow_info: Dict, interactive: bool = False):
+        """
+        Enfileira a execução de um fluxo conforme os recursos declarados em `resources`.
+        
+        Fluxos que só leem os mesmos recursos rodam em paralelo; os que escrevem
+        um recurso usado por outro esperam, na ordem de chegada.
         
         Args:
-            action: Nome da ação a ser executada
+            workflow_info: Fluxo (como devolvido por `find_workflow_by_keywords`)
+            interactive: Se deve solicitar confirmação do usuário
+        
+        Returns:
+            Future com o resultado de `execute_workflow`
         """
-        if action == "auto_save_files":
-            print("   💾 Salvando arquivos automaticamente...")
-        elif action == "check_git_status":
-            print("   📊 Verificando status do Git...")
-        elif action == "validate_changes":
-            print("   ✅ Validando mudanças...")
-        # Adicionar mais pré-ações conforme necessário
+        return self.job_queue.submit(workflow_info['operation'],
+                                     lambda: self.execute_workflow(workflow_info, interactive),
+                                     ResourceClaim.from_config(workflow_info['config']))
     
-    def _execute_post_action(self, action: str):
+    @property
+    def usage(self) -> Optional[UsageCounters]:
+        """
+        Contadores de uso dos fluxos (None se `smart_suggestions.learn_from_usage` estiver desativado).
         """
-        Executa uma pós-ação específica.
+        settings = self.config.get('automation_settings', {}).get('smart_suggestions', {})
+        if not settings.get('learn_from_usage', False):
+            return None
+        if self._usage is None:
+            self._usage = UsageCounters(self.usage_file, settings.get('usage_half_life_days', DEFAULT_HALF_LIFE_DAYS))
+        return self._usage
+    
+    def record_usage(self, workflow: Dict, intent: Optional[Tuple[str, float]] = None):
+        """
+        Registra o fluxo (e a intenção reconhecida) escolhido pelo usuário.
         
         Args:
-            action: Nome da ação a ser executada
+            workflow: Fluxo escolhido (`category`, `operation`)
+            intent: Resultado de `recognize_intent` para a mesma solicitação
         """
-        if action == "update_notifications":
-            print("   🔔 Atualizando notificações...")
-        elif action == "log_activity":
-            print("   📝 Registrando atividade...")
-        # Adicionar mais pós-ações conforme necessário
+        usage = self.usage
+        if usage is None:
+            return
+        
+        usage.record(f"workflow:{workflow['category']}.{workflow['operation']}")
+        if intent:
+            usage.record(f"intent:{intent[0]}")
+        try:
+            usage.save()
+        except OSError as e:
+            self._log_activity(f"Não foi possível gravar os contadores de uso: {e}", "WARNING")
+    
+    def _usage_priority(self, state: Dict) -> Dict:
+        """
+        Prioridades derivadas dos contadores de uso para um estado da configuração.
+        
+        Returns:
+            Dicionário com `patterns` (desempate das intenções, mais usadas primeiro),
+            `operations` (ordem dos fluxos por palavra-chave), `boosts` (bônus das
+            sugestões) e `version`; vazio se não houver uso registrado. `version`
+            entra na chave do cache de roteamento e só muda quando a ordem de uso
+            muda, não a cada uso (sugestões em cache mantêm os bônus do cálculo
+            até expirarem)
+        """
+        usage = self.usage
+        if usage is None or not len(usage):
+            return {}
+        
+        key = (state['version'], usage.version)
+        cached_key, cached = self._usage_priority_cache
+        if cached_key == key:
+            return cached
+        
+        matcher = state['intent_matcher']
+        actions = list(dict.fromkeys(action for action in matcher.pattern_actions if action))
+        action_ranks = dict(zip(actions, usage.ranks([f"intent:{action}" for action in actions])))
+        pattern_count = len(matcher.pattern_actions)
+        patterns = [action_ranks.get(action, len(actions)) * pattern_count + pattern_id
+                    for pattern_id, action in enumerate(matcher.pattern_actions)]
+        
+        names = [f"workflow:{category}.{operation}" for category, operation, _ in state['keyword_index'].operations]
+        weight = self.config.get('automation_settings', {}).get('smart_suggestions', {}).get('usage_weight', 0.5)
+        operations = usage.ranks(names)
+        boosts = [weight * prior for prior in usage.priors(names)]
+        
+        signature = (state['version'], patterns, operations)
+        previous_signature, generation = self._usage_generation
+        if signature != previous_signature:
+            generation += 1
+            self._usage_generation = (signature, generation)
+        
+        priority = {'patterns': patterns, 'operations': operations, 'boosts': boosts, 'version': generation}
+        self._usage_priority_cache = (key, priority)
+        return priority
+    
+    @staticmethod
+    def _script_status(report: Dict) -> str:
+        """
+        Classifica o resultado de uma execução de script para a telemetria.
+        """
+        if report['success']:
+            return 'success'
+        if report['timed_out']:
+            return 'timeout'
+        return 'error' if report['error'] else 'failed'
+    
+    def _execution_plan(self, workflow_info: Dict) -> ExecutionPlan:
+        """
+        Plano de execução do script de um fluxo, compilado no primeiro uso e
+        guardado no estado atual da configuração.
+        
+        Um plano guardado cujo `script`/`parameters` não confere com o fluxo
+        (ex.: fluxo montado fora da configuração atual) é recompilado.
+        
+        Args:
+            workflow_info: Fluxo (`category`, `operation`, `config`) com `script` definido
+        """
+        config = workflow_info['config']
+        plans = self._state['plans']
+        key = (workflow_info.get('category'), workflow_info['operation'])
+        plan = plans.get(key)
+        if plan is None or not plan.matches(config):
+            plan = plans[key] = compile_plan(self.project_root, workflow_info['operation'], config)
+        return plan
+    
+    def _create_runner(self) -> WorkflowRunner:
+        """
+        Cria o executor assíncrono com tempo limite e novas tentativas configurados.
+        
+        Usa `advanced.timeout_seconds` (notification-config.json),
+        `automation_settings.error_handling` e `automation_settings.output_capture`
+        (workflow-config.json).
+        """
+        automation_settings = self.config.get('automation_settings', {})
+        error_handling = automation_settings.get('error_handling', {})
+        max_retries = error_handling.get('max_retries', 0) if error_handling.get('retry_failed_operations') else 0
+        
+        capture = automation_settings.get('output_capture', {})
+        capture_bytes = 0
+        if capture.get('enabled', True):
+            capture_bytes = int(capture.get('buffer_kb', DEFAULT_BUFFER_BYTES // 1024) * 1024)
+        
+        return WorkflowRunner(
+            self.project_root,
+            timeout_seconds=self.notification_config.get('advanced', {}).get('timeout_seconds'),
+            max_retries=max_retries,
+            backoff_seconds=error_handling.get('retry_backoff_seconds', 1.0),
+            capture_bytes=capture_bytes,
+            output_sink=self._log_script_output if capture.get('log_output', True) else None,
+            log_chunk_bytes=int(capture.get('log_chunk_kb', DEFAULT_LOG_CHUNK_BYTES // 1024) * 1024)
+        )
+    
+    def _log_script_output(self, workflow: str, stream: str, text: str):
+        """
+        Registra um bloco da saída de um script, uma entrada por linha, em uma única gravação.
+        
+        Args:
+            workflow: Nome do fluxo
+            stream: 'stdout' ou 'stderr'
+            text: Bloco de saída (termina em quebra de linha, exceto o último)
+        """
+        if not self.log_enabled:
+            return
+        
+        prefix = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [{'WARNING' if stream == 'stderr' else 'INFO'}] [{workflow}:{stream}] "
+        self.log_writer.write(''.join(f"{prefix}{line}\n" for line in text.splitlines()))
+    
+    def _report_script_run(self, report: Dict) -> bool:
+        """
+        Exibe e registra o resultado da execução de um script.
+        
+        Returns:
+            True se a execução terminou com sucesso
+        """
+        operation_name = report['workflow']
+        attempts = f" após {report['attempts']} tentativas" if report['attempts'] > 1 else ""
+        
+        if report.get('output_bytes'):
+            self._log_activity(f"Saída de {operation_name}: {report['output_bytes']['stdout']} bytes em stdout, "
+                               f"{report['output_bytes']['stderr']} bytes em stderr")
+        
+        if report['success']:
+            print(f"✅ Fluxo executado com sucesso!{attempts}")
+            self._log_activity(f"Fluxo {operation_name} executado com sucesso")
+            return True
+        
+        if report['timed_out']:
+            print(f"❌ Tempo limite excedido{attempts}")
+            self._log_activity(f"Erro na execução do fluxo {operation_name}: tempo limite excedido", "ERROR")
+        elif report['error']:
+            print(f"❌ Erro ao iniciar o script: {report['error']}")
+            self._log_activity(f"Erro na execução do fluxo {operation_name}: {report['error']}", "ERROR")
+        else:
+            print(f"❌ Erro na execução (código: {report['returncode']}){attempts}")
+            self._log_activity(f"Erro na execução do fluxo {operation_name}: código {report['returncode']}", "ERROR")
+        return False
+    
+    def execute_workflows_concurrently(self, workflow_infos: List[Dict]) -> List[Dict]:
+        """
+        Executa vários fluxos pela fila de recursos, sem interação.
+        
+        Cada fluxo usa seu script, com tempo limite e novas tentativas; fluxos
+        compatíveis rodam ao mesmo tempo e os que disputam um recurso (ex.: o
+        índice do Git) em sequência. Fluxos sem script executável são reportados como falha.
+        
+        Args:
+            workflow_infos: Lista de fluxos (como devolvidos por `find_workflow_by_keywords`)
+        
+        Returns:
+            Relatório de cada execução, na mesma ordem
+        """
+        reports: List = []
+        
+        for workflow_info in workflow_infos:
+            config = workflow_info['config']
+            plan = self._execution_plan(workflow_info) if config.get('script') else None
+            
+            if plan is None or not plan.valid:
+                error = "; ".join(plan.errors) if plan else "fluxo sem script"
+                reports.append({'workflow': workflow_info['operation'], 'command': None, 'success': False,
+                                'returncode': None, 'timed_out': False, 'attempts': 0, 'elapsed': 0.0,
+                                'error': error})
+                continue
+            
+            # Cada fluxo roda em uma thread da fila, com seu próprio event loop
+            name, timeout = workflow_info['operation'], config.get('timeout_seconds')
+            reports.append(self.job_queue.submit(
+                name, lambda name=name, argv=plan.argv, timeout=timeout:
+                    asyncio.run(self._create_runner().run(name, argv, timeout)),
+                ResourceClaim.from_config(config)))
+        
+        submitted = sum(1 for report in reports if not isinstance(report, dict))
+        if submitted:
+            print(f"🚀 Executando {submitted} fluxo(s): compatíveis em paralelo, conflitantes em sequência...")
+            reports = [report if isinstance(report, dict) else report.result() for report in reports]
+        
+        for report in reports:
+            print(f"\n📋 {report['workflow']} ({report['elapsed']:.2f}s):")
+            self._report_script_run(report)
+            self.telemetry.record_phase(report['workflow'], 'script', report['elapsed'],
+                                        self._script_status(report), report['returncode'])
+        
+        return reports
+    
+    def run_workflow_definition(self, workflow_name: str, interactive: bool = True) -> Dict:
+        """
+        Executa nativamente as etapas de uma definição em `workflow_definitions`.
+        
+        Etapas independentes (ver `depends_on`) rodam em paralelo, limitadas por
+        `automation_settings.step_engine.max_workers`.
+        
+        Args:
+            workflow_name: Nome da definição do fluxo
+            interactive: Se etapas interativas devem solicitar entrada do usuário
+        
+        Returns:
+            Relatório com o resultado, a saída e o tempo de cada etapa
+        """
+        definition = self.config.get('workflow_definitions', {}).get(workflow_name)
+        if definition is None:
+            return {'workflow': workflow_name, 'success': False, 'elapsed': 0.0,
+                    'error': f"Definição não encontrada: {workflow_name}", 'steps': []}
+        
+        engine_settings = self.config.get('automation_settings', {}).get('step_engine', {})
+        engine = StepEngine(
+            self.project_root,
+            max_workers=engine_settings.get('max_workers', DEFAULT_MAX_WORKERS),
+            prompt_handler=input if interactive else None,
+            timeout_seconds=self.notification_config.get('advanced', {}).get('timeout_seconds')
+        )
+        
+        print(f"⚙️ Executando etapas de {workflow_name}...")
+        report = engine.run(workflow_name, definition)
+        
+        if report['error']:
+            print(f"   ❌ Definição inválida: {report['error']}")
+        
+        for step in report['steps']:
+            if step['status'] == 'success':
+                print(f"   ✅ {step['action']} ({step['elapsed']:.2f}s)")
+            elif step['status'] == 'skipped':
+                print(f"   ⏭️ {step['action']} (pulada: dependência falhou)")
+            else:
+                print(f"   ❌ {step['action']} (código: {step['returncode']}, {step['elapsed']:.2f}s)")
+                if step['stderr'].strip():
+                    print(f"      {step['stderr'].strip().splitlines()[-1]}")
+        
+        level = "INFO" if report['success'] else "ERROR"
+        self._log_activity(f"Definição {workflow_name} concluída em {report['elapsed']:.2f}s (sucesso: {report['success']})", level)
+        return report
+    
+    def _run_actions(self, actions: List[str], context: ActionContext) -> Dict:
+        """
+        Executa pré ou pós-ações pelo registro de `workflow_actions`.
+        
+        Ações independentes rodam em paralelo, limitadas por
+        `automation_settings.step_engine.max_workers`.
+        
+        Args:
+            actions: Nomes das ações
+            context: Contexto da execução (estado do Git compartilhado)
+        
+        Returns:
+            Relatório de `ActionRunner.run`
+        """
+        engine_settings = self.config.get('automation_settings', {}).get('step_engine', {})
+        report = ActionRunner(engine_settings.get('max_workers', DEFAULT_MAX_WORKERS)).run(actions, context)
+        
+        icons = {'success': '✅', 'warning': '⚠️', 'failed': '❌', 'skipped': '⏭️'}
+        for result in report['actions']:
+            print(f"   {icons.get(result['status'], '⚡')} {result['action']}: {result['message']}")
+            if result['status'] in ('failed', 'skipped'):
+                self._log_activity(f"Ação {result['action']}: {result['message']}",
+                                   "ERROR" if result['status'] == 'failed' else "WARNING")
+        return report
     
     def suggest_workflows(self, user_input: str) -> List[Dict]:
         """
@@ -313,34 +943,179 @@ class AIWorkflowAssistant:
         Returns:
             Lista de fluxos sugeridos
         """
+        return self._suggest(self._state, user_input)
+    
+    def _suggest(self, state: Dict, user_input: str) -> List[Dict]:
+        """
+        Sugere fluxos usando um estado específico da configuração.
+        """
         suggestions = []
-        user_input_lower = user_input.lower()
+        keyword_index = state['keyword_index']
         
-        # Buscar sugestões em todas as categorias
-        for category_name, category in self.config.get('ai_workflow_mapping', {}).items():
-            for operation_name, operation in category.items():
-                keywords = operation.get('keywords', [])
-                description = operation.get('description', '')
-                
-                # Calcular relevância
-                relevance = 0
-                for keyword in keywords:
-                    if keyword.lower() in user_input_lower:
-                        relevance += 1
-                
-                if relevance > 0:
-                    suggestions.append({
-                        'category': category_name,
-                        'operation': operation_name,
-                        'description': description,
-                        'relevance': relevance,
-                        'config': operation
-                    })
+        # Pontuação BM25 (com o prior de uso) e seleção dos k melhores (já ordenados) pelo ranqueador
+        boosts = self._usage_priority(state).get('boosts')
+        for operation_index, score in state['suggestion_ranker'].rank(user_input, boosts=boosts):
+            category_name, operation_name, operation = keyword_index.operations[operation_index]
+            suggestions.append({
+                'category': category_name,
+                'operation': operation_name,
+                'description': operation.get('description', ''),
+                'relevance': round(score, 4),
+                'config': operation
+            })
+        
+        return suggestions
+    
+    def route_request(self, user_input: str) -> Dict:
+        """
+        Roteia uma solicitação sem interação nem execução.
+        
+        Args:
+            user_input: Solicitação do usuário
+        
+        Returns:
+            Dicionário serializável com intenção, fluxo e sugestões
+        """
+        state = self._state
+        routing = self._route(state, user_input)
+        return self._route_result(state, user_input, routing['intent'], routing['workflow'],
+                                  routing['suggestions'], routing['corrected'])
+    
+    def _create_routing_cache(self) -> RoutingCache:
+        """
+        Cria o cache de roteamento conforme `advanced.cache_duration_minutes`
+        (validade das entradas; 0 desativa) e `advanced.cache_max_entries`.
+        """
+        advanced = self.notification_config.get('advanced', {})
+        duration_minutes = advanced.get('cache_duration_minutes', 15)
+        max_entries = advanced.get('cache_max_entries', DEFAULT_CACHE_ENTRIES) if duration_minutes else 0
+        return RoutingCache(max_entries, ttl_seconds=duration_minutes * 60 if duration_minutes else None)
+    
+    def _route(self, state: Dict, user_input: str) -> Dict:
+        """
+        Reconhece a intenção, busca o fluxo e, sem fluxo, calcula as sugestões,
+        reaproveitando o cache quando a mesma entrada normalizada já foi roteada
+        com a versão atual da configuração.
+        
+        Returns:
+            Dicionário com `intent`, `workflow`, `suggestions` e `corrected`
+        """
+        # Entradas com a mesma forma normalizada têm sempre o mesmo roteamento
+        key = routing_key(state['normalize'](user_input), state['key_whitespace'])
+        priority = self._usage_priority(state)
+        # Resultados dependem também dos contadores de uso: a versão deles entra na validade do cache
+        version = (state['version'], priority.get('version'))
+        routing = self.routing_cache.get(key, version)
+        
+        if routing is None:
+            keyword_index = state['keyword_index']
+            intent, workflow, corrected = self._fuzzy_fallback(
+                state, key, state['intent_matcher'].match(key, priority.get('patterns')),
+                self._workflow_info(keyword_index, keyword_index.first_match(key, priority.get('operations'))))
+            routing = {
+                'intent': intent,
+                'workflow': workflow,
+                'suggestions': None if workflow else self._suggest(state, corrected or key),
+                'corrected': corrected
+            }
+            self.routing_cache.put(key, version, routing)
+        
+        # Mesmos registros do caminho sem cache (usados pelas estatísticas do log)
+        if routing['intent']:
+            self._log_activity(f"Intent reconhecido: {routing['intent'][0]} (confiança: {routing['intent'][1]:.2f})")
+        if routing['workflow']:
+            self._log_activity(f"Fluxo encontrado: {routing['workflow']['category']}.{routing['workflow']['operation']}")
+        return routing
+    
+    def _route_result(self, state: Dict, user_input: str, intent_result: Optional[Tuple[str, float]],
+                      workflow: Optional[Dict], suggestions: Optional[List[Dict]] = None,
+                      corrected: Optional[str] = None) -> Dict:
+        """
+        Monta o resultado de roteamento de uma entrada.
+        
+        Args:
+            state: Estado da configuração usado no roteamento
+            user_input: Solicitação do usuário
+            intent_result: Resultado de `recognize_intent`
+            workflow: Resultado de `find_workflow_by_keywords`
+            suggestions: Resultado de `suggest_workflows`, se já calculado
+            corrected: Entrada corrigida pela camada aproximada, se usada
+        
+        Returns:
+            Dicionário serializável com intenção, fluxo e sugestões
+        """
+        result = {
+            'input': user_input,
+            'intent': intent_result[0] if intent_result else None,
+            'confidence': intent_result[1] if intent_result else None,
+            'workflow': None,
+            'suggestions': [],
+            'corrected_input': corrected
+        }
+        
+        if workflow:
+            result['workflow'] = {
+                'category': workflow['category'],
+                'operation': workflow['operation'],
+                'description': workflow['config'].get('description', '')
+            }
+        else:
+            result['suggestions'] = [
+                {
+                    'category': suggestion['category'],
+                    'operation': suggestion['operation'],
+                    'description': suggestion['description'],
+                    'relevance': suggestion['relevance']
+                }
+                for suggestion in (suggestions if suggestions is not None else self._suggest(state, corrected or user_input))
+            ]
+        
+        return result
+    
+    def process_batch(self, inputs: Iterable[str], batch_size: int = 256,
+                      use_numpy: bool = False) -> Iterator[Dict]:
+        """
+        Roteia um fluxo de solicitações em lotes, sem interação nem execução.
+        
+        As entradas são consumidas sob demanda e os resultados produzidos à medida
+        que cada lote é processado, mantendo o uso de memória constante.
+        
+        Args:
+            inputs: Iterável de solicitações (pode ser um gerador)
+            batch_size: Quantidade de entradas pontuadas por vez
+            use_numpy: Usa a pontuação vetorizada com NumPy, quando disponível
+        
+        Yields:
+            Resultado de roteamento de cada entrada, na ordem de chegada
+        """
+        batch_size = max(1, batch_size)
+        total = 0
+        chunk: List[str] = []
         
-        # Ordenar por relevância
-        suggestions.sort(key=lambda x: x['relevance'], reverse=True)
+        def flush(chunk: List[str]) -> Iterator[Dict]:
+            # Cada lote usa um único estado, mesmo que a configuração seja recarregada
+            state = self._state
+            keyword_index = state['keyword_index']
+            priority = self._usage_priority(state)
+            intents = state['intent_matcher'].match_many(chunk, use_numpy=use_numpy, priority=priority.get('patterns'))
+            for user_input, intent_result in zip(chunk, intents):
+                intent_result, workflow, corrected = self._fuzzy_fallback(
+                    state, user_input, intent_result,
+                    self._workflow_info(keyword_index, keyword_index.first_match(user_input, priority.get('operations'))))
+                yield self._route_result(state, user_input, intent_result, workflow, corrected=corrected)
         
-        return suggestions[:5]  # Retornar top 5
+        for user_input in inputs:
+            chunk.append(user_input)
+            if len(chunk) >= batch_size:
+                yield from flush(chunk)
+                total += len(chunk)
+                chunk = []
+        
+        if chunk:
+            yield from flush(chunk)
+            total += len(chunk)
+        
+        self._log_activity(f"Lote processado: {total} solicitações")
     
     def process_user_request(self, user_input: str) -> bool:
         """
@@ -354,21 +1129,23 @@ class AIWorkflowAssistant:
         """
         print(f"\n🤖 Processando: '{user_input}'")
         
-        # Tentar reconhecimento de intenção
-        intent_result = self.recognize_intent(user_input)
+        # Reconhecimento de intenção e busca por palavras-chave (com cache)
+        routing = self._route(self._state, user_input)
+        
+        intent_result = routing['intent']
         if intent_result:
             action, confidence = intent_result
             print(f"✨ Intenção reconhecida: {action} (confiança: {confidence:.2f})")
             # Aqui você pode mapear a ação para um fluxo específico
         
-        # Buscar fluxo por palavras-chave
-        workflow = self.find_workflow_by_keywords(user_input)
+        workflow = routing['workflow']
         
         if workflow:
+            self.record_usage(workflow, intent_result)
             return self.execute_workflow(workflow)
         else:
             # Mostrar sugestões
-            suggestions = self.suggest_workflows(user_input)
+            suggestions = routing['suggestions']
             
             if suggestions:
                 print("\n💡 Fluxos sugeridos:")
@@ -383,11 +1160,13 @@ class AIWorkflowAssistant:
                     choice_idx = int(choice) - 1
                     if 0 <= choice_idx < len(suggestions):
                         selected = suggestions[choice_idx]
-                        return self.execute_workflow({
+                        workflow = {
                             'category': selected['category'],
                             'operation': selected['operation'],
                             'config': selected['config']
-                        })
+                        }
+                        self.record_usage(workflow, intent_result)
+                        return self.execute_workflow(workflow)
                     else:
                         print("❌ Escolha inválida")
                         return False
@@ -407,7 +1186,8 @@ class AIWorkflowAssistant:
         print("\n📋 Fluxos de Trabalho Disponíveis:")
         print("=" * 50)
         
-        for category_name, category in self.config.get('ai_workflow_mapping', {}).items():
+        state = self._state
+        for category_name, category in state['config'].get('ai_workflow_mapping', {}).items():
             print(f"\n📁 {category_name.replace('_', ' ').title()}:")
             
             for operation_name, operation in category.items():
@@ -415,8 +1195,217 @@ class AIWorkflowAssistant:
                 keywords = ', '.join(operation.get('keywords', []))
                 print(f"   • {description}")
                 print(f"     Palavras-chave: {keywords}")
+                plan = self._execution_plan({'category': category_name, 'operation': operation_name,
+                                             'config': operation}) if operation.get('script') else None
+                for error in plan.errors if plan else ():
+                    print(f"     ⚠️ {error}")
                 print()
 
+def _read_batch_inputs(stream) -> Iterator[Tuple[Optional[object], str]]:
+    """
+    Lê solicitações de um fluxo de texto, uma por linha.
+    
+    Cada linha pode ser texto puro, uma string JSON ou um objeto JSON com o
+    campo `input` (ou `text`) e um `id` opcional.
+    
+    Yields:
+        Tupla (id, texto) para cada linha não vazia
+    """
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        
+        if line[0] in '{"':
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = line
+            if isinstance(record, dict):
+                yield record.get('id'), str(record.get('input', record.get('text', '')))
+                continue
+            if isinstance(record, str):
+                yield None, record
+                continue
+        
+        yield None, line
+
+def _run_batch(assistant: AIWorkflowAssistant, source: str, output: Optional[str],
+               batch_size: int, use_numpy: bool):
+    """
+    Executa o modo em lote: lê solicitações e grava resultados em JSONL.
+    
+    Args:
+        assistant: Assistente já inicializado
+        source: Arquivo de entrada ou '-' para stdin
+        output: Arquivo de saída ou None para stdout
+        batch_size: Tamanho do lote de pontuação
+        use_numpy: Usa a pontuação vetorizada com NumPy
+    """
+    in_stream = sys.stdin if source == '-' else open(source, 'r', encoding='utf-8')
+    out_stream = sys.stdout if not output else open(output, 'w', encoding='utf-8')
+    
+    try:
+        records = _read_batch_inputs(in_stream)
+        pending_ids = deque()
+        
+        def texts():
+            for record_id, text in records:
+                pending_ids.append(record_id)
+                yield text
+        
+        for result in assistant.process_batch(texts(), batch_size=batch_size, use_numpy=use_numpy):
+            record_id = pending_ids.popleft()
+            if record_id is not None:
+                result = {'id': record_id, **result}
+            out_stream.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if in_stream is not sys.stdin:
+            in_stream.close()
+        if out_stream is not sys.stdout:
+            out_stream.close()
+        else:
+            out_stream.flush()
+
+def _print_metrics(telemetry: WorkflowTelemetry):
+    """
+    Exibe a latência por fluxo e fase (p50/p95 estimados pelos buckets do histograma).
+    """
+    rows = telemetry.rows()
+    if not rows:
+        print("📈 Nenhuma execução registrada ainda")
+        return
+    
+    def seconds(value: Optional[float]) -> str:
+        return "—" if value is None else (f">{telemetry.buckets[-1]:g}s" if value == float('inf') else f"≤{value:g}s")
+    
+    print("📈 MÉTRICAS DE EXECUÇÃO DOS FLUXOS:")
+    print("=" * 78)
+    print(f"{'fluxo':<20} {'fase':<13} {'execuções':>9} {'média':>9} {'p50':>9} {'p95':>9} {'falhas':>7}")
+    for row in rows:
+        print(f"{row['workflow']:<20} {row['phase']:<13} {row['count']:>9} {row['mean']:>8.3f}s "
+              f"{seconds(row['p50']):>9} {seconds(row['p95']):>9} {row['failures']:>7}")
+    
+    for workflow, exit_code in sorted(telemetry.last_exit_codes.items()):
+        if exit_code:
+            print(f"⚠️ {workflow}: último código de saída {exit_code}")
+
+
+def _create_scheduler(assistant: AIWorkflowAssistant) -> Tuple[JobScheduler, MonitorJobs]:
+    """
+    Cria o agendador com as tarefas de monitoramento do `notification-config.json`.
+    """
+    settings = assistant.notification_config.get('scheduler', {})
+    scheduler = JobScheduler(assistant.project_root / SCHEDULER_STATE_NAME,
+                             jitter_seconds=settings.get('jitter_seconds', 0))
+    jobs = MonitorJobs(assistant.project_root, assistant.notification_config)
+    jobs.register(scheduler)
+    return scheduler, jobs
+
+
+def _run_scheduler(assistant: AIWorkflowAssistant):
+    """
+    Executa as tarefas periódicas em primeiro plano até Ctrl+C ou SIGTERM.
+    """
+    import signal
+    
+    scheduler, jobs = _create_scheduler(assistant)
+    signal.signal(signal.SIGTERM, lambda signum, frame: scheduler.stop())
+    
+    print(f"⏰ Agendador ativo com {len(scheduler.jobs)} tarefa(s) (PID {os.getpid()})")
+    for name, job in scheduler.snapshot()['jobs'].items():
+        print(f"   • {name} ({job['schedule']}): próxima em {job['next_run']}")
+    assistant._log_activity(f"Agendador iniciado com {len(scheduler.jobs)} tarefa(s)")
+    
+    try:
+        asyncio.run(scheduler.run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        jobs.close()
+        assistant._log_activity("Agendador encerrado")
+        print("👋 Agendador encerrado")
+
+
+def _print_scheduler_status(state_file: Path):
+    """
+    Exibe as próximas execuções gravadas pelo agendador.
+    """
+    state = load_scheduler_state(state_file)
+    if not state.get('jobs'):
+        print("⏰ Agendador: nenhuma tarefa registrada (inicie com --scheduler ou --daemon)")
+        return
+    
+    icons = {'success': '✅', 'failed': '❌', None: '—'}
+    print(f"⏰ Agendador (estado de {state.get('updated')}, PID {state.get('pid')}):")
+    for name, job in state['jobs'].items():
+        last = f"{job['last_run']} {icons.get(job['last_status'], job['last_status'])}" if job['last_run'] else "nunca"
+        running = " (em execução)" if job.get('running') else ""
+        print(f"   • {name} ({job['schedule']}): próxima {job['next_run']}{running} | última {last} | "
+              f"execuções {job['runs']}, puladas {job['skipped']}, perdidas {job['missed']}")
+
+
+def _run_daemon(assistant: AIWorkflowAssistant, socket_path: Optional[str]):
+    """
+    Executa o assistente como daemon residente até receber `shutdown`, SIGTERM ou Ctrl+C.
+    
+    Args:
+        assistant: Assistente já carregado
+        socket_path: Caminho do socket (None para o padrão)
+    """
+    import signal
+    
+    daemon = AssistantDaemon(assistant, socket_path)
+    try:
+        daemon.start()
+    except (RuntimeError, OSError) as e:
+        print(f"❌ Não foi possível iniciar o daemon: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    def handle_sigterm(signum, frame):
+        threading.Thread(target=daemon.shutdown, daemon=True).start()
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    
+    assistant.start_config_watch()
+    assistant._log_activity(f"Daemon iniciado em {daemon.socket_path}")
+    print(f"🛰️ Daemon do assistente ativo em {daemon.socket_path} (PID {os.getpid()})")
+    
+    # Tarefas periódicas no mesmo processo residente
+    scheduler = jobs = None
+    if assistant.notification_config.get('scheduler', {}).get('enabled', True):
+        scheduler, jobs = _create_scheduler(assistant)
+        scheduler.start()
+        print(f"⏰ Agendador ativo com {len(scheduler.jobs)} tarefa(s)")
+    
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if scheduler is not None:
+            scheduler.stop()
+            jobs.close()
+        assistant.stop_config_watch()
+        assistant._log_activity("Daemon encerrado")
+        print("👋 Daemon encerrado")
+
+
+def _run_analytics(assistant: AIWorkflowAssistant, args):
+    """
+    Analisa os logs informados (ou os do projeto) e imprime/grava o relatório.
+    """
+    paths = [Path(path) for path in args.analytics] or default_log_paths(assistant.project_root)
+    log_filter = LogFilter(args.since, args.until, args.level, args.workflow)
+    report = analyze_logs(paths, log_filter, workers=args.jobs or os.cpu_count() or 1)
+    
+    text = json.dumps(report, indent=2, ensure_ascii=False) if args.json else format_report(report)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding='utf-8')
+        print(f"💾 Relatório gravado em {args.output}")
+    else:
+        print(text)
+
+
 def main():
     import sys
     import argparse
@@ -424,14 +1413,62 @@ def main():
     parser = argparse.ArgumentParser(description='ELIS-V1 AI Workflow Assistant')
     parser.add_argument('--recognize', type=str, help='Recognize intent from natural language command')
     parser.add_argument('--execute', type=str, help='Execute specific workflow by name')
+    parser.add_argument('--execute-parallel', nargs='+', metavar='NAME', help='Execute several workflows concurrently')
     parser.add_argument('--list', action='store_true', help='List all available workflows')
+    parser.add_argument('--run-flow', type=str, metavar='NAME', help='Run the steps of a workflow_definitions entry natively')
     parser.add_argument('--test', action='store_true', help='Run test suite')
     parser.add_argument('--status', action='store_true', help='Show system status')
+    parser.add_argument('--timing', action='store_true', help='Report configuration load time')
+    parser.add_argument('--no-snapshot', action='store_true', help='Ignore the compiled configuration snapshot')
+    parser.add_argument('--batch', nargs='?', const='-', metavar='FILE',
+                        help='Route commands from a text/JSONL file (or stdin) and write JSONL results')
+    parser.add_argument('--output', type=str, metavar='FILE', help='Output file for --batch/--analytics (default: stdout)')
+    parser.add_argument('--batch-size', type=int, default=256, help='Commands scored per batch in --batch mode')
+    parser.add_argument('--numpy', action='store_true', help='Use NumPy-vectorized scoring in --batch mode')
+    parser.add_argument('--daemon', action='store_true', help='Serve requests over a local Unix socket (see ai_workflow_client.py)')
+    parser.add_argument('--socket', type=str, metavar='PATH', help='Socket path for --daemon')
+    parser.add_argument('--scheduler', action='store_true',
+                        help='Run the periodic monitoring, reminder and report jobs in the foreground')
+    parser.add_argument('--analytics', nargs='*', metavar='LOG',
+                        help='Aggregate success rates, failures and busy hours from the logs (default: project logs)')
+    parser.add_argument('--since', type=str, metavar='DATE', help='Analytics start (YYYY-MM-DD[ HH:MM])')
+    parser.add_argument('--until', type=str, metavar='DATE', help='Analytics end, inclusive (YYYY-MM-DD[ HH:MM])')
+    parser.add_argument('--level', action='append', metavar='LEVEL', help='Only count entries with this level (repeatable)')
+    parser.add_argument('--workflow', type=str, metavar='NAME', help='Only count entries of this workflow operation')
+    parser.add_argument('--json', action='store_true', help='Print --analytics results as JSON')
+    parser.add_argument('--jobs', type=int, metavar='N', help='Processes used to scan large logs (default: CPU count)')
+    parser.add_argument('--metrics', action='store_true', help='Show per-workflow phase latency metrics')
+    parser.add_argument('--export-metrics', type=str, metavar='FILE', help='Write metrics in Prometheus text format')
+    parser.add_argument('--profile', nargs='?', const='profiles', metavar='DIR',
+                        help='Profile this run with cProfile/tracemalloc and write the dumps to DIR')
     
     args = parser.parse_args()
-    assistant = AIWorkflowAssistant()
     
-    if args.recognize:
+    if args.profile:
+        label = next((name for name in ('execute', 'run_flow', 'recognize', 'batch', 'execute_parallel', 'test', 'status')
+                      if getattr(args, name)), 'session')
+        ProfileSession(args.profile, label).start()
+    
+    assistant = AIWorkflowAssistant(verbose=not (args.batch or args.daemon or args.scheduler or args.analytics is not None),
+                                    use_snapshot=not args.no_snapshot)
+    
+    if args.timing:
+        print(f"⏱️ Configuração carregada em {assistant.load_stats['seconds'] * 1000:.2f} ms "
+              f"(origem: {assistant.load_stats['source']})", file=sys.stderr)
+    
+    if args.daemon:
+        _run_daemon(assistant, args.socket)
+    
+    elif args.scheduler:
+        _run_scheduler(assistant)
+    
+    elif args.batch:
+        _run_batch(assistant, args.batch, args.output, args.batch_size, args.numpy)
+    
+    elif args.analytics is not None:
+        _run_analytics(assistant, args)
+    
+    elif args.recognize:
         print(f"🤖 Analisando comando: '{args.recognize}'")
         intent = assistant.recognize_intent(args.recognize)
         print(f"🎯 Intent detectado: {intent}")
@@ -468,9 +1505,35 @@ def main():
         else:
             print("❌ Workflow não encontrado")
     
+    elif args.run_flow:
+        report = assistant.run_workflow_definition(args.run_flow)
+        print(f"⏱️ Tempo total: {report['elapsed']:.2f}s")
+        if not report['success']:
+            sys.exit(1)
+    
+    elif args.execute_parallel:
+        workflows = []
+        for name in args.execute_parallel:
+            workflow = assistant.find_workflow_by_keywords(name)
+            if workflow:
+                workflows.append(workflow)
+            else:
+                print(f"❌ Workflow não encontrado: {name}")
+        
+        reports = assistant.execute_workflows_concurrently(workflows)
+        if not all(report['success'] for report in reports):
+            sys.exit(1)
+    
     elif args.list:
         assistant.list_available_workflows()
     
+    elif args.metrics or args.export_metrics:
+        if args.metrics:
+            _print_metrics(assistant.telemetry)
+        if args.export_metrics:
+            assistant.telemetry.export_prometheus(Path(args.export_metrics))
+            print(f"💾 Métricas exportadas em {args.export_metrics}")
+    
     elif args.status:
         print("📊 STATUS DO SISTEMA DE AUTOMAÇÃO:")
         print("=" * 50)
@@ -479,19 +1542,56 @@ def main():
         if assistant.config:
             print("✅ Configuração carregada com sucesso")
             print(f"📋 Workflows disponíveis: {len(assistant.config.get('ai_workflow_mapping', {}))}")
-            print(f"🎯 Padrões de reconhecimento: {len(assistant.config.get('ai_recognition_patterns', {}))}")
+            print(f"🎯 Padrões de reconhecimento: {len(assistant.config.get('ai_recognition_patterns', {}).get('intent_detection', {}))}")
         else:
             print("❌ Erro ao carregar configuração")
         
-        # Verificar logs
-        import os
-        if os.path.exists(assistant.log_file):
-            with open(assistant.log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            print(f"📝 Entradas no log: {len(lines)}")
+        # Verificar logs (índice incremental: só lê o que foi acrescentado)
+        if assistant.log_file.exists():
+            stats = LogStatsIndex(assistant.log_file).update()
+            rotated = stats['rotated']['entries'] + stats['rotated']['unparsed']
+            print(f"📝 Entradas no log: {stats['entries'] + stats['unparsed']}"
+                  + (f" (incluindo {rotated} de {stats['rotations']} rotação(ões))" if stats['rotations'] else ""))
+            
+            levels = stats['levels']
+            print(f"   INFO: {levels.get('INFO', 0)} | WARNING: {levels.get('WARNING', 0)} | ERROR: {levels.get('ERROR', 0)}")
+            
+            if stats['workflows']:
+                print("   Por workflow:")
+                for workflow_name, count in sorted(stats['workflows'].items(), key=lambda x: x[1], reverse=True):
+                    print(f"     • {workflow_name}: {count}")
+            
+            if stats['days']:
+                print("   Por dia (últimos 7):")
+                for day in sorted(stats['days'])[-7:]:
+                    print(f"     • {day}: {stats['days'][day]}")
         else:
             print("📝 Nenhum log encontrado")
         
+        # Cache de roteamento: os contadores relevantes são os do daemon residente, se ativo
+        try:
+            cache_stats = send_request('ping', socket_path=args.socket, timeout=1.0)['result']['cache']
+            cache_origin = "daemon"
+        except (ConnectionError, KeyError, TypeError, ValueError):
+            cache_stats = assistant.routing_cache.stats()
+            cache_origin = "este processo"
+        
+        if cache_stats['max_entries']:
+            ttl = f"{cache_stats['ttl_seconds'] / 60:g} min" if cache_stats['ttl_seconds'] else "sem expiração"
+            print(f"⚡ Cache de roteamento ({cache_origin}): {cache_stats['entries']}/{cache_stats['max_entries']} entradas, {ttl}")
+            print(f"   Acertos: {cache_stats['hits']} | Falhas: {cache_stats['misses']} | "
+                  f"Taxa: {cache_stats['hit_rate']:.0%} | Descartes: {cache_stats['evictions']} | "
+                  f"Expiradas: {cache_stats['expirations']} | Invalidadas: {cache_stats['invalidations']}")
+        else:
+            print("⚡ Cache de roteamento desativado (advanced.cache_duration_minutes = 0)")
+        
+        usage = assistant.usage
+        if usage is not None and len(usage):
+            top = ", ".join(f"{name} ({count:.1f})" for name, count in usage.top("workflow:", 5))
+            print(f"📈 Fluxos mais usados: {top or 'nenhum'}")
+        
+        _print_scheduler_status(assistant.project_root / SCHEDULER_STATE_NAME)
+        
         print("\n🤖 Sistema operacional!")
     
     elif args.test:
@@ -531,6 +1631,11 @@ def main():
         print("\n💬 Digite comandos ou 'help' para ver fluxos disponíveis")
         print("Digite 'quit' para sair\n")
         
+        # Recarregar a configuração automaticamente quando o arquivo mudar
+        assistant.start_config_watch(on_reload=lambda summary: print(
+            f"\n🔄 Configuração recarregada (versão {summary['version']}): "
+            f"{len(summary['intents'])} intenção(ões), {len(summary['categories'])} categoria(s) reindexadas"))
+        
         while True:
             try:
                 user_input = input("🔤 Comando: ").strip()
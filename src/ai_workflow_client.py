@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Cliente leve do assistente residente
+Envia solicitações ao daemon do assistente por um socket Unix local, evitando
+iniciar o interpretador completo (e recarregar a configuração) a cada comando.
+
+Protocolo: uma linha JSON por solicitação e uma linha JSON por resposta.
+    → {"op": "route", "input": "fazer commit", "id": 1}
+    ← {"id": 1, "ok": true, "result": {...}}
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+# Operações aceitas pelo daemon
+OPERATIONS = ('ping', 'recognize', 'suggest', 'route', 'execute', 'reload', 'shutdown')
+# Variável de ambiente que sobrescreve o caminho do socket
+SOCKET_ENV_VAR = 'ELIS_ASSISTANT_SOCKET'
+SOCKET_FILE_NAME = '.ai-workflow.sock'
+DEFAULT_TIMEOUT = 5.0
+# Limite de uma linha do protocolo (solicitação ou resposta)
+MAX_MESSAGE_BYTES = 1024 * 1024
+
+
+def default_socket_path(project_root: Optional[Path] = None) -> Path:
+    """
+    Caminho do socket do daemon: `$ELIS_ASSISTANT_SOCKET` ou `<projeto>/.ai-workflow.sock`.
+    """
+    if os.environ.get(SOCKET_ENV_VAR):
+        return Path(os.environ[SOCKET_ENV_VAR])
+    root = Path(project_root) if project_root else Path(__file__).parent.parent
+    return root / SOCKET_FILE_NAME
+
+
+def encode_message(message: Dict) -> bytes:
+    """
+    Serializa uma mensagem do protocolo (JSON compacto terminado em nova linha).
+    """
+    return json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+class AssistantClient:
+    """
+    Conexão persistente com o daemon; várias solicitações reaproveitam o mesmo socket.
+    """
+
+    def __init__(self, socket_path: Optional[Path] = None, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Args:
+            socket_path: Caminho do socket (padrão: `default_socket_path()`)
+            timeout: Tempo limite de conexão e de cada resposta, em segundos
+
+        Raises:
+            ConnectionError: Daemon indisponível
+        """
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path()
+        self._next_id = 0
+
+        if not hasattr(socket, 'AF_UNIX'):
+            raise ConnectionError("Sockets Unix não são suportados nesta plataforma")
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(str(self.socket_path))
+        except OSError as e:
+            self._socket.close()
+            raise ConnectionError(f"Daemon indisponível em {self.socket_path}: {e}") from e
+        self._reader = self._socket.makefile('rb')
+
+    def request(self, op: str, user_input: Optional[str] = None, timeout: Optional[float] = None) -> Dict:
+        """
+        Envia uma solicitação e aguarda a resposta.
+
+        Args:
+            op: Operação (uma de `OPERATIONS`)
+            user_input: Texto da solicitação, quando a operação exigir
+            timeout: Tempo limite desta resposta (padrão: o da conexão)
+
+        Returns:
+            Resposta do daemon, com `ok` e `result` ou `error`
+
+        Raises:
+            ConnectionError: Conexão encerrada ou tempo esgotado
+        """
+        self._next_id += 1
+        message = {'op': op, 'id': self._next_id}
+        if user_input is not None:
+            message['input'] = user_input
+
+        if timeout is not None:
+            self._socket.settimeout(timeout)
+        try:
+            self._socket.sendall(encode_message(message))
+            line = self._reader.readline(MAX_MESSAGE_BYTES)
+        except OSError as e:
+            raise ConnectionError(f"Falha na comunicação com o daemon: {e}") from e
+
+        if not line:
+            raise ConnectionError("Conexão encerrada pelo daemon")
+        return json.loads(line.decode('utf-8'))
+
+    def close(self):
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def send_request(op: str, user_input: Optional[str] = None, socket_path: Optional[Path] = None,
+                 timeout: float = DEFAULT_TIMEOUT) -> Dict:
+    """
+    Envia uma única solicitação ao daemon.
+
+    Raises:
+        ConnectionError: Daemon indisponível
+    """
+    with AssistantClient(socket_path, timeout) as client:
+        return client.request(op, user_input)
+
+
+def _run_in_process(op: str, user_input: Optional[str]) -> Dict:
+    """
+    Atende a solicitação sem daemon, carregando o assistente neste processo.
+    """
+    sys.path.insert(0, str(Path(__file__).parent))
+    from ai_workflow_assistant import AIWorkflowAssistant
+    from assistant_daemon import handle_request
+
+    return handle_request(AIWorkflowAssistant(verbose=False), {'op': op, 'input': user_input})
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='ELIS-V1 AI Workflow Assistant - thin daemon client')
+    parser.add_argument('op', choices=OPERATIONS, help='Operation to request')
+    parser.add_argument('input', nargs='?', help='Natural language command')
+    parser.add_argument('--socket', type=str, help='Daemon socket path')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='Response timeout in seconds')
+    parser.add_argument('--fallback', action='store_true',
+                        help='Load the assistant in-process when the daemon is not running')
+
+    args = parser.parse_args()
+    # Execuções podem demorar bem mais que o roteamento
+    timeout = None if args.op == 'execute' else args.timeout
+
+    try:
+        response = send_request(args.op, args.input, args.socket, timeout)
+    except ConnectionError as e:
+        if not args.fallback or args.op in ('ping', 'reload', 'shutdown'):
+            print(f"❌ {e}", file=sys.stderr)
+            sys.exit(2)
+        response = _run_in_process(args.op, args.input)
+
+    print(json.dumps(response, ensure_ascii=False))
+    if not response.get('ok'):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Daemon residente do assistente
+Mantém um `AIWorkflowAssistant` carregado e atende solicitações de
+reconhecimento, sugestão, roteamento e execução por um socket Unix local.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from ai_workflow_client import MAX_MESSAGE_BYTES, OPERATIONS, default_socket_path, encode_message
+
+def handle_request(assistant, request: Dict) -> Dict:
+    """
+    Atende uma solicitação do protocolo.
+
+    Args:
+        assistant: Instância de `AIWorkflowAssistant`
+        request: Solicitação com `op` e, conforme a operação, `input`
+
+    Returns:
+        Resposta com `ok` e `result`, ou `ok: false` e `error`
+    """
+    response = {'id': request.get('id'), 'ok': False}
+    op = request.get('op')
+    user_input = request.get('input')
+
+    if op not in OPERATIONS:
+        response['error'] = f"Operação desconhecida: {op}"
+        return response
+    if op in ('recognize', 'suggest', 'route', 'execute') and not isinstance(user_input, str):
+        response['error'] = f"Operação '{op}' exige o campo 'input'"
+        return response
+
+    try:
+        if op == 'ping':
+            result = {'pid': os.getpid(), 'config_version': assistant.config_version,
+                      'cache': assistant.routing_cache.stats()}
+        elif op == 'recognize':
+            intent = assistant.recognize_intent(user_input)
+            result = {'intent': intent[0], 'confidence': intent[1]} if intent else None
+        elif op == 'suggest':
+            result = [
+                {key: suggestion[key] for key in ('category', 'operation', 'description', 'relevance')}
+                for suggestion in assistant.suggest_workflows(user_input)
+            ]
+        elif op == 'route':
+            result = assistant.route_request(user_input)
+        elif op == 'execute':
+            workflow = assistant.find_workflow_by_keywords(user_input)
+            if workflow is None:
+                response['error'] = "Workflow não encontrado"
+                return response
+            assistant.record_usage(workflow)
+            # Fila por recursos: leituras em paralelo, quem altera o repositório espera a vez
+            success = assistant.submit_workflow(workflow).result()
+            result = {'category': workflow['category'], 'operation': workflow['operation'], 'success': success}
+        elif op == 'reload':
+            result = assistant.reload_config()
+        else:
+            result = None
+    except Exception as e:
+        response['error'] = str(e)
+        return response
+
+    response['ok'] = True
+    response['result'] = result
+    return response
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Atende uma conexão: uma solicitação JSON por linha até o cliente desconectar.
+    """
+
+    def handle(self):
+        daemon = self.server.daemon
+        while True:
+            line = self.rfile.readline(MAX_MESSAGE_BYTES)
+            if not line:
+                break
+            if not line.endswith(b'\n'):
+                self.wfile.write(encode_message({'id': None, 'ok': False, 'error': "Mensagem muito grande"}))
+                break
+
+            try:
+                request = json.loads(line.decode('utf-8'))
+                if not isinstance(request, dict):
+                    raise ValueError("a solicitação deve ser um objeto JSON")
+            except (UnicodeDecodeError, ValueError) as e:
+                self.wfile.write(encode_message({'id': None, 'ok': False, 'error': f"Solicitação inválida: {e}"}))
+                continue
+
+            self.wfile.write(encode_message(handle_request(daemon.assistant, request)))
+
+            if request.get('op') == 'shutdown':
+                # shutdown() bloqueia até o laço principal parar: chamar fora desta thread
+                threading.Thread(target=daemon.shutdown, daemon=True).start()
+                break
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class AssistantDaemon:
+    """
+    Servidor do assistente residente em um socket Unix.
+    """
+
+    def __init__(self, assistant, socket_path: Optional[Path] = None):
+        """
+        Args:
+            assistant: Instância de `AIWorkflowAssistant` já carregada
+            socket_path: Caminho do socket (padrão: `default_socket_path()`)
+        """
+        self.assistant = assistant
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path(assistant.project_root)
+        self._server: Optional[_UnixServer] = None
+
+    def _remove_stale_socket(self):
+        """
+        Remove um socket deixado por um daemon encerrado; recusa se outro estiver ativo.
+
+        Raises:
+            RuntimeError: Já existe um daemon atendendo neste socket
+        """
+        if not self.socket_path.exists():
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except OSError:
+            self.socket_path.unlink()
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"Já existe um daemon ativo em {self.socket_path}")
+
+    def start(self):
+        """
+        Abre o socket (acessível apenas ao usuário atual).
+
+        Raises:
+            RuntimeError: Plataforma sem sockets Unix ou daemon já ativo
+        """
+        if not hasattr(socket, 'AF_UNIX'):
+            raise RuntimeError("Sockets Unix não são suportados nesta plataforma")
+
+        self._remove_stale_socket()
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+        self._server.daemon = self
+
+    def serve_forever(self):
+        """
+        Atende solicitações até `shutdown()`; remove o socket ao terminar.
+        """
+        if self._server is None:
+            self.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+    def shutdown(self):
+        """
+        Interrompe o laço de atendimento.
+        """
+        if self._server is not None:
+            self._server.shutdown()
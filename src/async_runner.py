@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Executor assíncrono de fluxos de trabalho
+Executa scripts de fluxos com asyncio (argv direto, sem shell, quando o
+comando vem de um plano de execução), aplicando tempo limite por fluxo,
+novas tentativas com backoff e encerramento do grupo de processos travado.
+A saída pode ser capturada em streaming (ver `output_capture`).
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from output_capture import DEFAULT_LOG_CHUNK_BYTES, StreamCapture, default_echo, pump
+
+# Tempo de espera entre o SIGTERM e o SIGKILL ao encerrar um grupo travado
+KILL_GRACE_SECONDS = 2.0
+
+# Linha de comando (executada pelo shell) ou argv (executado diretamente)
+Command = Union[str, Sequence[str]]
+
+
+def process_group_options() -> Dict:
+    """
+    Opções de criação de processo que o colocam em um novo grupo (ver `signal_process_group`).
+    """
+    if sys.platform == 'win32':
+        return {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {'start_new_session': True}
+
+
+def signal_process_group(pid: int, force: bool = False):
+    """
+    Encerra o grupo de processos iniciado com `process_group_options`.
+
+    Args:
+        pid: PID do processo líder do grupo
+        force: SIGKILL em vez de SIGTERM (no Windows o `taskkill /F /T` é sempre forçado)
+    """
+    if sys.platform == 'win32':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)], capture_output=True)
+        return
+    try:
+        os.killpg(pid, signal.SIGKILL if force else signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+
+class WorkflowRunner:
+    """
+    Executor assíncrono de comandos de fluxos.
+
+    Cada execução devolve um relatório com código de retorno, tentativas,
+    indicação de tempo esgotado e duração total; com captura ativada, também
+    os últimos bytes de stdout/stderr (`stdout_tail`, `stderr_tail`) e o total
+    de bytes de cada um (`output_bytes`), referentes à última tentativa.
+    """
+
+    def __init__(self, project_root: Path, timeout_seconds: Optional[float] = None,
+                 max_retries: int = 0, backoff_seconds: float = 1.0, capture_bytes: int = 0,
+                 output_sink: Optional[Callable[[str, str, str], None]] = None,
+                 log_chunk_bytes: int = DEFAULT_LOG_CHUNK_BYTES, echo: bool = True):
+        """
+        Args:
+            project_root: Diretório onde os comandos são executados
+            timeout_seconds: Tempo limite padrão por tentativa (None ou 0 desativa)
+            max_retries: Novas tentativas após uma falha
+            backoff_seconds: Espera antes da primeira nova tentativa (dobra a cada tentativa)
+            capture_bytes: Bytes finais guardados de stdout e de stderr (0: saída direto no terminal)
+            output_sink: Função (fluxo, stream, texto) que recebe a saída capturada em blocos
+            log_chunk_bytes: Tamanho mínimo de cada bloco entregue ao `output_sink`
+            echo: Se a saída capturada também é exibida no console em tempo real
+        """
+        self.project_root = Path(project_root)
+        self.timeout_seconds = timeout_seconds or None
+        self.max_retries = max(0, max_retries)
+        self.backoff_seconds = backoff_seconds
+        self.capture_bytes = max(0, capture_bytes)
+        self.output_sink = output_sink
+        self.log_chunk_bytes = log_chunk_bytes
+        self.echo = echo
+
+    async def _spawn(self, command: Command, capture: bool = False) -> asyncio.subprocess.Process:
+        """
+        Inicia o comando em um novo grupo de processos.
+
+        Um argv é executado diretamente (sem shell); uma string passa pelo shell.
+        """
+        pipes = {}
+        if capture:
+            pipes = {'stdout': asyncio.subprocess.PIPE, 'stderr': asyncio.subprocess.PIPE,
+                     # Sem terminal, o Python passaria a bufferizar a saída do script
+                     'env': dict(os.environ, PYTHONUNBUFFERED='1')}
+        pipes.update(process_group_options())
+        if isinstance(command, str):
+            return await asyncio.create_subprocess_shell(command, cwd=self.project_root, **pipes)
+        return await asyncio.create_subprocess_exec(*command, cwd=self.project_root, **pipes)
+
+    def _create_captures(self, name: str) -> Dict[str, StreamCapture]:
+        """
+        Capturas de stdout e stderr de uma tentativa (vazio se a captura estiver desativada).
+        """
+        if not self.capture_bytes:
+            return {}
+
+        sink = None
+        if self.output_sink is not None:
+            sink = lambda stream, text: self.output_sink(name, stream, text)
+        return {
+            stream: StreamCapture(stream, self.capture_bytes, default_echo(stream) if self.echo else None,
+                                  sink, self.log_chunk_bytes)
+            for stream in ('stdout', 'stderr')
+        }
+
+    @staticmethod
+    async def _drain(pumps: List[asyncio.Future], captures: Dict[str, StreamCapture]):
+        """
+        Aguarda o fim da leitura dos pipes.
+
+        Um processo neto em segundo plano pode manter o pipe aberto depois do
+        fim do script: a leitura é abandonada após `KILL_GRACE_SECONDS`.
+        """
+        if pumps:
+            _, pending = await asyncio.wait(pumps, timeout=KILL_GRACE_SECONDS)
+            for task in pending:
+                task.cancel()
+        for capture in captures.values():
+            capture.close()
+
+    async def _kill_group(self, process: asyncio.subprocess.Process):
+        """
+        Encerra o processo e todos os seus filhos.
+        """
+        if process.returncode is not None:
+            return
+
+        signal_process_group(process.pid)
+        if sys.platform != 'win32':
+            try:
+                await asyncio.wait_for(process.wait(), KILL_GRACE_SECONDS)
+                return
+            except asyncio.TimeoutError:
+                signal_process_group(process.pid, force=True)
+
+        await process.wait()
+
+    async def _attempt(self, command: Command, timeout: Optional[float],
+                       captures: Dict[str, StreamCapture]) -> Tuple[Optional[int], bool]:
+        """
+        Executa uma tentativa.
+
+        Args:
+            command: Linha de comando ou argv
+            timeout: Tempo limite da tentativa
+            captures: Capturas de stdout/stderr (vazio: saída direto no terminal)
+
+        Returns:
+            Tupla (código de retorno, tempo esgotado)
+        """
+        process = await self._spawn(command, capture=bool(captures))
+        pumps = []
+        if captures:
+            pumps = [asyncio.ensure_future(pump(process.stdout, captures['stdout'])),
+                     asyncio.ensure_future(pump(process.stderr, captures['stderr']))]
+        try:
+            returncode = await asyncio.wait_for(process.wait(), timeout)
+            return returncode, False
+        except asyncio.TimeoutError:
+            await self._kill_group(process)
+            return None, True
+        except asyncio.CancelledError:
+            await self._kill_group(process)
+            raise
+        finally:
+            await self._drain(pumps, captures)
+
+    async def run(self, name: str, command: Command, timeout: Optional[float] = None,
+                  max_retries: Optional[int] = None) -> Dict:
+        """
+        Executa um comando com tempo limite e novas tentativas.
+
+        Args:
+            name: Nome do fluxo (usado no relatório)
+            command: Linha de comando (via shell) ou argv (execução direta, sem shell)
+            timeout: Tempo limite por tentativa (padrão do executor se None; 0 desativa)
+            max_retries: Novas tentativas (padrão do executor se None)
+
+        Returns:
+            Relatório da execução
+        """
+        timeout = self.timeout_seconds if timeout is None else (timeout or None)
+        retries = self.max_retries if max_retries is None else max(0, max_retries)
+
+        started = time.monotonic()
+        report = {
+            'workflow': name,
+            'command': command if isinstance(command, str) else list(command),
+            'success': False,
+            'returncode': None,
+            'timed_out': False,
+            'attempts': 0,
+            'elapsed': 0.0,
+            'error': None,
+            'stdout_tail': None,
+            'stderr_tail': None,
+            'output_bytes': None
+        }
+
+        for attempt in range(retries + 1):
+            if attempt:
+                await asyncio.sleep(self.backoff_seconds * (2 ** (attempt - 1)))
+
+            report['attempts'] = attempt + 1
+            captures = self._create_captures(name)
+            try:
+                returncode, timed_out = await self._attempt(command, timeout, captures)
+            except OSError as e:
+                report['error'] = str(e)
+                continue
+
+            if captures:
+                report['stdout_tail'] = captures['stdout'].tail()
+                report['stderr_tail'] = captures['stderr'].tail()
+                report['output_bytes'] = {stream: capture.total_bytes for stream, capture in captures.items()}
+
+            report['returncode'] = returncode
+            report['timed_out'] = timed_out
+            if returncode == 0:
+                report['success'] = True
+                break
+
+        report['elapsed'] = time.monotonic() - started
+        return report
+
+    async def run_many(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Executa vários comandos independentes em paralelo.
+
+        Args:
+            jobs: Lista de dicionários com `name`, `command` e, opcionalmente, `timeout` e `max_retries`
+
+        Returns:
+            Relatórios na mesma ordem dos jobs
+        """
+        return await asyncio.gather(*(
+            self.run(job['name'], job['command'], job.get('timeout'), job.get('max_retries'))
+            for job in jobs
+        ))
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Snapshot compilado da configuração
+Guarda ao lado de `workflow-config.json` a configuração já interpretada e as
+estruturas de busca derivadas dela, identificadas pelo mtime/tamanho e pelo
+hash do conteúdo, para que a inicialização seja uma única leitura rápida.
+O snapshot também guarda a impressão digital do código dos índices: editar
+um desses módulos invalida o cache sem precisar incrementar a versão.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+# Incrementar quando o formato do próprio snapshot mudar; mudanças nas classes
+# dos índices são detectadas por `code_fingerprint`
+SNAPSHOT_VERSION = 7
+# Módulos cujas instâncias são gravadas (pickle) dentro do snapshot
+INDEX_MODULES = ('intent_matcher', 'keyword_automaton', 'fuzzy_matcher', 'suggestion_ranker', 'text_normalization')
+# Arquivos modificados até este intervalo antes da gravação do snapshot podem ter
+# sido alterados de novo no mesmo "tick" de mtime: nesses casos confere-se o hash
+RACY_WINDOW_NS = 2_000_000_000
+
+
+@functools.lru_cache(maxsize=None)
+def code_fingerprint() -> str:
+    """
+    Hash do código-fonte dos módulos dos índices (`INDEX_MODULES`).
+
+    Returns:
+        Hash SHA-256 em hexadecimal; módulos não encontrados entram apenas pelo nome
+    """
+    digest = hashlib.sha256()
+    for name in INDEX_MODULES:
+        digest.update(name.encode('utf-8') + b'\0')
+        try:
+            digest.update(Path(importlib.util.find_spec(name).origin).read_bytes())
+        except (AttributeError, TypeError, ValueError, ImportError, OSError):
+            continue
+    return digest.hexdigest()
+
+
+class ConfigSnapshot:
+    """
+    Cache persistente da configuração interpretada e dos índices compilados.
+    """
+
+    def __init__(self, config_file: Path, snapshot_file: Optional[Path] = None):
+        """
+        Args:
+            config_file: Arquivo JSON de configuração
+            snapshot_file: Arquivo do snapshot (padrão: `<config>.snapshot`)
+        """
+        self.config_file = Path(config_file)
+        self.snapshot_file = Path(snapshot_file) if snapshot_file else Path(f"{self.config_file}.snapshot")
+
+    def _read_snapshot(self) -> Optional[Dict]:
+        try:
+            with open(self.snapshot_file, 'rb') as f:
+                snapshot = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError):
+            return None
+        if (not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION
+                or snapshot.get('code') != code_fingerprint()):
+            return None
+        return snapshot
+
+    def _write_snapshot(self, snapshot: Dict):
+        """
+        Grava o snapshot de forma atômica (arquivo temporário + rename).
+        """
+        temp_file = Path(f"{self.snapshot_file}.tmp")
+        snapshot['written_ns'] = time.time_ns()
+        try:
+            with open(temp_file, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.snapshot_file)
+        except (OSError, pickle.PicklingError) as e:
+            print(f"⚠️ Erro ao gravar snapshot da configuração: {e}")
+
+    def load(self, compile_indexes: Callable[[Dict], Dict]) -> Optional[Tuple[Dict, Dict, str]]:
+        """
+        Carrega a configuração e os índices, reconstruindo o snapshot se o JSON mudou.
+
+        Args:
+            compile_indexes: Função que compila os índices a partir da configuração
+
+        Returns:
+            Tupla (configuração, índices, origem) com origem `snapshot`, `snapshot-hash`
+            ou `json`; None se o arquivo não existir ou não for JSON válido
+        """
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            return None
+
+        snapshot = self._read_snapshot()
+
+        # Caminho rápido: mesmo mtime e tamanho, sem ler o JSON
+        if (snapshot and snapshot['mtime_ns'] == stat.st_mtime_ns and snapshot['size'] == stat.st_size
+                and snapshot['written_ns'] - stat.st_mtime_ns > RACY_WINDOW_NS):
+            return snapshot['config'], snapshot['indexes'], 'snapshot'
+
+        try:
+            with open(self.config_file, 'rb') as f:
+                raw = f.read()
+        except OSError:
+            return None
+        digest = hashlib.sha256(raw).hexdigest()
+
+        # Mesmo conteúdo (arquivo tocado ou gravado há pouco): só atualizar a chave de mtime
+        if snapshot and snapshot['sha256'] == digest:
+            if snapshot['mtime_ns'] != stat.st_mtime_ns or snapshot['written_ns'] - stat.st_mtime_ns <= RACY_WINDOW_NS:
+                snapshot['mtime_ns'] = stat.st_mtime_ns
+                snapshot['size'] = stat.st_size
+                self._write_snapshot(snapshot)
+            return snapshot['config'], snapshot['indexes'], 'snapshot-hash'
+
+        try:
+            config = json.loads(raw.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return None
+
+        indexes = compile_indexes(config)
+        self._write_snapshot({
+            'version': SNAPSHOT_VERSION,
+            'code': code_fingerprint(),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': digest,
+            'config': config,
+            'indexes': indexes
+        })
+        return config, indexes, 'json'
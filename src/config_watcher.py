@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Observador de mudanças da configuração
+Detecta alterações em `workflow-config.json` por polling de `os.stat`
+e aciona a recarga do assistente em uma thread em segundo plano.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+def file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """
+    Assinatura barata do arquivo: (mtime_ns, tamanho, inode), ou None se ausente.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class ConfigWatcher:
+    """
+    Thread que observa um arquivo e chama `on_change` quando ele muda.
+
+    Se `on_change` devolver False (por exemplo, JSON incompleto durante a
+    gravação pelo editor), a mudança é tentada de novo no próximo ciclo.
+    """
+
+    def __init__(self, path: Path, on_change: Callable[[], bool], interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Args:
+            path: Arquivo observado
+            on_change: Função chamada a cada mudança detectada
+            interval: Intervalo entre verificações, em segundos
+        """
+        self.path = Path(path)
+        self.on_change = on_change
+        self.interval = interval
+
+        self._signature = file_signature(self.path)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """
+        Inicia a observação em segundo plano.
+        """
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="elis-config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Interrompe a observação.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> bool:
+        """
+        Verifica o arquivo uma vez.
+
+        Returns:
+            True se uma mudança foi detectada e processada com sucesso
+        """
+        signature = file_signature(self.path)
+        if signature is None or signature == self._signature:
+            return False
+
+        try:
+            handled = self.on_change()
+        except Exception as e:
+            print(f"⚠️ Erro ao recarregar configuração: {e}")
+            handled = False
+
+        if handled is not False:
+            self._signature = signature
+        return bool(handled)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Planos de execução dos scripts dos fluxos
+Cada operação de `ai_workflow_mapping` é compilada uma única vez, na primeira
+execução (ou listagem), em um plano imutável: caminho absoluto do script, interpretador
+escolhido pela extensão e argumentos já separados. A execução usa o argv
+direto (sem `shell=True`), sem passar por um `/bin/sh` a cada fluxo.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import functools
+import os
+import shlex
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+IS_WINDOWS = os.name == 'nt'
+
+
+@functools.lru_cache(maxsize=None)
+def _find_powershell() -> Optional[str]:
+    """
+    Caminho do PowerShell no PATH, procurado uma única vez por processo.
+    """
+    return shutil.which('powershell') or shutil.which('pwsh')
+
+
+def _select_interpreter(suffix: str) -> Tuple[Tuple[str, ...], Optional[str]]:
+    """
+    Interpretador de um script pela extensão.
+
+    Returns:
+        Tupla (argv do interpretador, erro de validação ou None); argv vazio
+        indica que o próprio script é executado
+    """
+    if suffix == '.py':
+        return (sys.executable,), None
+    if suffix == '.ps1':
+        powershell = _find_powershell()
+        if powershell is None:
+            return ('powershell', '-ExecutionPolicy', 'Bypass', '-File'), "interpretador não encontrado: powershell"
+        return (powershell, '-ExecutionPolicy', 'Bypass', '-File'), None
+    if suffix in ('.bat', '.cmd'):
+        if not IS_WINDOWS:
+            return (), f"scripts {suffix} só executam no Windows"
+        return (os.environ.get('COMSPEC', 'cmd.exe'), '/c'), None
+    if suffix == '.sh' and not IS_WINDOWS:
+        return ('/bin/sh',), None
+    return (), None
+
+
+class ExecutionPlan:
+    """
+    Plano imutável de execução do script de uma operação.
+
+    `argv` é usado como está na criação do processo; `errors` lista os problemas
+    encontrados na compilação (script ausente, interpretador indisponível,
+    parâmetros inválidos) e um plano com erros não é executado.
+    """
+
+    __slots__ = ('operation', 'script', 'parameters', 'path', 'interpreter', 'argv', 'exists', 'errors')
+
+    def __init__(self, operation: str, script: str, parameters: str, path: Path,
+                 interpreter: Tuple[str, ...], argv: Tuple[str, ...], exists: bool, errors: Tuple[str, ...]):
+        for name, value in zip(self.__slots__, (operation, script, parameters, path, interpreter, argv, exists, errors)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ExecutionPlan é imutável: {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"ExecutionPlan é imutável: {name}")
+
+    def __repr__(self) -> str:
+        return f"ExecutionPlan({self.operation!r}, {self.argv!r}, errors={self.errors!r})"
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def matches(self, config: Dict) -> bool:
+        """
+        Se o plano foi compilado a partir do mesmo `script` e `parameters` da operação.
+        """
+        return config.get('script') == self.script and (config.get('parameters') or '') == self.parameters
+
+
+def compile_plan(project_root: Path, operation: str, config: Dict) -> Optional[ExecutionPlan]:
+    """
+    Compila o plano de execução de uma operação.
+
+    Args:
+        project_root: Raiz do projeto (base dos caminhos relativos)
+        operation: Nome da operação
+        config: Configuração da operação em `ai_workflow_mapping`
+
+    Returns:
+        Plano da operação ou None se ela não tiver script
+    """
+    script = config.get('script')
+    if not script:
+        return None
+
+    parameters = config.get('parameters') or ''
+    path = (Path(project_root) / script).resolve()
+    errors = []
+
+    exists = path.is_file()
+    if not exists:
+        errors.append(f"script não encontrado: {script}")
+
+    interpreter, error = _select_interpreter(path.suffix.lower())
+    if error:
+        errors.append(error)
+    elif exists and not interpreter and not IS_WINDOWS and not os.access(path, os.X_OK):
+        errors.append(f"script sem permissão de execução: {script}")
+
+    try:
+        arguments = tuple(shlex.split(parameters, posix=not IS_WINDOWS))
+    except ValueError as e:
+        arguments = ()
+        errors.append(f"parâmetros inválidos ({e}): {parameters}")
+
+    return ExecutionPlan(operation, script, parameters, path, interpreter,
+                         interpreter + (str(path),) + arguments, exists, tuple(errors))
+
+
+def compile_plans(project_root: Path, workflow_mapping: Dict) -> Dict[Tuple[str, str], ExecutionPlan]:
+    """
+    Compila os planos de todas as operações com script.
+
+    Returns:
+        Dicionário {(categoria, operação): plano}
+    """
+    plans = {}
+    for category_name, category in workflow_mapping.items():
+        for operation_name, operation in category.items():
+            plan = compile_plan(project_root, operation_name, operation)
+            if plan is not None:
+                plans[(category_name, operation_name)] = plan
+    return plans
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Trava de arquivo entre processos
+Serializa a leitura-mescla-gravação dos arquivos de estado compartilhados
+pelo daemon e pelas execuções da CLI (métricas, contadores de uso).
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: usa msvcrt
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Trava exclusiva (bloqueante) associada a um arquivo, em `<arquivo>.lock`.
+
+    Args:
+        path: Arquivo protegido (o próprio arquivo não é aberto)
+    """
+    with open(f"{path}.lock", 'a+b') as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
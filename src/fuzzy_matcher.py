@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Correção aproximada de termos
+Índice de trigramas de caracteres sobre as palavras normalizadas dos padrões
+de intenção e das palavras-chave, usado para corrigir erros de digitação
+("stauts" -> "status") quando a busca exata não encontra nada.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import heapq
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Palavras menores que isso não são corrigidas (erros demais seriam "válidos")
+MIN_TERM_LENGTH = 4
+# Quantidade máxima de termos avaliados por distância de edição, por palavra
+DEFAULT_MAX_CANDIDATES = 8
+
+
+def max_edits(length: int) -> int:
+    """
+    Distância de edição tolerada para uma palavra do tamanho informado.
+    """
+    return 1 if length < 8 else 2
+
+
+def trigrams(term: str) -> set:
+    """
+    Trigramas do termo, com bordas marcadas ("git" -> "  g", " gi", "git", "it ").
+    """
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Distância de edição com transposição de caracteres adjacentes (OSA).
+
+    Args:
+        a: Primeiro termo
+        b: Segundo termo
+        limit: Distância máxima de interesse
+
+    Returns:
+        Distância, ou `limit + 1` se ela certamente passa do limite
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous_row = None
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous_row = previous_row, row
+        row = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            row[j] = min(previous_row[j] + 1, row[j - 1] + 1, previous_row[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                row[j] = min(row[j], before[j - 2] + 1)
+        if min(row) > limit:
+            return limit + 1
+    return min(row[-1], limit + 1)
+
+
+class FuzzyTermIndex:
+    """
+    Índice de trigramas do vocabulário, separado por tamanho do termo.
+
+    Uma consulta só conta trigramas de termos com tamanho compatível com a
+    distância tolerada e calcula a distância de edição apenas para os
+    `max_candidates` termos com mais trigramas em comum: a etapa cara da
+    consulta fica limitada, qualquer que seja o tamanho da configuração.
+    """
+
+    def __init__(self, terms: Iterable[str], max_candidates: int = DEFAULT_MAX_CANDIDATES,
+                 previous: Optional['FuzzyTermIndex'] = None):
+        """
+        Args:
+            terms: Vocabulário (palavras já normalizadas)
+            max_candidates: Termos avaliados por distância de edição, por palavra
+            previous: Índice anterior; reaproveitado se o vocabulário for o mesmo
+        """
+        self.max_candidates = max_candidates
+        self.terms: List[str] = list(dict.fromkeys(terms))
+        self.vocabulary = set(self.terms)
+
+        if previous is not None and previous.terms == self.terms:
+            self.postings = previous.postings
+            return
+
+        # (tamanho do termo, trigrama) -> ids dos termos
+        self.postings: Dict[Tuple[int, str], List[int]] = {}
+        for term_id, term in enumerate(self.terms):
+            for gram in trigrams(term):
+                self.postings.setdefault((len(term), gram), []).append(term_id)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def correct_term(self, word: str) -> Optional[str]:
+        """
+        Termo do vocabulário mais próximo de uma palavra desconhecida.
+
+        Args:
+            word: Palavra normalizada
+
+        Returns:
+            Termo corrigido, ou None se a palavra já existe, é curta demais
+            ou nenhum termo está dentro da distância tolerada
+        """
+        if word in self.vocabulary or len(word) < MIN_TERM_LENGTH:
+            return None
+
+        limit = max_edits(len(word))
+        grams = trigrams(word)
+        shared: Dict[int, int] = Counter()
+        for length in range(len(word) - limit, len(word) + limit + 1):
+            for gram in grams:
+                shared.update(self.postings.get((length, gram), ()))
+
+        # Cada edição altera no máximo 4 trigramas (transposição): filtro sem falsos negativos
+        minimum = max(1, len(grams) - 4 * limit)
+        candidates = heapq.nlargest(self.max_candidates,
+                                    ((count, -term_id) for term_id, count in shared.items() if count >= minimum))
+
+        # Candidatos já ordenados por trigramas em comum (empate: ordem do vocabulário)
+        best_id, best_distance = None, limit + 1
+        for count, negative_id in candidates:
+            distance = edit_distance(word, self.terms[-negative_id], limit)
+            if distance < best_distance:
+                best_id, best_distance = -negative_id, distance
+                if distance == 1:
+                    break  # a palavra não está no vocabulário: 1 é a menor distância possível
+        return self.terms[best_id] if best_id is not None else None
+
+    def correct(self, text: str) -> Optional[Tuple[str, List[Tuple[str, str]]]]:
+        """
+        Corrige as palavras desconhecidas de um texto normalizado.
+
+        Args:
+            text: Entrada normalizada (mesma normalização do vocabulário)
+
+        Returns:
+            Tupla (texto corrigido, [(palavra, correção)]) ou None se nada foi corrigido
+        """
+        words = text.split()
+        corrections = []
+        for position, word in enumerate(words):
+            term = self.correct_term(word)
+            if term is not None:
+                corrections.append((word, term))
+                words[position] = term
+
+        if not corrections:
+            return None
+        return ' '.join(words), corrections
@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Monitor de atualizações do Git
+Versão em Python do `github-monitor.ps1`: mantém um processo
+`git cat-file --batch` aberto para ler referências e commits, guarda o último
+commit remoto já visto (em vez de um horário) e processa apenas os commits novos.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import heapq
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from notification_store import NOTIFICATION_DB_NAME, NotificationStore
+
+# Categorias de progresso reconhecidas nas mensagens de commit (mesmas do script PowerShell)
+TASK_PATTERNS = {
+    'Passos': ("Passo", "Step", "Etapa"),
+    'Implementacoes': ("Implementar", "Criar", "Adicionar", "Desenvolver"),
+    'Correcoes': ("Corrigir", "Fix", "Bug", "Resolver"),
+    'Documentacao': ("Documentar", "Doc", "README", "Documentacao"),
+    'Testes': ("Testar", "Test", "Verificar"),
+    'Configuracoes': ("Configurar", "Config", "Setup", "Instalar"),
+}
+_TASK_REGEXES = {
+    category: re.compile("|".join(re.escape(pattern) for pattern in patterns), re.IGNORECASE)
+    for category, patterns in TASK_PATTERNS.items()
+}
+
+STATE_FILE_NAME = "git-monitor-state.json"
+NOTIFICATION_FILE_NAME = "notifications.txt"
+NOTIFICATION_CONFIG_NAME = "notification-config.json"
+# Limite de commits percorridos por verificação (proteção contra históricos enormes)
+MAX_WALK = 10000
+# Passos extras da travessia para tolerar datas de commit fora de ordem (como no git)
+WALK_SLOP = 5
+
+
+def load_monitoring_settings(config_dir: Path) -> Dict:
+    """
+    Seção `monitoring` do `notification-config.json` (vazia se ausente ou inválido).
+    """
+    try:
+        with open(Path(config_dir) / NOTIFICATION_CONFIG_NAME, 'r', encoding='utf-8') as f:
+            return json.load(f).get('monitoring', {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def open_notification_store(directory: Path, monitoring: Dict) -> NotificationStore:
+    """
+    Abre o `notifications.db` de um diretório com a retenção configurada e
+    importa o `notifications.txt` legado.
+
+    Args:
+        directory: Diretório do banco e do arquivo legado
+        monitoring: Seção `monitoring` do `notification-config.json`
+            (`max_notifications`, `notification_retention_days`)
+    """
+    store = NotificationStore(Path(directory) / NOTIFICATION_DB_NAME,
+                              max_entries=monitoring.get('max_notifications'),
+                              retention_days=monitoring.get('notification_retention_days'))
+    store.import_text_file(Path(directory) / NOTIFICATION_FILE_NAME)
+    return store
+
+
+class GitError(Exception):
+    """
+    Falha ao executar ou ler dados do Git.
+    """
+
+
+class GitObjectReader:
+    """
+    Leitor de objetos do Git sobre um único processo `git cat-file --batch`.
+
+    Aceita ids de objetos e nomes de referências (ex.: `refs/remotes/origin/main`),
+    que são resolvidos a cada consulta, inclusive após um `git fetch`.
+    """
+
+    def __init__(self, repo_path: Path):
+        """
+        Args:
+            repo_path: Diretório do repositório (working tree ou bare)
+        """
+        self.repo_path = Path(repo_path)
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            try:
+                self._process = subprocess.Popen(
+                    ['git', 'cat-file', '--batch'], cwd=self.repo_path,
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+                )
+            except OSError as e:
+                raise GitError(f"Não foi possível iniciar o git: {e}") from e
+        return self._process
+
+    def read(self, name: str) -> Optional[Tuple[str, str, bytes]]:
+        """
+        Lê um objeto.
+
+        Args:
+            name: Id do objeto ou nome de referência
+
+        Returns:
+            Tupla (id, tipo, conteúdo) ou None se o objeto não existir
+        """
+        with self._lock:
+            process = self._ensure_process()
+            try:
+                process.stdin.write(name.encode('utf-8') + b'\n')
+                process.stdin.flush()
+                header = process.stdout.readline()
+                if not header:
+                    raise GitError("git cat-file encerrou inesperadamente")
+                if header.endswith(b' missing\n') or header.endswith(b' ambiguous\n'):
+                    return None
+
+                object_id, object_type, size = header.decode('ascii').split()
+                data = process.stdout.read(int(size))
+                process.stdout.read(1)  # quebra de linha após o conteúdo
+            except (OSError, ValueError) as e:
+                self.close()
+                raise GitError(f"Erro ao ler objeto {name}: {e}") from e
+
+        return object_id, object_type, data
+
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Resolve uma referência para o id do commit, ou None se não existir.
+        """
+        result = self.read(name)
+        return result[0] if result else None
+
+    def close(self):
+        if self._process is not None:
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+            self._process = None
+
+
+def parse_commit(object_id: str, data: bytes) -> Dict:
+    """
+    Interpreta o conteúdo bruto de um commit.
+
+    Returns:
+        Dicionário com `id`, `parents`, `author`, `timestamp` (do committer) e `subject`
+    """
+    header, _, message = data.partition(b'\n\n')
+    commit = {'id': object_id, 'parents': [], 'author': '', 'timestamp': 0, 'subject': ''}
+
+    for line in header.decode('utf-8', errors='replace').splitlines():
+        key, _, value = line.partition(' ')
+        if key == 'parent':
+            commit['parents'].append(value)
+        elif key == 'author':
+            commit['author'] = value.rsplit(' ', 2)[0].split(' <')[0]
+        elif key == 'committer':
+            commit['timestamp'] = int(value.rsplit(' ', 2)[1])
+
+    commit['subject'] = message.decode('utf-8', errors='replace').strip().split('\n', 1)[0]
+    return commit
+
+
+def analyze_task_progress(commits: Iterable[Dict]) -> Dict[str, int]:
+    """
+    Conta os commits por categoria de tarefa (Passos, Correções, Testes...).
+    """
+    progress: Dict[str, int] = {}
+    for commit in commits:
+        for category, regex in _TASK_REGEXES.items():
+            if regex.search(commit['subject']):
+                progress[category] = progress.get(category, 0) + 1
+    return progress
+
+
+class GitMonitor:
+    """
+    Monitor de atualizações de um repositório em relação ao remoto.
+    """
+
+    def __init__(self, repo_path: Path, remote: str = 'origin', branch: Optional[str] = None,
+                 state_file: Optional[Path] = None, notification_store: Optional[NotificationStore] = None,
+                 auto_fetch: bool = True, show_notifications: bool = True):
+        """
+        Args:
+            repo_path: Working tree do repositório monitorado
+            remote: Nome do remoto
+            branch: Branch remota monitorada (padrão: a branch atual)
+            state_file: Arquivo com o último commit remoto já visto
+            notification_store: Banco de notificações (padrão: `notifications.db` no
+                repositório, com a retenção do `notification-config.json` dele e
+                importação do `notifications.txt` legado)
+            auto_fetch: Se deve executar `git fetch` a cada verificação
+            show_notifications: Se deve exibir as notificações criadas
+        """
+        self.repo_path = Path(repo_path)
+        self.remote = remote
+        self.branch = branch
+        self.state_file = Path(state_file) if state_file else self.repo_path / STATE_FILE_NAME
+        if notification_store is None:
+            notification_store = open_notification_store(self.repo_path, load_monitoring_settings(self.repo_path))
+        self.notification_store = notification_store
+        self.auto_fetch = auto_fetch
+        self.show_notifications = show_notifications
+
+        self.reader = GitObjectReader(self.repo_path)
+        self._commits: Dict[str, Dict] = {}  # commits são imutáveis: cache por id
+
+    def close(self):
+        self.reader.close()
+        self.notification_store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def load_state(self) -> Dict:
+        try:
+            return json.loads(self.state_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, state: Dict):
+        """
+        Grava o estado de forma atômica (arquivo temporário + rename).
+        """
+        temp_file = Path(f"{self.state_file}.tmp")
+        temp_file.write_text(json.dumps(state, indent=2), encoding='utf-8')
+        os.replace(temp_file, self.state_file)
+
+    def _git(self, *args: str, check: bool = True) -> str:
+        """
+        Executa um comando git avulso (fetch, status, pull).
+        """
+        try:
+            completed = subprocess.run(['git', *args], cwd=self.repo_path, capture_output=True,
+                                       text=True, errors='replace')
+        except OSError as e:
+            raise GitError(f"Não foi possível executar git: {e}") from e
+        if check and completed.returncode != 0:
+            raise GitError(completed.stderr.strip() or f"git {args[0]} falhou (código {completed.returncode})")
+        return completed.stdout
+
+    def current_branch(self) -> Optional[str]:
+        """
+        Nome da branch monitorada (padrão: a branch atual), ou None em HEAD destacado.
+        """
+        branch = self.branch
+        if branch:
+            return branch
+        output = self._git('symbolic-ref', '-q', '--short', 'HEAD', check=False).strip()
+        self.branch = output or None
+        return self.branch
+
+    @property
+    def remote_ref(self) -> str:
+        return f"refs/remotes/{self.remote}/{self.current_branch() or 'main'}"
+
+    def commit(self, object_id: str) -> Dict:
+        """
+        Lê um commit (com cache por id).
+        """
+        commit = self._commits.get(object_id)
+        if commit is None:
+            result = self.reader.read(object_id)
+            if result is None or result[1] != 'commit':
+                raise GitError(f"Commit não encontrado: {object_id}")
+            commit = self._commits[object_id] = parse_commit(result[0], result[2])
+        return commit
+
+    def commits_between(self, exclude: Iterable[Optional[str]], include: str, limit: int = MAX_WALK) -> List[Dict]:
+        """
+        Commits alcançáveis a partir de `include` e não alcançáveis a partir de
+        nenhum commit de `exclude` (equivalente a `git log ^a ^b include`).
+
+        Percorre os commits por data, do mais novo para o mais antigo, e para pouco
+        depois que só restam commits já excluídos na fila.
+
+        Returns:
+            Commits em ordem cronológica (mais antigo primeiro)
+        """
+        excluded = set()
+        queued = set()
+        heap: List[Tuple[int, bool, str]] = []
+        pending = 0  # entradas não excluídas na fila
+        slop = WALK_SLOP
+
+        def push(object_id: str, uninteresting: bool):
+            nonlocal pending
+            if uninteresting:
+                if object_id in excluded:
+                    return
+                excluded.add(object_id)
+            elif object_id in queued:
+                return
+            else:
+                pending += 1
+            queued.add(object_id)
+            # Em datas iguais, commits excluídos saem primeiro
+            heapq.heappush(heap, (-self.commit(object_id)['timestamp'], not uninteresting, object_id))
+
+        for object_id in exclude:
+            if object_id:
+                push(object_id, True)
+        push(include, False)
+
+        result = []
+        # Após esgotar os incluídos, alguns passos extras toleram relógios fora de ordem
+        while heap and (pending or slop):
+            if not pending:
+                slop -= 1
+            _, interesting, object_id = heapq.heappop(heap)
+            if interesting:
+                pending -= 1
+            commit = self.commit(object_id)
+            if not interesting or object_id in excluded:
+                for parent in commit['parents']:
+                    push(parent, True)
+                continue
+
+            result.append(commit)
+            if len(result) >= limit:
+                break
+            for parent in commit['parents']:
+                push(parent, False)
+
+        # Commits alcançados primeiro pelo lado incluído e só depois marcados como excluídos
+        return [commit for commit in reversed(result) if commit['id'] not in excluded]
+
+    def recent_commits(self, since: datetime, ref: str = 'HEAD') -> List[Dict]:
+        """
+        Commits de `ref` com data de commit a partir de `since`, do mais antigo ao mais novo.
+        """
+        output = self._git('rev-list', f'--since={int(since.timestamp())}', f'--max-count={MAX_WALK}', ref)
+        return [self.commit(object_id) for object_id in reversed(output.split())]
+
+    def create_notification(self, title: str, message: str, notification_type: str = "INFO"):
+        """
+        Registra uma notificação no banco de notificações.
+        """
+        notification = self.notification_store.add(title, message, notification_type)
+
+        if self.show_notifications:
+            print(f"\n🔔 NOTIFICAÇÃO: {title}")
+            print(f"   {message}")
+            print(f"   Horário: {notification['Timestamp']}\n")
+
+    def check(self) -> Dict:
+        """
+        Busca atualizações e processa apenas os commits remotos ainda não vistos.
+
+        Na primeira verificação, os commits novos são os do remoto ausentes do
+        HEAD local; depois, os posteriores ao último commit remoto já visto.
+
+        Returns:
+            Relatório com `remote_commit`, `local_commit`, `new_commits`, `progress` e `behind`
+        """
+        if self.auto_fetch:
+            self._git('fetch', '--quiet', self.remote)
+
+        state = self.load_state()
+        remote_commit = self.reader.resolve(self.remote_ref)
+        local_commit = self.reader.resolve('HEAD')
+        if remote_commit is None:
+            raise GitError(f"Referência remota não encontrada: {self.remote_ref}")
+
+        last_seen = state.get('last_seen') if state.get('remote_ref') == self.remote_ref else None
+        if last_seen and self.reader.read(last_seen) is None:
+            last_seen = None  # histórico reescrito/gc: recomeçar pelo HEAD local
+
+        new_commits = [] if remote_commit == last_seen else self.commits_between([last_seen, local_commit], remote_commit)
+        progress = analyze_task_progress(new_commits)
+
+        if new_commits:
+            self.create_notification("Atualizacoes Disponiveis",
+                                     f"{len(new_commits)} novo(s) commit(s) detectado(s) no repositorio", "UPDATE")
+            if progress:
+                details = ", ".join(f"{category} ({count})" for category, count in progress.items())
+                self.create_notification("Progresso de Tarefas", f"Progresso detectado: {details}", "PROGRESS")
+
+        self._save_state({
+            'remote_ref': self.remote_ref,
+            'last_seen': remote_commit,
+            'last_check': datetime.now().isoformat(timespec='seconds')
+        })
+
+        return {
+            'remote_commit': remote_commit,
+            'local_commit': local_commit,
+            'new_commits': new_commits,
+            'progress': progress,
+            'behind': bool(local_commit != remote_commit and
+                           self.commits_between([local_commit], remote_commit, limit=1))
+        }
+
+    def status(self) -> Dict:
+        """
+        Situação do repositório local em relação ao remoto (sem acessar a rede).
+        """
+        local_commit = self.reader.resolve('HEAD')
+        remote_commit = self.reader.resolve(self.remote_ref)
+        changes = [line for line in self._git('status', '--porcelain').splitlines() if line.strip()]
+
+        return {
+            'branch': self.current_branch(),
+            'last_commit': self.commit(local_commit) if local_commit else None,
+            'local_changes': len(changes),
+            'unpushed': len(self.commits_between([remote_commit], local_commit)) if local_commit and remote_commit else 0,
+            'behind': len(self.commits_between([local_commit], remote_commit)) if local_commit and remote_commit else 0,
+            'last_check': self.load_state().get('last_check')
+        }
+
+    def sync(self) -> bool:
+        """
+        Atualiza o repositório local (`git pull`) se houver commits novos no remoto.
+        """
+        report = self.check()
+        if not report['behind']:
+            return False
+        try:
+            self._git('pull', '--quiet', self.remote, self.current_branch() or 'main')
+        except GitError as e:
+            self.create_notification("Erro de Sincronizacao", str(e), "ERROR")
+            raise
+        self.create_notification("Sincronizacao Completa", "Repositorio local atualizado com sucesso", "SUCCESS")
+        return True
+
+    def notifications(self, limit: int = 10, **filters) -> List[Dict]:
+        """
+        Notificações mais recentes primeiro.
+
+        Args:
+            limit: Quantidade máxima
+            **filters: Filtros de `NotificationStore.query()` (tipo, período, lidas)
+        """
+        return self.notification_store.query(limit=limit, **filters)['notifications']
+
+def _print_check(report: Dict):
+    if not report['new_commits']:
+        print("✅ Repositório está atualizado")
+        return
+
+    print(f"🔔 {len(report['new_commits'])} novo(s) commit(s) no remoto:")
+    for commit in report['new_commits']:
+        print(f"   🔸 {commit['id'][:7]} {commit['subject']} ({commit['author']})")
+    for category, count in report['progress'].items():
+        print(f"   📈 {category}: {count} commit(s)")
+    if report['behind']:
+        print("💡 Execute 'python src/git_monitor.py --action sync' para sincronizar")
+
+
+def _print_status(status: Dict):
+    print(f"   • Branch atual: {status['branch'] or '(HEAD destacado)'}")
+    if status['last_commit']:
+        print(f"   • Último commit: {status['last_commit']['id'][:7]} {status['last_commit']['subject']}")
+    if status['local_changes']:
+        print(f"   • Arquivos modificados localmente: {status['local_changes']}")
+    else:
+        print("   • Working directory limpo")
+    if status['unpushed']:
+        print(f"   • Commits pendentes para push: {status['unpushed']}")
+    if status['behind']:
+        print(f"   • Commits remotos ainda não baixados: {status['behind']}")
+    if status['last_check']:
+        print(f"   • Última verificação: {status['last_check']}")
+
+
+def main():
+    import argparse
+
+    project_root = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description='ELIS-V1 Git update monitor')
+    parser.add_argument('--action', default='check', choices=('check', 'sync', 'status', 'monitor', 'notifications'))
+    parser.add_argument('--repo', type=str, default=str(project_root), help='Repository working tree')
+    parser.add_argument('--remote', type=str, default='origin')
+    parser.add_argument('--branch', type=str, help='Remote branch to watch (default: current branch)')
+    parser.add_argument('--interval', type=float, help='Minutes between checks in monitor mode')
+    parser.add_argument('--quiet', action='store_true', help='Do not print notifications')
+    parser.add_argument('--type', type=str, help='Notification type filter (e.g. UPDATE, PROGRESS)')
+    parser.add_argument('--since', type=str, help='Only notifications at or after this time (YYYY-MM-DD[ HH:MM:SS])')
+    parser.add_argument('--until', type=str, help='Only notifications at or before this time')
+    parser.add_argument('--unread', action='store_true', help='Only unread notifications')
+    parser.add_argument('--limit', type=int, default=10, help='Notifications per page')
+    parser.add_argument('--cursor', type=str, help='Page cursor printed by the previous page')
+    parser.add_argument('--mark-read', action='store_true', help='Mark the listed notifications as read')
+
+    args = parser.parse_args()
+
+    monitoring = load_monitoring_settings(project_root)
+    store = NotificationStore(project_root / NOTIFICATION_DB_NAME,
+                              max_entries=monitoring.get('max_notifications'),
+                              retention_days=monitoring.get('notification_retention_days'))
+    imported = store.import_text_file(project_root / NOTIFICATION_FILE_NAME)
+    if imported:
+        print(f"📥 {imported} notificação(ões) importada(s) de {NOTIFICATION_FILE_NAME}")
+
+    with GitMonitor(Path(args.repo), args.remote, args.branch,
+                    state_file=project_root / STATE_FILE_NAME,
+                    notification_store=store,
+                    auto_fetch=monitoring.get('auto_fetch', True),
+                    show_notifications=not args.quiet) as monitor:
+        try:
+            if args.action == 'check':
+                print("🔍 Verificando atualizações remotas...")
+                _print_status(monitor.status())
+                _print_check(monitor.check())
+            elif args.action == 'sync':
+                if monitor.sync():
+                    print("✅ Sincronização concluída com sucesso!")
+                else:
+                    print("✅ Repositório já está atualizado")
+                _print_status(monitor.status())
+            elif args.action == 'status':
+                print("📊 Status do repositório:")
+                _print_status(monitor.status())
+            elif args.action == 'monitor':
+                interval = args.interval or monitoring.get('check_interval_minutes', 5)
+                print(f"👀 Monitoramento contínuo (verificação a cada {interval:g} minutos)...")
+                while True:
+                    _print_check(monitor.check())
+                    time.sleep(interval * 60)
+            elif args.action == 'notifications':
+                filters = {'notification_type': args.type, 'since': args.since, 'until': args.until,
+                           'read': False if args.unread else None}
+                page = store.query(limit=args.limit, cursor=args.cursor, **filters)
+                notifications = page['notifications']
+                if notifications:
+                    print(f"🔔 HISTÓRICO DE NOTIFICAÇÕES ({store.count(**filters)} no total, "
+                          f"{store.count(read=False)} não lida(s)):")
+                else:
+                    print("📭 Nenhuma notificação encontrada")
+                for notification in notifications:
+                    marker = " " if notification['read'] else "•"
+                    print(f"   {marker} [{notification['Timestamp']}] [{notification['Type']}] "
+                          f"{notification['Title']}: {notification['Message']}")
+                if args.mark_read and notifications:
+                    store.mark_read(notification['id'] for notification in notifications)
+                if page['next_cursor']:
+                    print(f"💡 Próxima página: --cursor \"{page['next_cursor']}\"")
+        except GitError as e:
+            print(f"❌ Erro do Git: {e}")
+            sys.exit(1)
+        except KeyboardInterrupt:
+            print("\n👋 Monitoramento encerrado")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Matcher compilado de intenções
+Índice invertido construído uma única vez a partir de
+`ai_recognition_patterns.intent_detection`, usado pelo AIWorkflowAssistant.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from text_normalization import lower_text
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: apenas acelera o reconhecimento em lote
+    np = None
+
+# Confiança atribuída quando o padrão aparece literalmente na entrada
+SUBSTRING_CONFIDENCE = 0.9
+DEFAULT_THRESHOLD = 0.7
+
+
+def compile_intent_segment(intent_config: Dict, normalize: Callable[[str], str] = lower_text) -> Dict:
+    """
+    Normaliza os padrões de uma intenção.
+
+    Args:
+        intent_config: Configuração da intenção (`patterns`, `confidence_threshold`, `action`)
+        normalize: Normalização do texto (ver `text_normalization.text_normalizer`)
+
+    Returns:
+        Segmento compilado, com a configuração de origem para comparação em recargas
+    """
+    patterns = []
+    for pattern in intent_config.get('patterns', []):
+        text = normalize(pattern)
+        patterns.append((text, tuple(set(text.split()))))
+
+    return {
+        'source': intent_config,
+        'threshold': intent_config.get('confidence_threshold', DEFAULT_THRESHOLD),
+        'action': intent_config.get('action'),
+        'patterns': patterns
+    }
+
+
+class CompiledIntentMatcher:
+    """
+    Matcher de intenções pré-compilado.
+
+    Reproduz exatamente a pontuação da varredura linear original
+    (substring -> 0.9, senão sobreposição de palavras / tamanho do padrão) sobre
+    padrões e entradas normalizados (minúsculas, por padrão), mas avalia apenas
+    os padrões que compartilham uma palavra com a entrada ou que aparecem nela
+    como substring.
+    """
+
+    def __init__(self, intent_detection: Dict, previous: Optional['CompiledIntentMatcher'] = None,
+                 normalize: Callable[[str], str] = lower_text):
+        """
+        Compila os padrões de intenção.
+
+        Args:
+            intent_detection: Seção `ai_recognition_patterns.intent_detection` da configuração
+            previous: Matcher anterior; intenções com configuração idêntica reaproveitam
+                      os padrões já normalizados em vez de serem recompiladas
+            normalize: Normalização de padrões e entradas (`lower_text` ou `fold_text`)
+        """
+        self.normalize = normalize
+        if previous is not None and getattr(previous, 'normalize', None) is not normalize:
+            previous = None  # padrões normalizados de outra forma: recompilar tudo
+
+        # Dados por padrão, indexados pela ordem original (intent, padrão)
+        self.pattern_texts: List[str] = []
+        self.pattern_sizes: List[int] = []
+        self.pattern_thresholds: List[float] = []
+        self.pattern_actions: List[Optional[str]] = []
+        self.pattern_intents: List[str] = []
+
+        # palavra -> ids dos padrões que a contêm
+        self.postings: Dict[str, List[int]] = {}
+        # tamanho -> {texto do padrão: ids}, para a verificação de substring
+        self.by_length: Dict[int, Dict[str, List[int]]] = {}
+
+        # intenção -> segmento compilado; `recompiled` lista as intenções (re)compiladas
+        self.segments: Dict[str, Dict] = {}
+        self.recompiled: List[str] = []
+
+        for intent_name, intent_config in intent_detection.items():
+            segment = previous.segments.get(intent_name) if previous else None
+            if segment is None or segment['source'] != intent_config:
+                segment = compile_intent_segment(intent_config, normalize)
+                self.recompiled.append(intent_name)
+            self.segments[intent_name] = segment
+
+            for text, tokens in segment['patterns']:
+                self._add_pattern(intent_name, text, tokens, segment['threshold'], segment['action'])
+
+        self.lengths = sorted(self.by_length)
+
+    def _add_pattern(self, intent_name: str, text: str, tokens: Tuple[str, ...],
+                     threshold: float, action: Optional[str]):
+        """
+        Adiciona um padrão normalizado aos índices.
+        """
+        pattern_id = len(self.pattern_texts)
+
+        self.pattern_texts.append(text)
+        self.pattern_sizes.append(len(tokens))
+        self.pattern_thresholds.append(threshold)
+        self.pattern_actions.append(action)
+        self.pattern_intents.append(intent_name)
+
+        for token in tokens:
+            self.postings.setdefault(token, []).append(pattern_id)
+
+        self.by_length.setdefault(len(text), {}).setdefault(text, []).append(pattern_id)
+
+    def __len__(self) -> int:
+        return len(self.pattern_texts)
+
+    def _substring_hits(self, text: str) -> set:
+        """
+        Retorna os ids dos padrões contidos literalmente no texto.
+
+        Percorre uma janela por tamanho distinto de padrão, de modo que o custo
+        depende do tamanho da entrada e não da quantidade de padrões.
+        """
+        hits = set()
+        text_length = len(text)
+
+        for length in self.lengths:
+            if length > text_length:
+                break
+
+            bucket = self.by_length[length]
+            seen = set()
+            for start in range(text_length - length + 1):
+                window = text[start:start + length]
+                if window in seen:
+                    continue
+                seen.add(window)
+                ids = bucket.get(window)
+                if ids:
+                    hits.update(ids)
+
+        return hits
+
+    def _overlaps(self, text: str) -> Dict[int, int]:
+        """
+        Quantidade de palavras de cada padrão presentes no texto normalizado.
+        """
+        overlaps: Dict[int, int] = {}
+        for token in set(text.split()):
+            for pattern_id in self.postings.get(token, ()):
+                overlaps[pattern_id] = overlaps.get(pattern_id, 0) + 1
+        return overlaps
+
+    def best_match(self, user_input: str, priority: Optional[Sequence[int]] = None) -> Optional[Tuple[int, float]]:
+        """
+        Seleciona o padrão vencedor com as mesmas regras da varredura linear:
+        maior confiança acima do limiar, empates resolvidos pela ordem da configuração
+        (ou pela prioridade informada, ex.: intenções mais usadas primeiro).
+
+        Os candidatos com palavras em comum são avaliados em ordem decrescente do
+        limite superior da confiança (sobreposição / tamanho) e, no empate, pela
+        prioridade. Acima de 0.9 o primeiro candidato aprovado no limiar que não
+        seja ocorrência literal vence e a busca de substrings é dispensada; senão
+        as ocorrências literais (0.9) são resolvidas e só depois os candidatos
+        abaixo de 0.9, novamente parando no primeiro aprovado.
+
+        Args:
+            user_input: Texto de entrada do usuário
+            priority: Posição de desempate de cada padrão (menor vence)
+
+        Returns:
+            Tupla (id do padrão, confiança) ou None
+        """
+        text = self.normalize(user_input).strip()
+        rank = priority.__getitem__ if priority is not None else (lambda pattern_id: pattern_id)
+
+        ratios = {pattern_id: count / self.pattern_sizes[pattern_id]
+                  for pattern_id, count in self._overlaps(text).items()}
+        ordered = sorted(ratios, key=lambda pattern_id: (-ratios[pattern_id], rank(pattern_id)))
+
+        for pattern_id in ordered:
+            ratio = ratios[pattern_id]
+            if ratio <= SUBSTRING_CONFIDENCE:
+                break
+            if ratio >= self.pattern_thresholds[pattern_id] and self.pattern_texts[pattern_id] not in text:
+                return pattern_id, ratio
+
+        hits = self._substring_hits(text)
+        tied = [pattern_id for pattern_id in hits
+                if self.pattern_thresholds[pattern_id] <= SUBSTRING_CONFIDENCE]
+        tied.extend(pattern_id for pattern_id in ordered
+                    if ratios[pattern_id] == SUBSTRING_CONFIDENCE and pattern_id not in hits
+                    and self.pattern_thresholds[pattern_id] <= SUBSTRING_CONFIDENCE)
+        if tied:
+            return min(tied, key=rank), SUBSTRING_CONFIDENCE
+
+        for pattern_id in ordered:
+            ratio = ratios[pattern_id]
+            if ratio >= SUBSTRING_CONFIDENCE or pattern_id in hits:
+                continue
+            if ratio >= self.pattern_thresholds[pattern_id]:
+                return pattern_id, ratio
+
+        return None
+
+    def match(self, user_input: str, priority: Optional[Sequence[int]] = None) -> Optional[Tuple[str, float]]:
+        """
+        Reconhece a intenção da entrada.
+
+        Args:
+            user_input: Texto de entrada do usuário
+            priority: Posição de desempate de cada padrão (ver `best_match`)
+
+        Returns:
+            Tupla com (ação_identificada, confiança) ou None se não reconhecido
+        """
+        result = self.best_match(user_input, priority)
+        if result is None:
+            return None
+
+        pattern_id, confidence = result
+        action = self.pattern_actions[pattern_id]
+        if not action:
+            return None
+        return action, confidence
+
+    def match_many(self, inputs: List[str], use_numpy: bool = False,
+                   priority: Optional[Sequence[int]] = None) -> List[Optional[Tuple[str, float]]]:
+        """
+        Reconhece as intenções de um lote de entradas.
+
+        Args:
+            inputs: Lista de textos de entrada
+            use_numpy: Usa a pontuação vetorizada com NumPy, quando disponível
+            priority: Posição de desempate de cada padrão (ver `best_match`)
+
+        Returns:
+            Lista com o resultado de `match` para cada entrada, na mesma ordem
+        """
+        if not use_numpy or np is None or not self.pattern_texts:
+            return [self.match(user_input, priority) for user_input in inputs]
+        return self._match_many_numpy(inputs, priority)
+
+    def _match_many_numpy(self, inputs: List[str],
+                          priority: Optional[Sequence[int]] = None) -> List[Optional[Tuple[str, float]]]:
+        """
+        Pontuação vetorizada em formato esparso: apenas os pares (entrada, padrão)
+        com palavra em comum ou ocorrência literal são materializados, de modo que
+        a memória cresce com os candidatos do lote e não com entradas x padrões.
+        """
+        texts = [self.normalize(user_input).strip() for user_input in inputs]
+        pattern_count = len(self.pattern_texts)
+
+        # Um par (entrada, padrão) por palavra em comum; repetições somam a sobreposição
+        pair_rows: List[int] = []
+        pair_ids: List[int] = []
+        hit_keys: List[int] = []
+        for row, text in enumerate(texts):
+            for token in set(text.split()):
+                ids = self.postings.get(token)
+                if ids:
+                    pair_rows.extend([row] * len(ids))
+                    pair_ids.extend(ids)
+            hit_keys.extend(row * pattern_count + pattern_id for pattern_id in self._substring_hits(text))
+
+        keys, overlaps = np.unique(np.asarray(pair_rows, dtype=np.int64) * pattern_count
+                                   + np.asarray(pair_ids, dtype=np.int64), return_counts=True)
+        sizes = np.asarray(self.pattern_sizes, dtype=np.float64)
+        scores = overlaps / sizes[keys % pattern_count]
+
+        # Ocorrência literal substitui a sobreposição (0.9), como na varredura
+        hit_keys = np.unique(np.asarray(hit_keys, dtype=np.int64))
+        scores[np.isin(keys, hit_keys)] = SUBSTRING_CONFIDENCE
+        only_hits = np.setdiff1d(hit_keys, keys, assume_unique=True)
+        keys = np.concatenate([keys, only_hits])
+        scores = np.concatenate([scores, np.full(len(only_hits), SUBSTRING_CONFIDENCE)])
+
+        rows, ids = np.divmod(keys, pattern_count)
+        thresholds = np.asarray(self.pattern_thresholds, dtype=np.float64)
+        passed = (scores > 0.0) & (scores >= thresholds[ids])
+        rows, ids, scores = rows[passed], ids[passed], scores[passed]
+
+        # Por entrada: maior confiança, empate pela prioridade (ou pela ordem da configuração)
+        ranks = ids if priority is None else np.asarray(priority, dtype=np.int64)[ids]
+        order = np.lexsort((ranks, -scores, rows))
+        rows, ids, scores = rows[order], ids[order], scores[order]
+        first = np.ones(len(rows), dtype=bool)
+        first[1:] = rows[1:] != rows[:-1]
+
+        results: List[Optional[Tuple[str, float]]] = [None] * len(texts)
+        for row, pattern_id, confidence in zip(rows[first].tolist(), ids[first].tolist(), scores[first].tolist()):
+            action = self.pattern_actions[pattern_id]
+            if action:
+                results[row] = (action, confidence)
+        return results
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Fila de execução de fluxos com exclusão por recurso
+Cada fluxo declara os recursos que lê ou escreve (índice do Git, ambiente
+virtual, rede...). Fluxos compatíveis rodam em paralelo em um pool de
+threads; os conflitantes são serializados na ordem de chegada.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterable, List, Optional
+
+from step_engine import DEFAULT_MAX_WORKERS
+
+# Recurso coringa: quem o escreve conflita com qualquer outro fluxo
+ALL_RESOURCES = '*'
+
+
+class ResourceClaim:
+    """
+    Recursos lidos e escritos por um fluxo (leitores compartilham, escritores são exclusivos).
+    """
+
+    def __init__(self, reads: Iterable[str] = (), writes: Iterable[str] = ()):
+        self.writes = frozenset(writes)
+        self.reads = frozenset(reads) - self.writes
+
+    @classmethod
+    def from_config(cls, operation: Dict) -> 'ResourceClaim':
+        """
+        Lê `resources: {read: [...], write: [...]}` de uma entrada de `ai_workflow_mapping`.
+
+        Fluxos sem a declaração recebem acesso exclusivo a tudo (nunca rodam junto com outro).
+        """
+        resources = operation.get('resources')
+        if not isinstance(resources, dict):
+            return cls(writes=(ALL_RESOURCES,))
+        return cls(resources.get('read', ()), resources.get('write', ()))
+
+    def conflicts(self, other: 'ResourceClaim') -> bool:
+        if ALL_RESOURCES in self.writes or ALL_RESOURCES in other.writes:
+            return True
+        return bool(self.writes & (other.reads | other.writes) or other.writes & self.reads)
+
+    def describe(self) -> str:
+        parts = [f"escreve {', '.join(sorted(self.writes))}"] if self.writes else []
+        if self.reads:
+            parts.append(f"lê {', '.join(sorted(self.reads))}")
+        return "; ".join(parts) or "nenhum recurso"
+
+
+class QueuedJob:
+    """
+    Fluxo na fila.
+    """
+
+    def __init__(self, name: str, handler: Callable[[], object], claim: ResourceClaim):
+        self.name = name
+        self.handler = handler
+        self.claim = claim
+        self.future: Future = Future()
+        self.submitted = time.monotonic()
+        self.started: Optional[float] = None
+
+
+class WorkflowJobQueue:
+    """
+    Fila FIFO de fluxos com exclusão por recurso.
+
+    Um fluxo começa quando não conflita com nenhum fluxo em execução nem com
+    nenhum fluxo anterior ainda na fila: compatíveis se adiantam, mas um
+    escritor nunca é ultrapassado por quem disputa o mesmo recurso (sem
+    inanição). Os recursos são adquiridos todos de uma vez, antes de começar
+    (sem impasse).
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Args:
+            max_workers: Fluxos executados ao mesmo tempo
+        """
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="elis-job")
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending: Deque[QueuedJob] = deque()
+        self._running: List[QueuedJob] = []
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def submit(self, name: str, handler: Callable[[], object], claim: Optional[ResourceClaim] = None) -> Future:
+        """
+        Enfileira um fluxo.
+
+        Args:
+            name: Nome exibido no estado da fila
+            handler: Função sem argumentos que executa o fluxo
+            claim: Recursos do fluxo (padrão: acesso exclusivo a tudo)
+
+        Returns:
+            Future com o retorno (ou a exceção) de `handler`
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Fila de fluxos encerrada")
+            job = QueuedJob(name, handler, claim or ResourceClaim(writes=(ALL_RESOURCES,)))
+            self._pending.append(job)
+            self._dispatch()
+        return job.future
+
+    def _dispatch(self):
+        """
+        Inicia os fluxos liberados (chamado com o lock adquirido).
+        """
+        blocked: List[QueuedJob] = []
+        for job in list(self._pending):
+            if job.future.cancelled():
+                self._pending.remove(job)  # cancelado enquanto aguardava: não bloqueia os seguintes
+                continue
+            if len(self._running) >= self.max_workers:
+                break
+            if any(job.claim.conflicts(other.claim) for other in self._running) or \
+                    any(job.claim.conflicts(other.claim) for other in blocked):
+                blocked.append(job)
+                continue
+
+            self._pending.remove(job)
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            job.started = time.monotonic()
+            self._running.append(job)
+            self._executor.submit(self._run, job)
+
+    def _run(self, job: QueuedJob):
+        try:
+            result = job.handler()
+        except BaseException as e:
+            job.future.set_exception(e)
+        else:
+            job.future.set_result(result)
+        finally:
+            with self._lock:
+                self._running.remove(job)
+                self._dispatch()
+                if not self._running and not self._pending:
+                    self._idle.notify_all()
+
+    def snapshot(self) -> Dict:
+        """
+        Estado da fila: fluxos em execução e aguardando, com os tempos.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                'running': [{'name': job.name, 'seconds': round(now - job.started, 3),
+                             'resources': job.claim.describe()} for job in self._running],
+                'pending': [{'name': job.name, 'waiting': round(now - job.submitted, 3),
+                             'resources': job.claim.describe()} for job in self._pending]
+            }
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda a fila esvaziar.
+
+        Returns:
+            True se todos os fluxos terminaram dentro do tempo limite
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._running and not self._pending, timeout)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Recusa novos fluxos e, com `wait`, aguarda os enfileirados terminarem.
+        """
+        with self._lock:
+            self._closed = True
+        if wait:
+            self.join()
+        self._executor.shutdown(wait=wait)
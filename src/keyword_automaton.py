@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Autômato de palavras-chave (Aho–Corasick)
+Encontra todas as palavras-chave de `ai_workflow_mapping` em uma única
+passada sobre a entrada do usuário.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from text_normalization import lower_text
+
+
+class KeywordAutomaton:
+    """
+    Autômato Aho–Corasick sobre um conjunto de palavras-chave.
+
+    Cada palavra-chave distinta recebe um id; `find` devolve os ids de todas as
+    palavras-chave que ocorrem como substring do texto.
+    """
+
+    def __init__(self, keywords: Iterable[str] = ()):
+        """
+        Constrói o autômato.
+
+        Args:
+            keywords: Palavras-chave (já normalizadas) a serem indexadas
+        """
+        self.keywords: List[str] = []
+        self.keyword_ids: Dict[str, int] = {}
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[int] = [-1]   # id da palavra-chave que termina no nó
+        self._dict_link: List[int] = [-1]  # próximo nó com saída na cadeia de falhas
+
+        for keyword in keywords:
+            self.add(keyword)
+        self.build()
+
+    def add(self, keyword: str) -> int:
+        """
+        Adiciona uma palavra-chave ao trie (antes de `build`).
+
+        Returns:
+            Id da palavra-chave
+        """
+        if keyword in self.keyword_ids:
+            return self.keyword_ids[keyword]
+
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(-1)
+                self._dict_link.append(-1)
+                self._goto[node][char] = next_node
+            node = next_node
+
+        keyword_id = len(self.keywords)
+        self.keywords.append(keyword)
+        self.keyword_ids[keyword] = keyword_id
+        self._output[node] = keyword_id
+        return keyword_id
+
+    def build(self):
+        """
+        Calcula os links de falha e de dicionário por busca em largura.
+        """
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+
+                fail_node = self._fail[child]
+                self._dict_link[child] = fail_node if self._output[fail_node] >= 0 else self._dict_link[fail_node]
+                queue.append(child)
+
+    def find(self, text: str) -> Set[int]:
+        """
+        Encontra todas as palavras-chave contidas no texto.
+
+        Args:
+            text: Texto (já normalizado) a ser varrido
+
+        Returns:
+            Conjunto com os ids das palavras-chave encontradas
+        """
+        found: Set[int] = set()
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        dict_link = self._dict_link
+
+        # Palavra-chave vazia está contida em qualquer texto
+        if output[0] >= 0:
+            found.add(output[0])
+
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            match = node if output[node] >= 0 else dict_link[node]
+            while match > 0:
+                keyword_id = output[match]
+                if keyword_id in found:
+                    # O restante da cadeia já foi coletado nesta mesma passada
+                    break
+                found.add(keyword_id)
+                match = dict_link[match]
+
+        return found
+
+
+def compile_category_segment(category: Dict, normalize: Callable[[str], str] = lower_text) -> Dict:
+    """
+    Normaliza as palavras-chave das operações de uma categoria.
+
+    Args:
+        category: Operações de uma categoria de `ai_workflow_mapping`
+        normalize: Normalização do texto (ver `text_normalization.text_normalizer`)
+
+    Returns:
+        Segmento compilado, com a configuração de origem para comparação em recargas
+    """
+    return {
+        'source': category,
+        'operations': [
+            (operation_name, operation, [normalize(keyword) for keyword in operation.get('keywords', [])])
+            for operation_name, operation in category.items()
+        ]
+    }
+
+
+class WorkflowKeywordIndex:
+    """
+    Índice das operações de `ai_workflow_mapping` por palavra-chave.
+
+    Mantém as operações na ordem da configuração (categoria, operação), de modo
+    que a primeira correspondência e a ordenação por relevância sigam as mesmas
+    regras da varredura linear.
+    """
+
+    def __init__(self, workflow_mapping: Dict, previous: Optional['WorkflowKeywordIndex'] = None,
+                 normalize: Callable[[str], str] = lower_text):
+        """
+        Compila o índice.
+
+        Args:
+            workflow_mapping: Seção `ai_workflow_mapping` da configuração
+            previous: Índice anterior; categorias com configuração idêntica reaproveitam
+                      as palavras-chave já normalizadas em vez de serem recompiladas
+            normalize: Normalização de palavras-chave e entradas (`lower_text` ou `fold_text`)
+        """
+        self.normalize = normalize
+        if previous is not None and getattr(previous, 'normalize', None) is not normalize:
+            previous = None  # palavras-chave normalizadas de outra forma: recompilar tudo
+        self.operations: List[Tuple[str, str, Dict]] = []
+        postings: Dict[str, List[int]] = {}
+
+        # categoria -> segmento compilado; `recompiled` lista as categorias (re)compiladas
+        self.segments: Dict[str, Dict] = {}
+        self.recompiled: List[str] = []
+
+        for category_name, category in workflow_mapping.items():
+            segment = previous.segments.get(category_name) if previous else None
+            if segment is None or segment['source'] != category:
+                segment = compile_category_segment(category, normalize)
+                self.recompiled.append(category_name)
+            self.segments[category_name] = segment
+
+            for operation_name, operation, keywords in segment['operations']:
+                operation_index = len(self.operations)
+                self.operations.append((category_name, operation_name, operation))
+
+                for keyword in keywords:
+                    postings.setdefault(keyword, []).append(operation_index)
+
+        self.automaton = KeywordAutomaton(postings)
+        # id da palavra-chave -> operações que a declaram (com repetições)
+        self.postings: List[List[int]] = [postings[keyword] for keyword in self.automaton.keywords]
+
+    def first_match(self, user_input: str, priority: Optional[Sequence[int]] = None) -> int:
+        """
+        Retorna o índice da primeira operação (na ordem da configuração, ou
+        pela prioridade informada) com alguma palavra-chave contida na entrada, ou -1.
+
+        Args:
+            user_input: Entrada do usuário
+            priority: Posição de cada operação (menor vence), ex.: fluxos mais usados primeiro
+        """
+        found = self.automaton.find(self.normalize(user_input))
+        if not found:
+            return -1
+        if priority is None:
+            return min(self.postings[keyword_id][0] for keyword_id in found)
+        return min((operation_index for keyword_id in found for operation_index in self.postings[keyword_id]),
+                   key=priority.__getitem__)
+
+    def relevance(self, user_input: str) -> Dict[int, int]:
+        """
+        Conta quantas palavras-chave de cada operação aparecem na entrada.
+
+        Returns:
+            Dicionário {índice da operação: relevância}
+        """
+        counts: Dict[int, int] = {}
+        for keyword_id in self.automaton.find(self.normalize(user_input)):
+            for operation_index in self.postings[keyword_id]:
+                counts[operation_index] = counts.get(operation_index, 0) + 1
+        return counts
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Análise dos logs de automação
+Taxa de sucesso, falhas por fluxo e horários de pico a partir de
+`workflow-automation.log` e `github-updates.log`, com um pipeline de
+geradores (linhas -> entradas -> filtro -> agregados) em memória constante.
+Arquivos grandes são divididos em faixas de bytes processadas em paralelo.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from log_stats import parse_log_line
+
+ANALYTICS_LOG_NAMES = ("workflow-automation.log", "github-updates.log")
+# Tamanho mínimo de cada faixa: arquivos menores são lidos em um único processo
+DEFAULT_SHARD_BYTES = 16 * 1024 * 1024
+# Largura máxima das barras do histograma de horários
+HOUR_BAR_WIDTH = 30
+
+
+def read_lines(path: Path, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Lê as linhas que começam na faixa de bytes [start, end).
+
+    Uma linha que cruza `start` pertence à faixa anterior; a que cruza `end`
+    é lida até o fim. Faixas contíguas cobrem cada linha exatamente uma vez.
+
+    Args:
+        path: Arquivo de log
+        start: Offset inicial
+        end: Offset final (None: fim do arquivo)
+
+    Yields:
+        Linhas em bytes (com a quebra de linha)
+    """
+    with open(path, 'rb') as f:
+        if start > 0:
+            f.seek(start - 1)
+            if f.read(1) != b"\n":
+                f.readline()  # resto da linha iniciada na faixa anterior
+        position = f.tell()
+        for line in f:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+            yield line
+
+
+def parse_entries(lines: Iterable[bytes]) -> Iterator[Optional[Dict]]:
+    """
+    Interpreta cada linha (None para linhas fora do formato do log).
+    """
+    for line in lines:
+        yield parse_log_line(line.decode('utf-8', errors='replace').rstrip("\r\n"))
+
+
+class LogFilter:
+    """
+    Filtro de entradas por período, nível e fluxo.
+    """
+
+    def __init__(self, since: Optional[str] = None, until: Optional[str] = None,
+                 levels: Optional[Sequence[str]] = None, workflow: Optional[str] = None):
+        """
+        Args:
+            since: Início do período (`AAAA-MM-DD` ou `AAAA-MM-DD HH:MM[:SS]`)
+            until: Fim do período, inclusivo, no mesmo formato
+            levels: Níveis aceitos (ex.: ERROR, WARNING)
+            workflow: Nome da operação (ex.: commit)
+        """
+        self.since = since
+        self.until = until
+        self.levels = {level.upper() for level in levels} if levels else None
+        self.workflow = workflow
+
+    def matches(self, entry: Dict) -> bool:
+        timestamp = entry['timestamp']
+        if self.since and timestamp < self.since:
+            return False
+        # Comparação pelo prefixo: "2026-10-18" inclui o dia inteiro
+        if self.until and timestamp[:len(self.until)] > self.until:
+            return False
+        if self.levels is not None and entry['level'] not in self.levels:
+            return False
+        return self.workflow is None or entry['workflow'] == self.workflow
+
+
+def filter_entries(entries: Iterable[Optional[Dict]], log_filter: Optional[LogFilter]) -> Iterator[Optional[Dict]]:
+    """
+    Mantém as entradas aceitas pelo filtro (linhas fora do formato passam, para a contagem).
+    """
+    if log_filter is None:
+        yield from entries
+        return
+    for entry in entries:
+        if entry is None or log_filter.matches(entry):
+            yield entry
+
+
+class LogAggregate:
+    """
+    Agregados de um trecho de log; trechos processados separadamente são combinados com `merge`.
+    """
+
+    def __init__(self):
+        self.entries = 0
+        self.unparsed = 0
+        self.first: Optional[str] = None
+        self.last: Optional[str] = None
+        self.levels: Counter = Counter()
+        self.hours: Counter = Counter()
+        self.days: Counter = Counter()
+        # fluxo -> Counter de eventos ('found', 'success', 'failure')
+        self.workflows: Dict[str, Counter] = {}
+
+    def add(self, entry: Optional[Dict]):
+        if entry is None:
+            self.unparsed += 1
+            return
+
+        self.entries += 1
+        timestamp = entry['timestamp']
+        if self.first is None or timestamp < self.first:
+            self.first = timestamp
+        if self.last is None or timestamp > self.last:
+            self.last = timestamp
+        self.levels[entry['level']] += 1
+        self.hours[entry['hour']] += 1
+        self.days[entry['day']] += 1
+        if entry['workflow']:
+            self.workflows.setdefault(entry['workflow'], Counter())[entry['event']] += 1
+
+    def consume(self, entries: Iterable[Optional[Dict]]) -> 'LogAggregate':
+        for entry in entries:
+            self.add(entry)
+        return self
+
+    def merge(self, other: 'LogAggregate') -> 'LogAggregate':
+        self.entries += other.entries
+        self.unparsed += other.unparsed
+        self.first = min(filter(None, (self.first, other.first)), default=None)
+        self.last = max(filter(None, (self.last, other.last)), default=None)
+        self.levels.update(other.levels)
+        self.hours.update(other.hours)
+        self.days.update(other.days)
+        for workflow, events in other.workflows.items():
+            self.workflows.setdefault(workflow, Counter()).update(events)
+        return self
+
+    def to_dict(self) -> Dict:
+        """
+        Relatório serializável (ordenado por falhas e uso).
+        """
+        workflows = {}
+        for workflow, events in sorted(self.workflows.items(),
+                                       key=lambda item: (-item[1]['failure'], -sum(item[1].values()), item[0])):
+            finished = events['success'] + events['failure']
+            workflows[workflow] = {
+                'found': events['found'],
+                'success': events['success'],
+                'failure': events['failure'],
+                'success_rate': round(events['success'] / finished, 4) if finished else None
+            }
+
+        success = sum(events['success'] for events in self.workflows.values())
+        failure = sum(events['failure'] for events in self.workflows.values())
+        return {
+            'entries': self.entries,
+            'unparsed': self.unparsed,
+            'first': self.first,
+            'last': self.last,
+            'success': success,
+            'failure': failure,
+            'success_rate': round(success / (success + failure), 4) if success + failure else None,
+            'levels': dict(self.levels.most_common()),
+            'hours': {f"{hour:02d}": self.hours[hour] for hour in sorted(self.hours)},
+            'days': {day: self.days[day] for day in sorted(self.days)},
+            'workflows': workflows
+        }
+
+
+def scan_shard(path: Path, start: int, end: Optional[int], log_filter: Optional[LogFilter] = None) -> LogAggregate:
+    """
+    Agrega uma faixa de bytes de um arquivo (executado também nos processos auxiliares).
+    """
+    return LogAggregate().consume(filter_entries(parse_entries(read_lines(path, start, end)), log_filter))
+
+
+def plan_shards(size: int, workers: int, shard_bytes: int = DEFAULT_SHARD_BYTES) -> List[Tuple[int, int]]:
+    """
+    Divide um arquivo em até `workers` faixas de pelo menos `shard_bytes` bytes.
+    """
+    count = max(1, min(workers, size // max(1, shard_bytes)))
+    return [(size * index // count, size * (index + 1) // count) for index in range(count)]
+
+
+def analyze_logs(paths: Sequence[Path], log_filter: Optional[LogFilter] = None, workers: int = 1,
+                 shard_bytes: int = DEFAULT_SHARD_BYTES) -> Dict:
+    """
+    Analisa um ou mais arquivos de log.
+
+    Args:
+        paths: Arquivos de log (os inexistentes são ignorados)
+        log_filter: Filtro de período, nível e fluxo
+        workers: Processos usados quando há mais de uma faixa
+        shard_bytes: Tamanho mínimo de cada faixa
+
+    Returns:
+        Relatório de `LogAggregate.to_dict` com a lista de arquivos analisados (`files`)
+    """
+    files = []
+    shards = []
+    for path in paths:
+        path = Path(path)
+        try:
+            size = path.stat().st_size
+        except OSError:
+            continue
+        files.append({'path': str(path), 'bytes': size})
+        # A última faixa vai até o fim real do arquivo (que pode crescer durante a leitura)
+        planned = plan_shards(size, workers, shard_bytes)
+        shards.extend((path, start, end if index < len(planned) - 1 else None)
+                      for index, (start, end) in enumerate(planned))
+
+    total = LogAggregate()
+    if len(shards) > 1 and workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as executor:
+            futures = [executor.submit(scan_shard, path, start, end, log_filter) for path, start, end in shards]
+            for future in futures:
+                total.merge(future.result())
+    else:
+        for path, start, end in shards:
+            total.merge(scan_shard(path, start, end, log_filter))
+
+    report = total.to_dict()
+    report['files'] = files
+    return report
+
+
+def default_log_paths(project_root: Path) -> List[Path]:
+    """
+    Logs do projeto, incluindo os rotacionados (`.1`, `.2`, ...), do mais antigo ao atual.
+    """
+    paths = []
+    for name in ANALYTICS_LOG_NAMES:
+        rotated = [path for path in Path(project_root).glob(f"{name}.*") if path.suffix[1:].isdigit()]
+        paths.extend(sorted(rotated, key=lambda path: -int(path.suffix[1:])))
+        paths.append(Path(project_root) / name)
+    return [path for path in paths if path.exists()]
+
+
+def format_report(report: Dict) -> str:
+    """
+    Relatório em formato de tabela para o console.
+    """
+    lines = ["📊 ANÁLISE DOS LOGS", "=" * 50]
+    if not report['files']:
+        lines.append("📝 Nenhum log encontrado")
+        return "\n".join(lines)
+
+    for file_info in report['files']:
+        lines.append(f"📄 {file_info['path']} ({file_info['bytes'] / 1024:.1f} KB)")
+    if report['first']:
+        lines.append(f"🗓️ Período: {report['first']} → {report['last']}")
+    lines.append(f"📝 Entradas: {report['entries']} (fora do formato: {report['unparsed']})")
+    if report['levels']:
+        lines.append("   " + " | ".join(f"{level}: {count}" for level, count in report['levels'].items()))
+
+    if report['success_rate'] is not None:
+        lines.append(f"✅ Execuções: {report['success']} sucesso(s), {report['failure']} falha(s) "
+                     f"({report['success_rate']:.0%} de sucesso)")
+
+    if report['workflows']:
+        width = max(len("Fluxo"), *(len(name) for name in report['workflows']))
+        lines.append("")
+        lines.append(f"{'Fluxo':<{width}}  {'Encontrado':>10}  {'Sucesso':>7}  {'Falha':>5}  {'Taxa':>5}")
+        for name, stats in report['workflows'].items():
+            rate = f"{stats['success_rate']:.0%}" if stats['success_rate'] is not None else "-"
+            lines.append(f"{name:<{width}}  {stats['found']:>10}  {stats['success']:>7}  {stats['failure']:>5}  {rate:>5}")
+
+    if report['hours']:
+        peak = max(report['hours'].values())
+        lines.append("")
+        lines.append("🕐 Entradas por hora:")
+        for hour, count in report['hours'].items():
+            bar = "█" * max(1, round(count / peak * HOUR_BAR_WIDTH))
+            lines.append(f"   {hour}h {bar} {count}")
+    return "\n".join(lines)
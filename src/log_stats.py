@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Estatísticas indexadas do log de automação
+Varre `workflow-automation.log` em streaming e persiste um pequeno índice
+(offset em bytes + contadores) para que chamadas repetidas de `--status`
+processem apenas os bytes acrescentados desde a última execução. Os
+contadores são totais: a rotação do log só reinicia o offset.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import copy
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+INDEX_VERSION = 3
+# Bytes iniciais usados para detectar que o log foi rotacionado ou recriado
+FINGERPRINT_BYTES = 256
+
+LOG_LINE = re.compile(r"^\[(\d{4}-\d{2}-\d{2}) (\d{2}):\d{2}:\d{2}\] \[([A-Z]+)\] (.*)$")
+# (padrão, evento): o grupo 1 é o nome do fluxo
+WORKFLOW_PATTERNS = (
+    (re.compile(r"^Fluxo encontrado: [^.\s]+\.(\S+)"), 'found'),
+    (re.compile(r"^Fluxo (\S+) executado"), 'success'),
+    (re.compile(r"^Erro na execução do fluxo (\S+?):"), 'failure'),
+    (re.compile(r"^Pré-ações de (\S+) falharam"), 'failure'),
+)
+
+
+def parse_log_line(line: str) -> Optional[Dict]:
+    """
+    Interpreta uma linha no formato `[AAAA-MM-DD HH:MM:SS] [NÍVEL] mensagem`.
+
+    Args:
+        line: Linha do log (sem a quebra de linha)
+
+    Returns:
+        Dicionário com `day`, `hour`, `timestamp`, `level`, `message`, `workflow` e
+        `event` ('found', 'success' ou 'failure'; None sem fluxo), ou None se fora do formato
+    """
+    match = LOG_LINE.match(line)
+    if not match:
+        return None
+
+    day, hour, level, message = match.groups()
+    workflow = event = None
+    for pattern, pattern_event in WORKFLOW_PATTERNS:
+        workflow_match = pattern.match(message)
+        if workflow_match:
+            workflow, event = workflow_match.group(1), pattern_event
+            break
+
+    return {'day': day, 'hour': int(hour), 'timestamp': line[1:20], 'level': level, 'message': message,
+            'workflow': workflow, 'event': event}
+
+
+class LogStatsIndex:
+    """
+    Índice incremental de estatísticas de um arquivo de log.
+    """
+
+    def __init__(self, log_file: Path, index_file: Optional[Path] = None):
+        """
+        Args:
+            log_file: Arquivo de log a ser indexado
+            index_file: Arquivo do índice (padrão: `<log>.idx.json`)
+        """
+        self.log_file = Path(log_file)
+        self.index_file = Path(index_file) if index_file else Path(f"{self.log_file}.idx.json")
+
+    @staticmethod
+    def _empty_counters() -> Dict:
+        return {'entries': 0, 'unparsed': 0, 'levels': {}, 'workflows': {}, 'days': {}}
+
+    @classmethod
+    def _empty_index(cls) -> Dict:
+        index = {'version': INDEX_VERSION, 'offset': 0, 'fingerprint': hashlib.sha1(b"").hexdigest(),
+                 'rotations': 0, 'rotated': cls._empty_counters()}
+        index.update(cls._empty_counters())
+        return index
+
+    def _rotate_index(self, index: Dict) -> Dict:
+        """
+        Novo índice para um log rotacionado ou recriado, mantendo os totais.
+
+        Antes de reiniciar o offset, as linhas do arquivo anterior ainda não
+        indexadas são lidas de `<log>.1`, se ele for o arquivo rotacionado;
+        `rotated` guarda os totais de todos os arquivos anteriores.
+        """
+        previous = Path(f"{self.log_file}.1")
+        try:
+            with open(previous, 'rb') as f:
+                if (os.fstat(f.fileno()).st_size >= index['offset']
+                        and self._fingerprint(f, index['offset']) == index['fingerprint']):
+                    f.seek(index['offset'])
+                    self._scan(f, index)
+        except OSError:
+            pass
+
+        rotated = self._empty_index()
+        rotated['rotations'] = index.get('rotations', 0) + 1
+        for name in self._empty_counters():
+            rotated[name] = index[name]
+            rotated['rotated'][name] = copy.deepcopy(index[name])
+        return rotated
+
+    def _fingerprint(self, f, offset: int) -> str:
+        """
+        Hash dos primeiros bytes já indexados do log, para detectar rotação.
+        """
+        f.seek(0)
+        return hashlib.sha1(f.read(min(offset, FINGERPRINT_BYTES))).hexdigest()
+
+    def _load_index(self) -> Dict:
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == INDEX_VERSION:
+                return index
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            pass
+        return self._empty_index()
+
+    def _save_index(self, index: Dict):
+        """
+        Grava o índice de forma atômica (arquivo temporário + rename).
+        """
+        temp_file = Path(f"{self.index_file}.tmp")
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False)
+            os.replace(temp_file, self.index_file)
+        except OSError as e:
+            print(f"⚠️ Erro ao gravar índice do log: {e}")
+
+    def update(self) -> Dict:
+        """
+        Atualiza o índice com as linhas acrescentadas desde a última chamada.
+
+        Returns:
+            Índice atualizado (offset e contadores)
+        """
+        index = self._load_index()
+        if not self.log_file.exists():
+            return index
+
+        with open(self.log_file, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+
+            # Log truncado, rotacionado ou recriado: recomeçar do início do arquivo novo
+            rotated = size < index['offset'] or self._fingerprint(f, index['offset']) != index['fingerprint']
+            if rotated:
+                index = self._rotate_index(index)
+
+            if size > index['offset']:
+                f.seek(index['offset'])
+                self._scan(f, index)
+                index['fingerprint'] = self._fingerprint(f, index['offset'])
+            elif not rotated:
+                return index
+
+        self._save_index(index)
+        return index
+
+    @staticmethod
+    def _scan(f, index: Dict):
+        """
+        Contabiliza as linhas completas a partir da posição atual de `f` e avança o offset.
+        """
+        offset = index['offset']
+        levels = index['levels']
+        workflows = index['workflows']
+        days = index['days']
+
+        for raw_line in f:
+            if not raw_line.endswith(b"\n"):
+                # Linha ainda sendo escrita: fica para a próxima varredura
+                break
+            offset += len(raw_line)
+
+            entry = parse_log_line(raw_line.decode('utf-8', errors='replace').rstrip("\r\n"))
+            if entry is None:
+                index['unparsed'] += 1
+                continue
+
+            index['entries'] += 1
+            levels[entry['level']] = levels.get(entry['level'], 0) + 1
+            days[entry['day']] = days.get(entry['day'], 0) + 1
+            if entry['workflow']:
+                workflows[entry['workflow']] = workflows.get(entry['workflow'], 0) + 1
+
+        index['offset'] = offset
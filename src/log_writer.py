@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Escritor de log em segundo plano
+Mantém o arquivo de log aberto, agrupa as gravações em uma thread dedicada
+e faz a rotação por tamanho definida em `notification-config.json`.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import atexit
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+# Quantidade máxima de linhas gravadas por lote
+MAX_BATCH_LINES = 512
+
+# Escritores compartilhados, por caminho absoluto do log
+_shared_writers: Dict[Path, 'BackgroundLogWriter'] = {}
+_shared_lock = threading.Lock()
+
+
+class BackgroundLogWriter:
+    """
+    Escritor de log baseado em fila, com uma thread persistente.
+
+    As mensagens são enfileiradas por `write` e gravadas em lotes; `flush`
+    aguarda a gravação de tudo o que já foi enfileirado e `close` é chamado
+    automaticamente na saída do interpretador (e removido do atexit quando
+    chamado antes). Para um mesmo arquivo use `shared_log_writer`, que
+    reaproveita a thread em vez de criar uma por instância.
+    """
+
+    _STOP = object()
+
+    def __init__(self, log_file: Path, max_bytes: int = 0, backup_count: int = 3):
+        """
+        Inicializa o escritor (a thread só é iniciada na primeira gravação).
+
+        Args:
+            log_file: Caminho do arquivo de log
+            max_bytes: Tamanho máximo antes da rotação (0 desativa a rotação)
+            backup_count: Quantidade de arquivos rotacionados mantidos (.1, .2, ...)
+        """
+        self.log_file = Path(log_file)
+        self.max_bytes = max_bytes
+        self.backup_count = max(1, backup_count)
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stream = None
+
+        atexit.register(self.close)
+
+    def write(self, line: str):
+        """
+        Enfileira uma linha de log (já terminada em nova linha).
+        """
+        if self._closed:
+            return
+        self._ensure_thread()
+        self._queue.put(line)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda a gravação de todas as linhas enfileiradas até agora.
+
+        Returns:
+            True se o lote foi gravado dentro do tempo limite
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        """
+        Grava as linhas pendentes, encerra a thread e fecha o arquivo.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        atexit.unregister(self.close)
+        with _shared_lock:
+            if _shared_writers.get(self.log_file.resolve()) is self:
+                del _shared_writers[self.log_file.resolve()]
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+
+    def _ensure_thread(self):
+        """
+        Inicia a thread de gravação sob demanda.
+        """
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="elis-log-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        """
+        Laço da thread: drena a fila em lotes e grava cada lote de uma vez.
+        """
+        running = True
+        while running:
+            items = [self._queue.get()]
+            while len(items) < MAX_BATCH_LINES:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            events = []
+            for item in items:
+                if item is self._STOP:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    events.append(item)
+                else:
+                    lines.append(item)
+
+            if lines:
+                self._write_batch("".join(lines))
+            for event in events:
+                event.set()
+
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _write_batch(self, data: str):
+        """
+        Grava um lote no arquivo, rotacionando antes se o limite for excedido.
+        """
+        try:
+            if self._stream is None:
+                self._stream = open(self.log_file, 'a', encoding='utf-8')
+
+            if self.max_bytes > 0:
+                size = self._stream.tell()
+                if size > 0 and size + len(data.encode('utf-8')) > self.max_bytes:
+                    self._rotate()
+
+            self._stream.write(data)
+            self._stream.flush()
+        except Exception as e:
+            print(f"⚠️ Erro ao escrever log: {e}")
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+
+    def _rotate(self):
+        """
+        Rotaciona o log: arquivo.log -> arquivo.log.1 -> arquivo.log.2 ...
+        """
+        self._stream.close()
+        self._stream = None
+
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.log_file}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.log_file}.{index + 1}")
+        if self.log_file.exists():
+            os.replace(self.log_file, f"{self.log_file}.1")
+
+        self._stream = open(self.log_file, 'a', encoding='utf-8')
+
+
+def shared_log_writer(log_file: Path, max_bytes: int = 0, backup_count: int = 3) -> BackgroundLogWriter:
+    """
+    Escritor único por arquivo de log: instâncias do assistente que gravam no
+    mesmo log compartilham a thread e o arquivo aberto.
+
+    Args:
+        log_file: Caminho do arquivo de log
+        max_bytes: Tamanho máximo antes da rotação (vale o do primeiro a abrir)
+        backup_count: Quantidade de arquivos rotacionados mantidos
+
+    Returns:
+        Escritor aberto para o arquivo (criado na primeira chamada ou após `close`)
+    """
+    key = Path(log_file).resolve()
+    with _shared_lock:
+        writer = _shared_writers.get(key)
+        if writer is None or writer._closed:
+            writer = BackgroundLogWriter(log_file, max_bytes=max_bytes, backup_count=backup_count)
+            _shared_writers[key] = writer
+        return writer
@@ -15,6 +15,8 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
+from workspace_index import WorkspaceIndex
+
 def main():
     """
     Função principal do projeto ELIS-V1
@@ -67,19 +69,26 @@ def check_project_structure():
         "README.md"
     ]
     
+    # Índice compartilhado da árvore: só as pastas alteradas desde a última execução são relidas
+    index = WorkspaceIndex(project_root)
+    index.update()
+    missing = set(index.missing([f"{directory}/" for directory in essential_dirs] + essential_files))
+    
     for directory in essential_dirs:
-        dir_path = project_root / directory
-        if dir_path.exists():
+        if f"{directory}/" not in missing:
             print(f"   ✅ {directory}/")
         else:
             print(f"   ❌ {directory}/ (não encontrado)")
     
     for file in essential_files:
-        file_path = project_root / file
-        if file_path.exists():
+        if file not in missing:
             print(f"   ✅ {file}")
         else:
             print(f"   ❌ {file} (não encontrado)")
+    
+    temp_files = index.temp_files()
+    if temp_files:
+        print(f"   🧹 {len(temp_files)} arquivo(s) temporário(s)/cache (limpe com: python src/workspace_index.py --action clean)")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Tarefas periódicas de monitoramento
+Verificação do remoto, lembrete de commits sem push, resumo diário e
+relatório semanal, agendados pelo `JobScheduler` conforme o
+`notification-config.json` (substitui o laço do `start-github-monitor.bat`).
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional
+
+from git_monitor import STATE_FILE_NAME, GitMonitor, analyze_task_progress, open_notification_store
+from notification_store import TIMESTAMP_FORMAT
+from scheduler import DailySchedule, IntervalSchedule, JobScheduler
+
+DEFAULT_CHECK_INTERVAL_MINUTES = 5
+DEFAULT_REMINDER_INTERVAL_MINUTES = 30
+DEFAULT_SUMMARY_TIME = "18:00"
+# Relatório semanal: sexta-feira, no horário do resumo diário
+WEEKLY_REPORT_WEEKDAY = 4
+
+
+class MonitorJobs:
+    """
+    Tarefas de monitoramento sobre um único `GitMonitor` (acesso serializado).
+    """
+
+    def __init__(self, project_root: Path, notification_config: Dict, monitor: Optional[GitMonitor] = None):
+        """
+        Args:
+            project_root: Repositório monitorado
+            notification_config: Conteúdo do `notification-config.json`
+            monitor: Monitor já configurado (padrão: um novo, com o banco de notificações do projeto)
+        """
+        self.project_root = Path(project_root)
+        self.config = notification_config
+        monitoring = notification_config.get('monitoring', {})
+
+        if monitor is None:
+            store = open_notification_store(self.project_root, monitoring)
+            monitor = GitMonitor(self.project_root, state_file=self.project_root / STATE_FILE_NAME,
+                                 notification_store=store, auto_fetch=monitoring.get('auto_fetch', True))
+        self.monitor = monitor
+        # O leitor `git cat-file` do monitor não é compartilhável entre threads
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.monitor.close()
+
+    def check_remote(self):
+        """
+        Busca commits novos no remoto (notifica se houver).
+        """
+        with self._lock:
+            self.monitor.check()
+
+    def remind_unpushed(self):
+        """
+        Lembra dos commits locais ainda não enviados.
+        """
+        with self._lock:
+            status = self.monitor.status()
+            if status['unpushed']:
+                self.monitor.create_notification(
+                    "Commits Pendentes",
+                    f"{status['unpushed']} commit(s) aguardando push na branch {status['branch'] or 'HEAD'}",
+                    "REMINDER")
+
+    def daily_summary(self):
+        """
+        Resumo do dia: notificações por tipo e situação do repositório.
+        """
+        today = datetime.now().strftime('%Y-%m-%d')
+        include_statistics = self.config.get('reports', {}).get('daily_summary', {}).get('include_statistics', True)
+
+        with self._lock:
+            parts = []
+            if include_statistics:
+                counts = self.monitor.notification_store.count_by_type(since=today)
+                parts.append(", ".join(f"{count} {kind}" for kind, count in counts.items()) or "nenhuma notificação")
+            status = self.monitor.status()
+            parts.append(f"{status['local_changes']} alteração(ões) local(is), {status['unpushed']} commit(s) sem push")
+            self.monitor.create_notification("Resumo Diario", f"{today}: {' | '.join(parts)}", "SUMMARY")
+
+    def weekly_report(self):
+        """
+        Relatório da semana: commits, autores e progresso de tarefas.
+        """
+        since = datetime.now() - timedelta(days=7)
+        with self._lock:
+            commits = self.monitor.recent_commits(since)
+            authors = Counter(commit['author'] for commit in commits)
+            progress = analyze_task_progress(commits)
+
+            message = f"{len(commits)} commit(s) desde {since.strftime(TIMESTAMP_FORMAT)}"
+            if authors:
+                message += " | Autores: " + ", ".join(f"{author} ({count})" for author, count in authors.most_common())
+            if progress:
+                message += " | Progresso: " + ", ".join(f"{category} ({count})" for category, count in progress.items())
+            self.monitor.create_notification("Relatorio Semanal", message, "REPORT")
+
+    def register(self, scheduler: JobScheduler) -> int:
+        """
+        Agenda as tarefas habilitadas no `notification-config.json`.
+
+        Returns:
+            Quantidade de tarefas agendadas
+        """
+        monitoring = self.config.get('monitoring', {})
+        notifications = self.config.get('notifications', {})
+        reports = self.config.get('reports', {})
+        summary_time = reports.get('daily_summary', {}).get('time', DEFAULT_SUMMARY_TIME)
+        count = 0
+
+        if monitoring.get('enabled', True):
+            minutes = monitoring.get('check_interval_minutes', DEFAULT_CHECK_INTERVAL_MINUTES)
+            scheduler.add('monitor_check', self.check_remote, IntervalSchedule(minutes * 60), run_at_start=True)
+            count += 1
+
+        reminder = notifications.get('unpushed_commits', {})
+        if reminder.get('enabled', False):
+            minutes = reminder.get('reminder_interval_minutes', DEFAULT_REMINDER_INTERVAL_MINUTES)
+            scheduler.add('unpushed_reminder', self.remind_unpushed, IntervalSchedule(minutes * 60))
+            count += 1
+
+        if reports.get('daily_summary', {}).get('enabled', False):
+            scheduler.add('daily_summary', self.daily_summary, DailySchedule(summary_time))
+            count += 1
+
+        if reports.get('activity_tracking', {}).get('generate_weekly_report', False):
+            scheduler.add('weekly_report', self.weekly_report, DailySchedule(summary_time, WEEKLY_REPORT_WEEKDAY))
+            count += 1
+
+        return count
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Armazenamento de notificações
+Substitui o `notifications.txt` (um JSON por linha, lido por inteiro a cada
+consulta) por um banco SQLite indexado, com consultas paginadas por tipo,
+período e estado de leitura, retenção limitada e importação do arquivo texto.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+NOTIFICATION_DB_NAME = "notifications.db"
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+DEFAULT_PAGE_SIZE = 20
+# Retenção aplicada a cada N inserções (as consultas de limpeza usam os índices)
+RETENTION_EVERY = 100
+# Linhas do arquivo legado gravadas por transação na importação (memória constante)
+IMPORT_BATCH_ROWS = 5000
+# Tamanho de `YYYY-MM-DD`: um `until` só com a data inclui o dia inteiro
+DATE_ONLY_LENGTH = len('YYYY-MM-DD')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notifications (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    title TEXT NOT NULL,
+    message TEXT NOT NULL,
+    type TEXT NOT NULL,
+    read INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_notifications_time ON notifications (timestamp, id);
+CREATE INDEX IF NOT EXISTS idx_notifications_type ON notifications (type, timestamp, id);
+CREATE INDEX IF NOT EXISTS idx_notifications_read ON notifications (read, timestamp, id);
+CREATE TABLE IF NOT EXISTS imports (
+    path TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL
+);
+"""
+
+
+def _decode_line(raw: bytes) -> str:
+    """
+    Decodifica uma linha do arquivo legado (o PowerShell 5 grava em ANSI).
+    """
+    try:
+        return raw.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return raw.decode('cp1252', errors='replace')
+
+
+class NotificationStore:
+    """
+    Notificações em SQLite, da mais recente para a mais antiga.
+
+    As páginas usam cursor (`timestamp`, `id`) em vez de OFFSET: cada página
+    custa o mesmo, independentemente de quantas notificações existam.
+    """
+
+    def __init__(self, db_path: Path, max_entries: Optional[int] = None,
+                 retention_days: Optional[float] = None):
+        """
+        Args:
+            db_path: Arquivo do banco (criado se não existir)
+            max_entries: Quantidade máxima de notificações mantidas (None: sem limite)
+            retention_days: Idade máxima das notificações em dias (None: sem limite)
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._inserts = 0
+
+        self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict:
+        # Mesmas chaves do formato legado, mais `id` e `read`
+        return {
+            'id': row['id'],
+            'Timestamp': row['timestamp'],
+            'Title': row['title'],
+            'Message': row['message'],
+            'Type': row['type'],
+            'read': bool(row['read'])
+        }
+
+    def add(self, title: str, message: str, notification_type: str = "INFO",
+            timestamp: Optional[str] = None) -> Dict:
+        """
+        Registra uma notificação.
+
+        Args:
+            title: Título
+            message: Mensagem
+            notification_type: Tipo (INFO, UPDATE, PROGRESS, SUCCESS, ERROR...)
+            timestamp: Horário no formato `YYYY-MM-DD HH:MM:SS` (padrão: agora)
+
+        Returns:
+            Notificação registrada
+        """
+        timestamp = timestamp or datetime.now().strftime(TIMESTAMP_FORMAT)
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO notifications (timestamp, title, message, type) VALUES (?, ?, ?, ?)",
+                (timestamp, title, message, notification_type))
+            self._inserts += 1
+            if self._inserts % RETENTION_EVERY == 1:
+                self._apply_retention()
+        return {'id': cursor.lastrowid, 'Timestamp': timestamp, 'Title': title,
+                'Message': message, 'Type': notification_type, 'read': False}
+
+    @staticmethod
+    def _filters(notification_type: Optional[str], since: Optional[str], until: Optional[str],
+                 read: Optional[bool]) -> Tuple[List[str], List]:
+        clauses, params = [], []
+        if notification_type is not None:
+            clauses.append("type = ?")
+            params.append(notification_type)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            if len(until) == DATE_ONLY_LENGTH:
+                until += " 23:59:59"
+            clauses.append("timestamp <= ?")
+            params.append(until)
+        if read is not None:
+            clauses.append("read = ?")
+            params.append(int(read))
+        return clauses, params
+
+    def query(self, notification_type: Optional[str] = None, since: Optional[str] = None,
+              until: Optional[str] = None, read: Optional[bool] = None,
+              limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Dict:
+        """
+        Consulta uma página de notificações, da mais recente para a mais antiga.
+
+        Args:
+            notification_type: Filtra pelo tipo
+            since: Horário mínimo (inclusive, `YYYY-MM-DD[ HH:MM:SS]`)
+            until: Horário máximo (inclusive; só a data inclui o dia inteiro)
+            read: Filtra por lidas (True) ou não lidas (False)
+            limit: Tamanho da página
+            cursor: `next_cursor` da página anterior
+
+        Returns:
+            Dicionário com `notifications` e `next_cursor` (None na última página)
+        """
+        clauses, params = self._filters(notification_type, since, until, read)
+        if cursor:
+            cursor_timestamp, _, cursor_id = cursor.rpartition('|')
+            clauses.append("(timestamp < ? OR (timestamp = ? AND id < ?))")
+            params.extend((cursor_timestamp, cursor_timestamp, int(cursor_id)))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT * FROM notifications {where} ORDER BY timestamp DESC, id DESC LIMIT ?"
+        with self._lock:
+            rows = self._connection.execute(sql, (*params, limit + 1)).fetchall()
+
+        notifications = [self._to_dict(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = notifications[-1]
+            next_cursor = f"{last['Timestamp']}|{last['id']}"
+        return {'notifications': notifications, 'next_cursor': next_cursor}
+
+    def count(self, notification_type: Optional[str] = None, since: Optional[str] = None,
+              until: Optional[str] = None, read: Optional[bool] = None) -> int:
+        """
+        Quantidade de notificações que atendem aos filtros de `query()`.
+        """
+        clauses, params = self._filters(notification_type, since, until, read)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM notifications {where}", params).fetchone()[0]
+
+    def count_by_type(self, since: Optional[str] = None, until: Optional[str] = None) -> Dict[str, int]:
+        """
+        Quantidade de notificações por tipo no período.
+
+        Returns:
+            Dicionário {tipo: quantidade}
+        """
+        clauses, params = self._filters(None, since, until, None)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT type, COUNT(*) FROM notifications {where} GROUP BY type ORDER BY type", params).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def mark_read(self, ids: Optional[Iterable[int]] = None, read: bool = True) -> int:
+        """
+        Marca notificações como lidas (ou não lidas).
+
+        Args:
+            ids: Ids das notificações (None: todas)
+            read: Novo estado
+
+        Returns:
+            Quantidade de notificações alteradas
+        """
+        with self._lock, self._connection:
+            if ids is None:
+                cursor = self._connection.execute("UPDATE notifications SET read = ? WHERE read != ?",
+                                                  (int(read), int(read)))
+            else:
+                cursor = self._connection.executemany(
+                    "UPDATE notifications SET read = ? WHERE id = ? AND read != ?",
+                    [(int(read), notification_id, int(read)) for notification_id in ids])
+            return cursor.rowcount
+
+    def _apply_retention(self) -> int:
+        removed = 0
+        if self.retention_days is not None:
+            cutoff = (datetime.now() - timedelta(days=self.retention_days)).strftime(TIMESTAMP_FORMAT)
+            removed += self._connection.execute("DELETE FROM notifications WHERE timestamp < ?",
+                                                (cutoff,)).rowcount
+        if self.max_entries is not None:
+            removed += self._connection.execute(
+                "DELETE FROM notifications WHERE id IN ("
+                "SELECT id FROM notifications ORDER BY timestamp DESC, id DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)).rowcount
+        return removed
+
+    def apply_retention(self) -> int:
+        """
+        Remove as notificações além do limite de quantidade ou de idade.
+
+        Returns:
+            Quantidade de notificações removidas
+        """
+        with self._lock, self._connection:
+            return self._apply_retention()
+
+    def import_text_file(self, text_file: Path) -> int:
+        """
+        Importa o `notifications.txt` legado (um JSON por linha).
+
+        O trecho já importado fica registrado no banco: chamadas repetidas
+        importam apenas as linhas acrescentadas depois (ex.: pelo script
+        PowerShell). Se o arquivo diminuir, é importado desde o início.
+
+        Args:
+            text_file: Arquivo de notificações em texto
+
+        Returns:
+            Quantidade de notificações importadas
+        """
+        text_file = Path(text_file)
+        if not text_file.exists():
+            return 0
+
+        key = str(text_file.resolve())
+        with self._lock:
+            row = self._connection.execute("SELECT offset FROM imports WHERE path = ?", (key,)).fetchone()
+        offset = row['offset'] if row else 0
+        if text_file.stat().st_size < offset:
+            offset = 0
+
+        imported = 0
+        rows = []
+        with open(text_file, 'rb') as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break  # linha ainda sendo escrita: fica para a próxima importação
+                offset += len(raw)
+                try:
+                    notification = json.loads(_decode_line(raw))
+                except ValueError:
+                    continue
+                if not isinstance(notification, dict):
+                    continue
+                rows.append((str(notification.get('Timestamp', '')), str(notification.get('Title', '')),
+                             str(notification.get('Message', '')), str(notification.get('Type', 'INFO'))))
+                if len(rows) >= IMPORT_BATCH_ROWS:
+                    imported += self._import_batch(key, rows, offset)
+                    rows = []
+
+        # Último lote (também grava o offset final quando só havia linhas inválidas)
+        return imported + self._import_batch(key, rows, offset)
+
+    def _import_batch(self, key: str, rows: List[Tuple[str, str, str, str]], offset: int) -> int:
+        """
+        Grava um lote da importação junto com o offset já lido, na mesma transação:
+        uma importação interrompida continua do último lote gravado.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO notifications (timestamp, title, message, type) VALUES (?, ?, ?, ?)", rows)
+            self._connection.execute("INSERT OR REPLACE INTO imports (path, offset) VALUES (?, ?)", (key, offset))
+            if rows:
+                self._apply_retention()
+        return len(rows)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Captura da saída dos scripts de fluxos
+Lê stdout e stderr em streaming, repassa tudo ao console em tempo real,
+guarda apenas os últimos N KB de cada um em um buffer circular e entrega a
+saída ao log em blocos, sem nunca montar a saída completa em memória.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import asyncio
+import codecs
+import sys
+from typing import Callable, Optional
+
+DEFAULT_BUFFER_BYTES = 64 * 1024
+DEFAULT_LOG_CHUNK_BYTES = 8 * 1024
+# Tamanho de cada leitura do pipe
+READ_SIZE = 4096
+
+
+class RingBuffer:
+    """
+    Buffer circular de bytes com capacidade fixa: guarda os últimos bytes recebidos.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Quantidade máxima de bytes mantidos
+        """
+        self.capacity = max(1, capacity)
+        self._buffer = bytearray(self.capacity)
+        self._position = 0
+        self._size = 0
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def dropped(self) -> int:
+        """
+        Bytes descartados por excederem a capacidade.
+        """
+        return self.total - self._size
+
+    def write(self, data: bytes):
+        self.total += len(data)
+        if len(data) >= self.capacity:
+            self._buffer[:] = data[-self.capacity:]
+            self._position, self._size = 0, self.capacity
+            return
+
+        end = self._position + len(data)
+        if end <= self.capacity:
+            self._buffer[self._position:end] = data
+        else:
+            first = self.capacity - self._position
+            self._buffer[self._position:] = data[:first]
+            self._buffer[:end - self.capacity] = data[first:]
+        self._position = end % self.capacity
+        self._size = min(self.capacity, self._size + len(data))
+
+    def getvalue(self) -> bytes:
+        """
+        Conteúdo atual, do byte mais antigo ao mais recente.
+        """
+        if self._size < self.capacity:
+            return bytes(self._buffer[:self._size])
+        return bytes(self._buffer[self._position:] + self._buffer[:self._position])
+
+
+def console_writer(stream) -> Callable[[bytes], None]:
+    """
+    Função que repassa bytes a um stream de texto do console (ex.: `sys.stdout`).
+    """
+    binary = getattr(stream, 'buffer', None)
+    if binary is not None:
+        def write(data: bytes):
+            binary.write(data)
+            binary.flush()
+    else:
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        def write(data: bytes):
+            stream.write(decoder.decode(data))
+            stream.flush()
+    return write
+
+
+class StreamCapture:
+    """
+    Captura de um stream (stdout ou stderr) de um processo.
+
+    Cada bloco lido é repassado ao console (`echo`), guardado no buffer
+    circular e acumulado até `chunk_bytes` para o log (`sink`), cortando na
+    última quebra de linha do bloco.
+    """
+
+    def __init__(self, name: str, buffer_bytes: int = DEFAULT_BUFFER_BYTES,
+                 echo: Optional[Callable[[bytes], None]] = None,
+                 sink: Optional[Callable[[str, str], None]] = None,
+                 chunk_bytes: int = DEFAULT_LOG_CHUNK_BYTES):
+        """
+        Args:
+            name: Nome do stream ('stdout' ou 'stderr')
+            buffer_bytes: Capacidade do buffer circular
+            echo: Destino em tempo real (None: não repassa)
+            sink: Função (nome do stream, texto) que recebe a saída em blocos (None: não registra)
+            chunk_bytes: Tamanho mínimo de cada bloco entregue ao `sink`
+        """
+        self.name = name
+        self.ring = RingBuffer(buffer_bytes)
+        self.echo = echo
+        self.sink = sink
+        self.chunk_bytes = max(1, chunk_bytes)
+        self._pending = bytearray()
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._closed = False
+
+    @property
+    def total_bytes(self) -> int:
+        return self.ring.total
+
+    def feed(self, data: bytes):
+        """
+        Processa um bloco lido do processo.
+        """
+        if self.echo is not None:
+            try:
+                self.echo(data)
+            except (OSError, ValueError):
+                self.echo = None  # console fechado: a captura continua
+        self.ring.write(data)
+
+        if self.sink is None:
+            return
+        self._pending += data
+        if len(self._pending) >= self.chunk_bytes:
+            cut = self._pending.rfind(b'\n') + 1 or len(self._pending)
+            self._emit(bytes(self._pending[:cut]))
+            del self._pending[:cut]
+
+    def _emit(self, data: bytes, final: bool = False):
+        text = self._decoder.decode(data, final)
+        if text:
+            self.sink(self.name, text)
+
+    def close(self):
+        """
+        Entrega ao `sink` o restante acumulado (pode ser chamado mais de uma vez).
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self.sink is not None:
+            self._emit(bytes(self._pending), final=True)
+            self._pending.clear()
+
+    def tail(self) -> str:
+        """
+        Últimos bytes da saída, como texto.
+        """
+        return self.ring.getvalue().decode('utf-8', errors='replace')
+
+
+async def pump(reader: asyncio.StreamReader, capture: StreamCapture, read_size: int = READ_SIZE):
+    """
+    Lê um pipe até o fim, entregando cada bloco à captura.
+    """
+    while True:
+        data = await reader.read(read_size)
+        if not data:
+            break
+        capture.feed(data)
+    capture.close()
+
+
+def default_echo(name: str) -> Callable[[bytes], None]:
+    """
+    Destino de console padrão de um stream ('stdout' ou 'stderr').
+    """
+    return console_writer(sys.stderr if name == 'stderr' else sys.stdout)
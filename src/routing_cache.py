@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Cache de resultados de roteamento
+Cache LRU limitado, com expiração por tempo e invalidação pela versão da
+configuração, para comandos repetidos com frequência.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class RoutingCache:
+    """
+    Cache LRU de resultados de roteamento.
+
+    Cada entrada guarda a versão da configuração com que foi calculada; uma
+    consulta com outra versão descarta a entrada (conta como invalidação).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            max_entries: Quantidade máxima de entradas (0 desativa o cache)
+            ttl_seconds: Validade de cada entrada (None: sem expiração)
+        """
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: str, version: int) -> Optional[Any]:
+        """
+        Busca um resultado.
+
+        Args:
+            key: Entrada normalizada
+            version: Versão atual da configuração
+
+        Returns:
+            Resultado em cache ou None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry_version, expires_at, value = entry
+                if entry_version != version:
+                    self.invalidations += 1
+                    del self._entries[key]
+                elif expires_at is not None and time.monotonic() >= expires_at:
+                    self.expirations += 1
+                    del self._entries[key]
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def put(self, key: str, version: int, value: Any):
+        """
+        Armazena um resultado, descartando o menos usado recentemente se cheio.
+        """
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._entries[key] = (version, expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """
+        Contadores do cache (serializáveis).
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
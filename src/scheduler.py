@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Agendador de tarefas periódicas
+Agendador asyncio baseado em heap (próxima execução no topo) para as tarefas
+de monitoramento, lembretes e relatórios, em um único processo residente.
+Aplica jitter, pula execuções sobrepostas, recupera ticks perdidos (ex.:
+computador suspenso) e grava as próximas execuções para o `--status`.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import asyncio
+import heapq
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+SCHEDULER_STATE_NAME = "scheduler-state.json"
+# Espera máxima entre verificações do relógio: depois de uma suspensão, os
+# ticks atrasados são percebidos em no máximo esse tempo
+MAX_SLEEP_SECONDS = 30.0
+# O jitter nunca passa dessa fração do período da tarefa
+MAX_JITTER_FRACTION = 0.1
+# Limite da contagem de ticks perdidos de agendas diárias/semanais
+MAX_MISSED_COUNT = 1000
+
+
+def _format_time(moment: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(moment).isoformat(sep=' ', timespec='seconds') if moment else None
+
+
+def _parse_time(value: Optional[str]) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(value).timestamp() if value else None
+    except ValueError:
+        return None
+
+
+class IntervalSchedule:
+    """
+    Execução a cada `seconds` segundos.
+    """
+
+    def __init__(self, seconds: float):
+        self.period = float(seconds)
+
+    def next_after(self, moment: float) -> float:
+        return moment + self.period
+
+    def missed(self, due: float, now: float) -> int:
+        """
+        Ticks que venceram entre `due` e `now`, além do próprio `due`.
+        """
+        return int((now - due) // self.period) if now > due else 0
+
+    def describe(self) -> str:
+        return f"a cada {self.period / 60:g} min"
+
+
+class DailySchedule:
+    """
+    Execução diária (ou semanal, com `weekday`) em um horário fixo.
+    """
+
+    def __init__(self, at: str, weekday: Optional[int] = None):
+        """
+        Args:
+            at: Horário no formato `HH:MM`
+            weekday: Dia da semana (0 = segunda-feira); None executa todo dia
+        """
+        hour, minute = at.split(':')
+        self.hour, self.minute = int(hour), int(minute)
+        self.weekday = weekday
+        self.period = 86400.0 if weekday is None else 7 * 86400.0
+
+    def next_after(self, moment: float) -> float:
+        current = datetime.fromtimestamp(moment)
+        candidate = current.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        if candidate <= current:
+            candidate += timedelta(days=1)
+        if self.weekday is not None:
+            candidate += timedelta(days=(self.weekday - candidate.weekday()) % 7)
+        return candidate.timestamp()
+
+    def missed(self, due: float, now: float) -> int:
+        count = 0
+        moment = self.next_after(due)
+        while moment <= now and count < MAX_MISSED_COUNT:
+            count += 1
+            moment = self.next_after(moment)
+        return count
+
+    def describe(self) -> str:
+        days = ("seg", "ter", "qua", "qui", "sex", "sáb", "dom")
+        when = "diariamente" if self.weekday is None else f"toda {days[self.weekday]}"
+        return f"{when} às {self.hour:02d}:{self.minute:02d}"
+
+
+class ScheduledJob:
+    """
+    Tarefa agendada e seus contadores.
+    """
+
+    def __init__(self, name: str, handler: Callable[[], object], schedule):
+        self.name = name
+        self.handler = handler
+        self.schedule = schedule
+        self.base = 0.0        # horário previsto, sem jitter (evita deriva)
+        self.next_run = 0.0    # horário efetivo, com jitter
+        self.last_run: Optional[float] = None
+        self.last_status: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.last_duration: Optional[float] = None
+        self.running = False
+        self.runs = 0
+        self.skipped = 0       # ticks pulados porque a execução anterior não terminou
+        self.missed = 0        # ticks perdidos (processo suspenso), recuperados com uma execução
+
+    def to_dict(self) -> Dict:
+        return {
+            'schedule': self.schedule.describe(),
+            'next_run': _format_time(self.next_run),
+            'last_run': _format_time(self.last_run),
+            'last_status': self.last_status,
+            'last_error': self.last_error,
+            'last_duration': self.last_duration,
+            'running': self.running,
+            'runs': self.runs,
+            'skipped': self.skipped,
+            'missed': self.missed
+        }
+
+
+class JobScheduler:
+    """
+    Agendador de tarefas periódicas com heap de (próxima execução, ordem, nome).
+
+    O laço dorme até a próxima tarefa (no máximo `max_sleep`) e usa o relógio
+    de parede: depois de uma suspensão, tarefas atrasadas rodam uma única vez
+    e os ticks perdidos são apenas contados. As tarefas rodam em threads, sem
+    bloquear o laço; um tick que vence com a execução anterior ainda em
+    andamento é pulado.
+    """
+
+    def __init__(self, state_file: Optional[Path] = None, jitter_seconds: float = 0.0,
+                 max_sleep: float = MAX_SLEEP_SECONDS, clock: Callable[[], float] = time.time,
+                 rng: Optional[random.Random] = None):
+        """
+        Args:
+            state_file: Arquivo com o estado das tarefas (None: não persiste)
+            jitter_seconds: Atraso aleatório máximo somado a cada execução
+            max_sleep: Espera máxima entre verificações do relógio
+            clock: Relógio de parede (segundos desde a época)
+            rng: Gerador de números aleatórios do jitter
+        """
+        self.state_file = Path(state_file) if state_file else None
+        self.jitter_seconds = max(0.0, jitter_seconds)
+        self.max_sleep = max_sleep
+        self.clock = clock
+        self.rng = rng or random.Random()
+
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._sequence = 0
+        self._saved = load_scheduler_state(self.state_file).get('jobs', {}) if self.state_file else {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def _jitter(self, schedule) -> float:
+        limit = min(self.jitter_seconds, schedule.period * MAX_JITTER_FRACTION)
+        return self.rng.uniform(0, limit) if limit > 0 else 0.0
+
+    def _push(self, job: ScheduledJob, base: float):
+        job.base = base
+        job.next_run = base + self._jitter(job.schedule)
+        self._sequence += 1
+        heapq.heappush(self._heap, (job.next_run, self._sequence, job.name))
+
+    def add(self, name: str, handler: Callable[[], object], schedule, run_at_start: bool = False) -> ScheduledJob:
+        """
+        Registra uma tarefa.
+
+        Se o estado gravado tiver a última execução da tarefa, a próxima é
+        calculada a partir dela (e, se já passou, a tarefa roda logo ao iniciar).
+
+        Args:
+            name: Nome único da tarefa
+            handler: Função sem argumentos executada em uma thread
+            schedule: `IntervalSchedule` ou `DailySchedule`
+            run_at_start: Executa logo ao iniciar quando não há execução anterior registrada
+
+        Returns:
+            Tarefa registrada
+        """
+        if name in self.jobs:
+            raise ValueError(f"Tarefa já registrada: {name}")
+
+        job = ScheduledJob(name, handler, schedule)
+        saved = self._saved.get(name, {})
+        job.last_run = _parse_time(saved.get('last_run'))
+        job.last_status = saved.get('last_status')
+        job.last_error = saved.get('last_error')
+        job.last_duration = saved.get('last_duration')
+        for counter in ('runs', 'skipped', 'missed'):
+            setattr(job, counter, saved.get(counter, 0))
+
+        now = self.clock()
+        if job.last_run is not None:
+            base = schedule.next_after(job.last_run)
+        else:
+            base = now if run_at_start else schedule.next_after(now)
+
+        self.jobs[name] = job
+        self._push(job, base)
+        return job
+
+    def snapshot(self) -> Dict:
+        """
+        Estado atual de todas as tarefas (formato do arquivo de estado).
+        """
+        return {
+            'updated': _format_time(self.clock()),
+            'pid': os.getpid(),
+            'jobs': {name: job.to_dict() for name, job in sorted(self.jobs.items(), key=lambda item: item[1].next_run)}
+        }
+
+    def _save_state(self):
+        """
+        Grava o estado de forma atômica (arquivo temporário + rename).
+        """
+        if self.state_file is None:
+            return
+        try:
+            temp_file = Path(f"{self.state_file}.tmp")
+            temp_file.write_text(json.dumps(self.snapshot(), indent=2, ensure_ascii=False), encoding='utf-8')
+            os.replace(temp_file, self.state_file)
+        except OSError as e:
+            print(f"⚠️ Não foi possível gravar o estado do agendador: {e}")
+
+    async def _sleep(self, seconds: float):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _execute(self, job: ScheduledJob):
+        started = self.clock()
+        try:
+            await asyncio.to_thread(job.handler)
+            job.last_status, job.last_error = 'success', None
+        except Exception as e:
+            job.last_status, job.last_error = 'failed', str(e)
+            print(f"⚠️ Tarefa agendada {job.name} falhou: {e}")
+        finally:
+            job.running = False
+            job.last_run = started
+            job.last_duration = round(self.clock() - started, 3)
+            job.runs += 1
+            self._save_state()
+
+    def _dispatch(self, job: ScheduledJob, tasks: set):
+        """
+        Processa o tick vencido de uma tarefa e agenda o próximo.
+        """
+        now = self.clock()
+        job.missed += job.schedule.missed(job.base, now)
+
+        if job.running:
+            job.skipped += 1
+        else:
+            job.running = True
+            task = asyncio.ensure_future(self._execute(job))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        # Próximo tick ancorado no previsto; se já passou (atraso, suspensão), o próximo a partir de agora
+        base = job.schedule.next_after(job.base)
+        if base <= now:
+            base = job.schedule.next_after(now)
+        self._push(job, base)
+
+    async def run(self):
+        """
+        Laço principal; termina quando `stop()` é chamado (aguarda as tarefas em andamento).
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        tasks: set = set()
+
+        self._save_state()
+        try:
+            while not self._stopping:
+                if not self._heap:
+                    await self._sleep(self.max_sleep)
+                    continue
+
+                delay = self._heap[0][0] - self.clock()
+                if delay > 0:
+                    await self._sleep(min(delay, self.max_sleep))
+                    continue
+
+                _, _, name = heapq.heappop(self._heap)
+                self._dispatch(self.jobs[name], tasks)
+                self._save_state()
+        finally:
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            self._save_state()
+
+    def stop(self):
+        """
+        Interrompe o laço (seguro a partir de outra thread).
+        """
+        self._stopping = True
+        if self._loop is not None and self._wakeup is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                pass  # laço já encerrado
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+            self._thread = None
+
+    def start(self):
+        """
+        Executa o laço em segundo plano, em uma thread com seu próprio event loop.
+        """
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=lambda: asyncio.run(self.run()), name="elis-scheduler", daemon=True)
+        self._thread.start()
+
+
+def load_scheduler_state(state_file: Path) -> Dict:
+    """
+    Lê o estado gravado pelo agendador (vazio se ausente ou inválido).
+    """
+    try:
+        return json.loads(Path(state_file).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
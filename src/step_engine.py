@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Motor de etapas dos fluxos de trabalho
+Executa nativamente as listas de `steps` de `workflow_definitions`, rodando
+em paralelo (pool de threads limitado) as etapas sem dependência entre si.
+Um `command` em lista é executado como argv, sem shell; em texto, passa pelo
+shell do sistema.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import os
+import shlex
+import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from async_runner import KILL_GRACE_SECONDS, process_group_options, signal_process_group
+
+DEFAULT_MAX_WORKERS = 4
+# Marcador substituído pela resposta do usuário em etapas interativas
+INPUT_PLACEHOLDER = "{input}"
+
+# Comando de uma etapa: texto (via shell) ou argv (execução direta)
+StepCommand = Union[str, List[str]]
+
+
+def quote_shell_argument(value: str) -> str:
+    """
+    Protege um valor para ser inserido como um único argumento em um comando de shell.
+    """
+    if os.name != 'nt':
+        return shlex.quote(value)
+    # cmd.exe não tem escape para aspas dentro de aspas: entre aspas, & | < > são literais
+    return '"' + value.replace('"', "'") + '"'
+
+
+def build_step_graph(steps: List[Dict]) -> Dict[str, List[str]]:
+    """
+    Monta o grafo de dependências das etapas.
+
+    Uma etapa sem `depends_on` depende da etapa anterior (ordem da lista);
+    `depends_on: []` declara uma etapa independente.
+
+    Args:
+        steps: Lista de etapas da definição do fluxo
+
+    Returns:
+        Dicionário {ação: ações das quais depende}
+
+    Raises:
+        ValueError: Ações duplicadas, dependências desconhecidas ou ciclos
+    """
+    graph: Dict[str, List[str]] = {}
+    previous = None
+
+    for step in steps:
+        action = step.get('action')
+        if not action:
+            raise ValueError("Etapa sem 'action'")
+        if action in graph:
+            raise ValueError(f"Etapa duplicada: {action}")
+
+        if 'depends_on' in step:
+            graph[action] = list(step['depends_on'])
+        else:
+            graph[action] = [previous] if previous else []
+        previous = action
+
+    for action, dependencies in graph.items():
+        for dependency in dependencies:
+            if dependency not in graph:
+                raise ValueError(f"Dependência desconhecida em '{action}': {dependency}")
+
+    # Detecção de ciclos (ordenação topológica de Kahn)
+    pending = {action: len(dependencies) for action, dependencies in graph.items()}
+    ready = [action for action, count in pending.items() if count == 0]
+    visited = 0
+    while ready:
+        current = ready.pop()
+        visited += 1
+        for action, dependencies in graph.items():
+            if current in dependencies:
+                pending[action] -= 1
+                if pending[action] == 0:
+                    ready.append(action)
+    if visited != len(graph):
+        raise ValueError("Ciclo de dependências entre as etapas")
+
+    return graph
+
+
+class StepEngine:
+    """
+    Executor de definições de fluxo baseado em grafo de dependências.
+    """
+
+    def __init__(self, project_root: Path, max_workers: int = DEFAULT_MAX_WORKERS,
+                 prompt_handler: Optional[Callable[[str], str]] = None,
+                 timeout_seconds: Optional[float] = None):
+        """
+        Args:
+            project_root: Diretório onde os comandos são executados
+            max_workers: Limite de etapas executadas simultaneamente
+            prompt_handler: Função chamada para etapas interativas (recebe a mensagem, devolve a resposta)
+            timeout_seconds: Tempo limite por etapa (None ou 0 desativa)
+        """
+        self.project_root = Path(project_root)
+        self.max_workers = max(1, max_workers)
+        self.prompt_handler = prompt_handler
+        self.timeout_seconds = timeout_seconds or None
+
+    def _prepare_command(self, step: Dict) -> StepCommand:
+        """
+        Resolve o comando da etapa, preenchendo a resposta de etapas interativas.
+
+        Em um argv, a resposta vira parte do argumento, sem interpretação; em um
+        comando de texto, é inserida protegida como um único argumento do shell
+        (aspas em volta do marcador, como em `"{input}"`, são substituídas junto).
+        """
+        command = step.get('command', '')
+        if not step.get('interactive'):
+            return command if isinstance(command, str) else list(command)
+
+        answer = ''
+        if self.prompt_handler:
+            answer = self.prompt_handler(step.get('prompt_message', f"{step['action']}:")).strip()
+        answer = answer or step.get('default_input', '')
+
+        if not isinstance(command, str):
+            return [argument.replace(INPUT_PLACEHOLDER, answer) for argument in command]
+        quoted = quote_shell_argument(answer)
+        for template in (f'"{INPUT_PLACEHOLDER}"', f"'{INPUT_PLACEHOLDER}'", INPUT_PLACEHOLDER):
+            command = command.replace(template, quoted)
+        return command
+
+    @staticmethod
+    def _kill_step(process: subprocess.Popen):
+        """
+        Encerra o grupo de processos de uma etapa travada (SIGTERM, depois SIGKILL).
+        """
+        signal_process_group(process.pid)
+        try:
+            process.communicate(timeout=KILL_GRACE_SECONDS)
+            return
+        except subprocess.TimeoutExpired:
+            signal_process_group(process.pid, force=True)
+        try:
+            process.communicate(timeout=KILL_GRACE_SECONDS)
+        except subprocess.TimeoutExpired:
+            # Um descendente que saiu do grupo ainda segura os pipes: abandona a leitura
+            process.kill()
+            process.wait()
+
+    def _run_step(self, step: Dict, command: StepCommand) -> Dict:
+        """
+        Executa uma etapa e captura saída, código de retorno e tempos.
+        """
+        started = time.monotonic()
+        result = {
+            'action': step['action'],
+            'description': step.get('description', ''),
+            'command': command,
+            'status': 'failed',
+            'returncode': None,
+            'stdout': '',
+            'stderr': '',
+            'started': started,
+            'elapsed': 0.0
+        }
+
+        try:
+            # Novo grupo de processos: no tempo limite, os netos que seguram os pipes também são encerrados
+            process = subprocess.Popen(command, shell=isinstance(command, str), cwd=self.project_root,
+                                       stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                       errors='replace', **process_group_options())
+            try:
+                stdout, stderr = process.communicate(timeout=self.timeout_seconds)
+            except subprocess.TimeoutExpired:
+                self._kill_step(process)
+                result['stderr'] = f"Tempo limite excedido ({self.timeout_seconds}s)"
+            else:
+                result['returncode'] = process.returncode
+                result['stdout'] = stdout
+                result['stderr'] = stderr
+                result['status'] = 'success' if process.returncode == 0 else 'failed'
+        except Exception as e:
+            result['stderr'] = str(e)
+
+        result['elapsed'] = time.monotonic() - started
+        return result
+
+    def run(self, name: str, definition: Dict) -> Dict:
+        """
+        Executa uma definição de fluxo.
+
+        Etapas cujas dependências falharam (ou foram puladas) são marcadas como
+        `skipped`; as demais seguem em paralelo.
+
+        Args:
+            name: Nome do fluxo em `workflow_definitions`
+            definition: Definição do fluxo (com a lista `steps`)
+
+        Returns:
+            Dicionário com `success`, `elapsed` e o resultado de cada etapa, na ordem da definição
+        """
+        started = time.monotonic()
+        steps = definition.get('steps', [])
+        report = {'workflow': name, 'success': False, 'elapsed': 0.0, 'error': None, 'steps': []}
+
+        try:
+            graph = build_step_graph(steps)
+        except ValueError as e:
+            report['error'] = str(e)
+            return report
+
+        steps_by_action = {step['action']: step for step in steps}
+        results: Dict[str, Dict] = {}
+        remaining = dict(graph)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+
+            while remaining or running:
+                # Submeter tudo o que estiver pronto; pular o que depende de falhas
+                for action, dependencies in list(remaining.items()):
+                    if any(dep in results and results[dep]['status'] != 'success' for dep in dependencies):
+                        step = steps_by_action[action]
+                        results[action] = {
+                            'action': action,
+                            'description': step.get('description', ''),
+                            'command': step.get('command', ''),
+                            'status': 'skipped',
+                            'returncode': None,
+                            'stdout': '',
+                            'stderr': '',
+                            'started': None,
+                            'elapsed': 0.0
+                        }
+                        del remaining[action]
+                    elif all(dep in results for dep in dependencies):
+                        step = steps_by_action[action]
+                        # Prompts interativos acontecem na thread principal
+                        command = self._prepare_command(step)
+                        running[executor.submit(self._run_step, step, command)] = action
+                        del remaining[action]
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    action = running.pop(future)
+                    results[action] = future.result()
+
+        report['steps'] = [results[step['action']] for step in steps]
+        report['success'] = all(result['status'] == 'success' for result in report['steps'])
+        report['elapsed'] = time.monotonic() - started
+        return report
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Ranqueamento de sugestões de fluxos
+Pesos BM25 pré-calculados sobre as palavras-chave e as descrições das
+operações de `ai_workflow_mapping`, com seleção dos k melhores por heap.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import heapq
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from keyword_automaton import WorkflowKeywordIndex
+from text_normalization import lower_text
+
+DEFAULT_TOP_K = 5
+DEFAULT_MIN_SCORE = 0.0
+
+# Parâmetros do BM25 (valores usuais)
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Peso de cada campo: uma palavra-chave declarada vale mais que uma palavra da descrição
+KEYWORD_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.25
+# Palavras da descrição menores que isso ("a", "do", "de") não são indexadas
+MIN_DESCRIPTION_TERM = 3
+
+
+def bm25_idf(document_frequency: int, document_count: int) -> float:
+    """
+    IDF do BM25 (variante sempre positiva).
+    """
+    return math.log(1 + (document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+
+def description_terms(description: str, normalize: Callable[[str], str] = lower_text) -> List[str]:
+    """
+    Palavras indexadas de uma descrição (com a normalização do índice de palavras-chave).
+    """
+    return [word for word in normalize(description).split() if len(word) >= MIN_DESCRIPTION_TERM]
+
+
+def _field_weights(documents: List[Dict[object, int]], field_weight: float) -> Dict[object, List[Tuple[int, float]]]:
+    """
+    Calcula o peso BM25 de cada termo em cada documento de um campo.
+
+    Args:
+        documents: Por documento, {termo: frequência}
+        field_weight: Multiplicador do campo
+
+    Returns:
+        Dicionário {termo: [(documento, peso)]}
+    """
+    lengths = [sum(frequencies.values()) for frequencies in documents]
+    average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+
+    postings: Dict[object, List[Tuple[int, int]]] = {}
+    for document, frequencies in enumerate(documents):
+        for term, frequency in frequencies.items():
+            postings.setdefault(term, []).append((document, frequency))
+
+    weights: Dict[object, List[Tuple[int, float]]] = {}
+    for term, entries in postings.items():
+        idf = bm25_idf(len(entries), len(documents))
+        weights[term] = [
+            (document, field_weight * idf * frequency * (BM25_K1 + 1) /
+             (frequency + BM25_K1 * (1 - BM25_B + BM25_B * lengths[document] / average_length)))
+            for document, frequency in entries
+        ]
+    return weights
+
+
+class SuggestionRanker:
+    """
+    Ranqueador BM25 das operações para `suggest_workflows`.
+
+    Os pesos de cada termo em cada operação são calculados uma única vez; uma
+    consulta apenas soma os pesos dos termos encontrados e seleciona os
+    `top_k` maiores com um heap, sem montar nem ordenar a lista completa.
+    """
+
+    def __init__(self, keyword_index: WorkflowKeywordIndex, top_k: int = DEFAULT_TOP_K,
+                 min_score: float = DEFAULT_MIN_SCORE):
+        """
+        Args:
+            keyword_index: Índice de palavras-chave (operações na ordem da configuração)
+            top_k: Quantidade máxima de sugestões
+            min_score: Pontuação mínima de uma sugestão
+        """
+        self.keyword_index = keyword_index
+        self.top_k = top_k
+        self.min_score = min_score
+
+        keyword_documents: List[Dict[object, int]] = [{} for _ in keyword_index.operations]
+        for keyword_id, operation_indexes in enumerate(keyword_index.postings):
+            for operation_index in operation_indexes:
+                frequencies = keyword_documents[operation_index]
+                frequencies[keyword_id] = frequencies.get(keyword_id, 0) + 1
+
+        description_documents: List[Dict[object, int]] = []
+        for _, _, operation in keyword_index.operations:
+            frequencies = {}
+            for term in description_terms(operation.get('description', ''), keyword_index.normalize):
+                frequencies[term] = frequencies.get(term, 0) + 1
+            description_documents.append(frequencies)
+
+        # id da palavra-chave -> [(operação, peso)]; palavra da descrição -> [(operação, peso)]
+        self.keyword_weights = _field_weights(keyword_documents, KEYWORD_WEIGHT)
+        self.description_weights = _field_weights(description_documents, DESCRIPTION_WEIGHT)
+
+    def scores(self, user_input: str) -> Dict[int, float]:
+        """
+        Pontuação BM25 de cada operação com algum termo na entrada.
+
+        Palavras-chave contam quando aparecem como substring da entrada (como
+        na busca por palavras-chave); palavras da descrição, quando aparecem
+        como palavra inteira.
+
+        Returns:
+            Dicionário {índice da operação: pontuação}
+        """
+        text = self.keyword_index.normalize(user_input)
+        scores: Dict[int, float] = {}
+
+        for keyword_id in sorted(self.keyword_index.automaton.find(text)):
+            for operation_index, weight in self.keyword_weights.get(keyword_id, ()):
+                scores[operation_index] = scores.get(operation_index, 0.0) + weight
+        for term in sorted(set(text.split())):
+            for operation_index, weight in self.description_weights.get(term, ()):
+                scores[operation_index] = scores.get(operation_index, 0.0) + weight
+        return scores
+
+    def rank(self, user_input: str, top_k: Optional[int] = None,
+             boosts: Optional[Sequence[float]] = None) -> List[Tuple[int, float]]:
+        """
+        Seleciona as operações mais relevantes.
+
+        Args:
+            user_input: Entrada do usuário
+            top_k: Quantidade máxima (padrão: a configurada)
+            boosts: Bônus relativo de cada operação (ex.: prior de uso); a
+                    pontuação final é `score * (1 + bônus)`, aplicado depois de `min_score`
+
+        Returns:
+            Lista [(índice da operação, pontuação)] em ordem decrescente;
+            empates seguem a ordem da configuração
+        """
+        top_k = self.top_k if top_k is None else top_k
+        candidates = ((score * (1 + boosts[operation_index]) if boosts is not None else score, -operation_index)
+                      for operation_index, score in self.scores(user_input).items()
+                      if score > 0 and score >= self.min_score)
+        return [(-negative_index, score) for score, negative_index in heapq.nlargest(top_k, candidates)]
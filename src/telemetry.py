@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Telemetria de execução dos fluxos
+Mede cada fase de `execute_workflow` (pré-ações, script/definição, pós-ações),
+agrega as durações em histogramas por fluxo, persiste os agregados entre
+execuções e exporta no formato de texto do Prometheus. Inclui também o modo
+de perfilamento opcional (cProfile + tracemalloc).
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import atexit
+import cProfile
+import json
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from file_lock import file_lock
+
+# Limites superiores dos buckets dos histogramas, em segundos
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+METRICS_VERSION = 1
+PHASES = ('pre_actions', 'script', 'definition', 'post_actions', 'total')
+
+
+class LatencyHistogram:
+    """
+    Histograma de latências com buckets fixos (não cumulativos internamente).
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # último: acima do maior limite
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float):
+        index = 0
+        while index < len(self.buckets) and seconds > self.buckets[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """
+        Estima um quantil pelo limite superior do bucket que o contém.
+
+        Returns:
+            Segundos (infinito se cair acima do maior bucket), ou None sem observações
+        """
+        if not self.count:
+            return None
+        target = fraction * self.count
+        accumulated = 0
+        for index, bucket_count in enumerate(self.counts):
+            accumulated += bucket_count
+            if accumulated >= target and bucket_count:
+                return self.buckets[index] if index < len(self.buckets) else float('inf')
+        return float('inf')
+
+    def to_dict(self) -> Dict:
+        return {'buckets': list(self.buckets), 'counts': self.counts, 'count': self.count, 'sum': self.sum}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LatencyHistogram':
+        histogram = cls(data['buckets'])
+        histogram.counts = list(data['counts'])
+        histogram.count = data['count']
+        histogram.sum = data['sum']
+        return histogram
+
+
+class WorkflowRun:
+    """
+    Registro das fases de uma execução de fluxo.
+    """
+
+    def __init__(self, workflow: str):
+        self.workflow = workflow
+        self.started = time.monotonic()
+        self.phases: List[Dict] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[Dict]:
+        """
+        Mede uma fase. O dicionário devolvido pode receber `status` e `exit_code`;
+        exceções marcam a fase como `error`.
+        """
+        record = {'phase': name, 'status': 'success', 'exit_code': None, 'seconds': 0.0}
+        started = time.monotonic()
+        try:
+            yield record
+        except BaseException:
+            record['status'] = 'error'
+            raise
+        finally:
+            record['seconds'] = time.monotonic() - started
+            self.phases.append(record)
+
+    @property
+    def success(self) -> bool:
+        return all(record['status'] == 'success' for record in self.phases)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def summary(self) -> str:
+        """
+        Resumo legível das fases (para o log).
+        """
+        parts = [f"{record['phase']}={record['seconds']:.3f}s" for record in self.phases]
+        return " ".join(parts)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class WorkflowTelemetry:
+    """
+    Agregados de telemetria por fluxo e fase, persistidos em JSON.
+
+    Daemon e CLI gravam o mesmo arquivo: cada gravação relê o arquivo sob uma
+    trava e soma a ele apenas as observações ainda não gravadas por esta
+    instância, de modo que nenhum processo descarta os agregados do outro.
+    """
+
+    def __init__(self, metrics_file: Optional[Path] = None, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            metrics_file: Arquivo JSON dos agregados (None mantém apenas em memória)
+            buckets: Limites dos buckets dos histogramas
+        """
+        self.metrics_file = Path(metrics_file) if metrics_file else None
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self.outcomes: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self.last_exit_codes: Dict[str, int] = {}
+        # Observações ainda não gravadas (reaplicadas sobre o arquivo relido)
+        self._pending: List[Tuple[str, str, float, str, Optional[int]]] = []
+        self._load()
+
+    def _load(self) -> bool:
+        """
+        Substitui os agregados em memória pelos do arquivo.
+
+        Returns:
+            True se o arquivo existia e foi lido
+        """
+        if not self.metrics_file or not self.metrics_file.exists():
+            return False
+        try:
+            data = json.loads(self.metrics_file.read_text(encoding='utf-8'))
+            if data.get('version') != METRICS_VERSION:
+                return False
+            histograms = {
+                workflow: {phase: LatencyHistogram.from_dict(histogram) for phase, histogram in phases.items()}
+                for workflow, phases in data['histograms'].items()
+            }
+            self.histograms, self.outcomes, self.last_exit_codes = (histograms, data['outcomes'],
+                                                                     data['last_exit_codes'])
+            return True
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"⚠️ Métricas ignoradas ({self.metrics_file}): {e}")
+            return False
+
+    def _observe(self, workflow: str, phase: str, seconds: float, status: str, exit_code: Optional[int]):
+        if self.metrics_file:
+            self._pending.append((workflow, phase, seconds, status, exit_code))
+        self._apply(workflow, phase, seconds, status, exit_code)
+
+    def _apply(self, workflow: str, phase: str, seconds: float, status: str, exit_code: Optional[int]):
+        histogram = self.histograms.setdefault(workflow, {}).get(phase)
+        if histogram is None:
+            histogram = self.histograms[workflow][phase] = LatencyHistogram(self.buckets)
+        histogram.observe(seconds)
+
+        statuses = self.outcomes.setdefault(workflow, {}).setdefault(phase, {})
+        statuses[status] = statuses.get(status, 0) + 1
+        if exit_code is not None:
+            self.last_exit_codes[workflow] = exit_code
+
+    def record(self, run: WorkflowRun):
+        """
+        Agrega as fases de uma execução (e o total) e persiste.
+        """
+        if not run.phases:
+            return
+        with self._lock:
+            for record in run.phases:
+                self._observe(run.workflow, record['phase'], record['seconds'], record['status'], record['exit_code'])
+            self._observe(run.workflow, 'total', run.elapsed, 'success' if run.success else 'failed', None)
+            self._save()
+
+    def record_phase(self, workflow: str, phase: str, seconds: float, status: str,
+                     exit_code: Optional[int] = None):
+        """
+        Agrega uma fase isolada (ex.: scripts executados em paralelo) e persiste.
+        """
+        with self._lock:
+            self._observe(workflow, phase, seconds, status, exit_code)
+            self._save()
+
+    def _save(self):
+        """
+        Mescla as observações pendentes ao arquivo e grava de forma atômica
+        (arquivo temporário + rename), sob a trava do arquivo.
+        """
+        if not self.metrics_file:
+            return
+        try:
+            with file_lock(self.metrics_file):
+                if self._load():
+                    for observation in self._pending:
+                        self._apply(*observation)
+                self._write()
+                self._pending = []
+        except OSError as e:
+            print(f"⚠️ Erro ao gravar métricas: {e}")
+
+    def _write(self):
+        data = {
+            'version': METRICS_VERSION,
+            'updated': datetime.now().isoformat(timespec='seconds'),
+            'histograms': {
+                workflow: {phase: histogram.to_dict() for phase, histogram in phases.items()}
+                for workflow, phases in self.histograms.items()
+            },
+            'outcomes': self.outcomes,
+            'last_exit_codes': self.last_exit_codes
+        }
+        temp_file = Path(f"{self.metrics_file}.tmp")
+        temp_file.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        os.replace(temp_file, self.metrics_file)
+
+    def rows(self) -> List[Dict]:
+        """
+        Linhas de resumo por fluxo e fase (contagem, média, p50/p95 estimados, falhas).
+        """
+        rows = []
+        for workflow in sorted(self.histograms):
+            phases = self.histograms[workflow]
+            for phase in sorted(phases, key=lambda name: PHASES.index(name) if name in PHASES else len(PHASES)):
+                histogram = phases[phase]
+                statuses = self.outcomes.get(workflow, {}).get(phase, {})
+                rows.append({
+                    'workflow': workflow,
+                    'phase': phase,
+                    'count': histogram.count,
+                    'mean': histogram.sum / histogram.count if histogram.count else 0.0,
+                    'p50': histogram.quantile(0.5),
+                    'p95': histogram.quantile(0.95),
+                    'failures': sum(count for status, count in statuses.items() if status != 'success')
+                })
+        return rows
+
+    def to_prometheus(self) -> str:
+        """
+        Exporta os agregados no formato de texto do Prometheus.
+        """
+        lines = [
+            "# HELP elis_workflow_phase_seconds Duração das fases de execução dos fluxos",
+            "# TYPE elis_workflow_phase_seconds histogram"
+        ]
+        for workflow, phases in sorted(self.histograms.items()):
+            for phase, histogram in sorted(phases.items()):
+                labels = f'workflow="{_escape_label(workflow)}",phase="{_escape_label(phase)}"'
+                accumulated = 0
+                for bucket, bucket_count in zip(histogram.buckets, histogram.counts):
+                    accumulated += bucket_count
+                    lines.append(f'elis_workflow_phase_seconds_bucket{{{labels},le="{bucket:g}"}} {accumulated}')
+                lines.append(f'elis_workflow_phase_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f'elis_workflow_phase_seconds_sum{{{labels}}} {histogram.sum:.6f}')
+                lines.append(f'elis_workflow_phase_seconds_count{{{labels}}} {histogram.count}')
+
+        lines += [
+            "# HELP elis_workflow_phase_total Execuções de cada fase por resultado",
+            "# TYPE elis_workflow_phase_total counter"
+        ]
+        for workflow, phases in sorted(self.outcomes.items()):
+            for phase, statuses in sorted(phases.items()):
+                for status, count in sorted(statuses.items()):
+                    lines.append(f'elis_workflow_phase_total{{workflow="{_escape_label(workflow)}",'
+                                 f'phase="{_escape_label(phase)}",status="{_escape_label(status)}"}} {count}')
+
+        lines += [
+            "# HELP elis_workflow_last_exit_code Código de saída da última execução do script",
+            "# TYPE elis_workflow_last_exit_code gauge"
+        ]
+        for workflow, exit_code in sorted(self.last_exit_codes.items()):
+            lines.append(f'elis_workflow_last_exit_code{{workflow="{_escape_label(workflow)}"}} {exit_code}')
+
+        return "\n".join(lines) + "\n"
+
+    def export_prometheus(self, path: Path):
+        """
+        Grava a exportação do Prometheus de forma atômica (para o textfile collector).
+        """
+        path = Path(path)
+        temp_file = Path(f"{path}.tmp")
+        temp_file.write_text(self.to_prometheus(), encoding='utf-8')
+        os.replace(temp_file, path)
+
+
+class ProfileSession:
+    """
+    Perfilamento opcional de uma execução com cProfile e tracemalloc.
+
+    `stop()` é registrado no atexit, de modo que os arquivos são gravados mesmo
+    quando o comando termina por `sys.exit`.
+    """
+
+    def __init__(self, output_dir: Path, label: str):
+        """
+        Args:
+            output_dir: Diretório onde os arquivos são gravados
+            label: Identificação da execução (parte do nome dos arquivos)
+        """
+        self.output_dir = Path(output_dir)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        base_name = f"{stamp}-{re.sub(r'[^A-Za-z0-9_.-]+', '_', label)}"
+        self.profile_file = self.output_dir / f"{base_name}.prof"
+        self.memory_file = self.output_dir / f"{base_name}.tracemalloc"
+        self._profiler: Optional[cProfile.Profile] = None
+
+    def start(self) -> 'ProfileSession':
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tracemalloc.start(25)
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+        atexit.register(self.stop)
+        return self
+
+    def stop(self) -> Optional[Dict]:
+        """
+        Encerra o perfilamento e grava `.prof` (pstats/snakeviz) e `.tracemalloc`
+        (`tracemalloc.Snapshot.load`).
+
+        Returns:
+            Caminhos gravados e pico de memória, ou None se já encerrado
+        """
+        if self._profiler is None:
+            return None
+        self._profiler.disable()
+        self._profiler.dump_stats(str(self.profile_file))
+        self._profiler = None
+
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        snapshot.dump(str(self.memory_file))
+        atexit.unregister(self.stop)
+
+        print(f"🔬 Perfil gravado em {self.profile_file} e {self.memory_file} "
+              f"(pico de memória: {peak / 1024:.1f} KiB)", file=sys.stderr)
+        return {'profile_file': self.profile_file, 'memory_file': self.memory_file, 'peak_bytes': peak}
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Normalização de texto
+Forma canônica usada pelo reconhecimento de intenções, pela busca por
+palavras-chave e como chave do cache de roteamento: apenas minúsculas
+(padrão) ou, com `ai_recognition_patterns.normalization.fold_accents`,
+também sem acentos e com espaços colapsados.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import unicodedata
+from typing import Callable, Dict, Iterable
+
+# Espaçamento descartado na chave do cache de roteamento (ver `routing_key_mode`)
+KEY_COLLAPSE = 'collapse'
+KEY_STRIP = 'strip'
+KEY_KEEP = 'keep'
+
+
+def fold_text(text: str) -> str:
+    """
+    Normaliza um texto: minúsculas, sem acentos e com espaços colapsados.
+
+    "  Verificar   SITUAÇÃO " -> "verificar situacao"
+
+    Args:
+        text: Texto original
+
+    Returns:
+        Texto normalizado
+    """
+    if not text.isascii():
+        decomposed = unicodedata.normalize('NFKD', text)
+        text = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(text.lower().split())
+
+
+def lower_text(text: str) -> str:
+    """
+    Normalização padrão: apenas minúsculas (acentos e espaços preservados).
+    """
+    return text.lower()
+
+
+def text_normalizer(recognition: Dict) -> Callable[[str], str]:
+    """
+    Normalização configurada em `ai_recognition_patterns.normalization.fold_accents`.
+
+    Args:
+        recognition: Seção `ai_recognition_patterns` da configuração
+
+    Returns:
+        `fold_text` se `fold_accents` estiver ativo, senão `lower_text`
+    """
+    return fold_text if recognition.get('normalization', {}).get('fold_accents', False) else lower_text
+
+
+def routing_key_mode(phrases: Iterable[str]) -> str:
+    """
+    Quanto do espaçamento da entrada pode sair da chave do cache sem mudar o
+    roteamento. A sobreposição de palavras e a correção aproximada ignoram o
+    espaçamento; só as buscas por substring dependem dele, e apenas para
+    padrões e palavras-chave que contêm espaços.
+
+    Args:
+        phrases: Padrões de intenção e palavras-chave já normalizados
+
+    Returns:
+        `KEY_COLLAPSE` (nenhuma frase com espaço), `KEY_STRIP` (nenhuma com
+        espaço nas pontas) ou `KEY_KEEP`
+    """
+    mode = KEY_COLLAPSE
+    for phrase in phrases:
+        if phrase != phrase.strip():
+            return KEY_KEEP
+        if mode == KEY_COLLAPSE and len(phrase.split()) > 1:
+            mode = KEY_STRIP
+    return mode
+
+
+def routing_key(text: str, mode: str) -> str:
+    """
+    Chave do cache de roteamento de um texto já normalizado.
+    """
+    if mode == KEY_COLLAPSE:
+        return ' '.join(text.split())
+    if mode == KEY_STRIP:
+        return text.strip()
+    return text
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Contadores de uso dos fluxos
+Contadores compactos (um `array` de floats indexado por nome) das intenções
+e fluxos escolhidos pelo usuário, com decaimento exponencial no tempo,
+gravados de forma atômica entre sessões (`learn_from_usage`).
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from file_lock import file_lock
+
+USAGE_FILE_NAME = "workflow-usage.json"
+USAGE_FORMAT_VERSION = 1
+DEFAULT_HALF_LIFE_DAYS = 14.0
+# Contagem que vale prior 0.5 (prior = contagem / (contagem + suavização))
+PRIOR_SMOOTHING = 2.0
+# Fator de escala a partir do qual os valores guardados são renormalizados
+RENORMALIZE_SCALE = 1e12
+
+
+class UsageCounters:
+    """
+    Contadores de uso com decaimento exponencial ("forward decay").
+
+    Cada uso soma `exp(λ·(t - referência))` ao contador: o valor atual de
+    todos os contadores é o guardado dividido pelo mesmo fator, então registrar
+    um uso custa O(1) e a ordem dos contadores não depende do horário da consulta.
+
+    `save` relê o arquivo sob uma trava e soma a ele só os usos registrados
+    desde a última gravação (reescalados para a mesma referência), de modo que
+    daemon e CLI não descartam os usos um do outro.
+    """
+
+    def __init__(self, path: Optional[Path] = None, half_life_days: float = DEFAULT_HALF_LIFE_DAYS,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            path: Arquivo dos contadores (None: apenas em memória)
+            half_life_days: Tempo para um uso valer metade
+            clock: Relógio de parede (segundos desde a época)
+        """
+        self.path = Path(path) if path else None
+        self.half_life_days = half_life_days
+        self.clock = clock
+        self._rate = math.log(2) / (half_life_days * 86400)
+        self._lock = threading.Lock()
+
+        self.reference = clock()
+        self.names: List[str] = []
+        self.values = array('d')
+        self._slots: Dict[str, int] = {}
+        # Usos ainda não gravados, na escala de `reference`
+        self._pending: Dict[str, float] = {}
+        # Incrementada a cada registro (invalida ordens e caches derivados)
+        self.version = 0
+
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _read(self) -> Optional[Tuple[float, List[str], List[float]]]:
+        """
+        Lê o arquivo dos contadores.
+
+        Returns:
+            Tupla (referência, nomes, valores) ou None se ausente ou inválido
+        """
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('version') != USAGE_FORMAT_VERSION:
+            return None
+
+        names, values = data.get('names', []), data.get('values', [])
+        if len(names) != len(values):
+            return None
+        return (float(data.get('reference', self.reference)), [str(name) for name in names],
+                [float(value) for value in values])
+
+    def _load(self):
+        stored = self._read()
+        if stored is None:
+            return
+        self.reference, self.names, values = stored
+        self.values = array('d', values)
+        self._slots = {name: slot for slot, name in enumerate(self.names)}
+
+    def save(self):
+        """
+        Mescla os usos ainda não gravados ao arquivo e grava de forma atômica
+        (arquivo temporário + rename), sob a trava do arquivo.
+        """
+        if self.path is None:
+            return
+        with self._lock, file_lock(self.path):
+            stored = self._read()
+            if stored is not None:
+                # Valores do arquivo na referência desta instância, mais os usos pendentes
+                stored_reference, names, values = stored
+                factor = math.exp(self._rate * (stored_reference - self.reference))
+                self.names = names
+                self.values = array('d', (value * factor for value in values))
+                self._slots = {name: slot for slot, name in enumerate(self.names)}
+                for name, value in self._pending.items():
+                    self.values[self._slot(name)] += value
+                self.version += 1
+
+            data = {'version': USAGE_FORMAT_VERSION, 'half_life_days': self.half_life_days,
+                    'reference': self.reference, 'names': list(self.names), 'values': self.values.tolist()}
+            temp_file = Path(f"{self.path}.tmp")
+            temp_file.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+            os.replace(temp_file, self.path)
+            self._pending = {}
+
+    def _slot(self, name: str) -> int:
+        slot = self._slots.get(name)
+        if slot is None:
+            slot = self._slots[name] = len(self.names)
+            self.names.append(name)
+            self.values.append(0.0)
+        return slot
+
+    def _scale(self, now: float) -> float:
+        return math.exp(self._rate * (now - self.reference))
+
+    def record(self, name: str, weight: float = 1.0):
+        """
+        Registra um uso.
+
+        Args:
+            name: Nome do contador (ex.: `workflow:git.commit`)
+            weight: Peso do uso
+        """
+        with self._lock:
+            now = self.clock()
+            scale = self._scale(now)
+            if scale > RENORMALIZE_SCALE:
+                for slot in range(len(self.values)):
+                    self.values[slot] /= scale
+                self._pending = {pending: value / scale for pending, value in self._pending.items()}
+                self.reference, scale = now, 1.0
+
+            self.values[self._slot(name)] += weight * scale
+            if self.path is not None:
+                self._pending[name] = self._pending.get(name, 0.0) + weight * scale
+            self.version += 1
+
+    def count(self, name: str) -> float:
+        """
+        Contagem atual (com decaimento) de um contador.
+        """
+        slot = self._slots.get(name)
+        if slot is None:
+            return 0.0
+        return self.values[slot] / self._scale(self.clock())
+
+    def priors(self, names: Sequence[str]) -> List[float]:
+        """
+        Prior de cada nome, entre 0 (nunca usado) e 1.
+        """
+        scale = self._scale(self.clock())
+        priors = []
+        for name in names:
+            slot = self._slots.get(name)
+            count = self.values[slot] / scale if slot is not None else 0.0
+            priors.append(count / (count + PRIOR_SMOOTHING))
+        return priors
+
+    def ranks(self, names: Sequence[str]) -> List[int]:
+        """
+        Posição de cada nome na ordem de uso (0 = mais usado); empates mantêm a ordem recebida.
+        """
+        stored = [self.values[self._slots[name]] if name in self._slots else 0.0 for name in names]
+        order = sorted(range(len(names)), key=lambda position: (-stored[position], position))
+        ranks = [0] * len(names)
+        for rank, position in enumerate(order):
+            ranks[position] = rank
+        return ranks
+
+    def top(self, prefix: str = "", limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        Contadores mais usados com o prefixo informado.
+
+        Returns:
+            Lista [(nome sem o prefixo, contagem atual)]
+        """
+        scale = self._scale(self.clock())
+        items = [(name[len(prefix):], self.values[slot] / scale)
+                 for slot, name in enumerate(self.names) if name.startswith(prefix)]
+        items.sort(key=lambda item: -item[1])
+        return items[:limit]
@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Pré e pós-ações dos fluxos
+Registro extensível das ações declaradas em `pre_actions` e `post_actions`.
+Ações independentes rodam em paralelo e todas compartilham um único retrato
+do estado do Git por execução (um só `git status`).
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from notification_store import NOTIFICATION_DB_NAME, NotificationStore
+from step_engine import DEFAULT_MAX_WORKERS
+from workspace_index import WorkspaceIndex
+
+DEFAULT_REMOTE = 'origin'
+GIT_TIMEOUT = 30
+# Referências criadas por `backup_current_state` (restauráveis com `git restore --source <ref> .`)
+BACKUP_REF_PREFIX = 'refs/elis-backups/'
+# Backups mantidos por `backup_current_state` (os mais antigos são removidos)
+MAX_BACKUP_REFS = 20
+# Arquivos de trava de editores com um buffer ainda não salvo (Vim e Emacs)
+UNSAVED_BUFFER_PATTERNS = ('.*.swp', '.*.swo', '.#*')
+
+# nome -> {'handler': função(contexto) -> resultado, 'after': ações que, se presentes, rodam antes}
+_REGISTRY: Dict[str, Dict] = {}
+
+
+def register_action(name: str, after: Tuple[str, ...] = ()):
+    """
+    Registra uma ação (decorador).
+
+    A função recebe um `ActionContext` e devolve `action_result(...)`.
+
+    Args:
+        name: Nome usado em `pre_actions`/`post_actions`
+        after: Ações que devem terminar antes desta quando estiverem na mesma lista
+    """
+    def decorator(handler: Callable[['ActionContext'], Dict]):
+        _REGISTRY[name] = {'handler': handler, 'after': tuple(after)}
+        return handler
+    return decorator
+
+
+def registered_actions() -> List[str]:
+    return sorted(_REGISTRY)
+
+
+def action_result(status: str, message: str) -> Dict:
+    """
+    Resultado de uma ação.
+
+    Args:
+        status: 'success', 'warning' (segue o fluxo) ou 'failed' (interrompe pré-ações)
+        message: Mensagem exibida ao usuário
+    """
+    return {'status': status, 'message': message}
+
+
+def run_git(project_root: Path, *args: str, timeout: float = GIT_TIMEOUT,
+            env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+    return subprocess.run(['git', *args], cwd=project_root, capture_output=True, text=True,
+                          errors='replace', timeout=timeout, env=env)
+
+
+def parse_porcelain_status(output: str) -> Dict:
+    """
+    Interpreta a saída de `git status --porcelain=v2 --branch`.
+
+    Returns:
+        Dicionário com `head`, `branch`, `upstream`, `ahead`, `behind`,
+        `changes` (caminhos alterados ou não rastreados) e `conflicts`
+    """
+    state = {'head': None, 'branch': None, 'upstream': None, 'ahead': 0, 'behind': 0,
+             'changes': [], 'conflicts': []}
+
+    for line in output.splitlines():
+        if line.startswith('# branch.oid '):
+            oid = line[len('# branch.oid '):]
+            state['head'] = None if oid == '(initial)' else oid
+        elif line.startswith('# branch.head '):
+            head = line[len('# branch.head '):]
+            state['branch'] = None if head == '(detached)' else head
+        elif line.startswith('# branch.upstream '):
+            state['upstream'] = line[len('# branch.upstream '):]
+        elif line.startswith('# branch.ab '):
+            ahead, behind = line[len('# branch.ab '):].split()
+            state['ahead'], state['behind'] = int(ahead), -int(behind)
+        elif line.startswith('1 ') or line.startswith('2 '):
+            # Entradas de renomeação trazem "destino\torigem" no último campo
+            fields = line.split(' ', 8 if line[0] == '1' else 9)
+            state['changes'].append(fields[-1].split('\t')[0])
+        elif line.startswith('u '):
+            path = line.split(' ', 10)[-1]
+            state['changes'].append(path)
+            state['conflicts'].append(path)
+        elif line.startswith('? '):
+            state['changes'].append(line[2:])
+
+    return state
+
+
+class GitStateSnapshot:
+    """
+    Estado do Git de uma execução, lido uma única vez sob demanda.
+
+    Seguro entre threads: ações simultâneas aguardam a mesma leitura.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root)
+        self.reads = 0
+        self._state: Optional[Dict] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Dict:
+        """
+        Estado atual (ver `parse_porcelain_status`), com `is_repo` e `error`.
+        """
+        with self._lock:
+            if self._state is None:
+                self.reads += 1
+                try:
+                    completed = run_git(self.project_root, 'status', '--porcelain=v2', '--branch')
+                except (OSError, subprocess.TimeoutExpired) as e:
+                    self._state = {'is_repo': False, 'error': str(e)}
+                else:
+                    if completed.returncode != 0:
+                        self._state = {'is_repo': False, 'error': completed.stderr.strip()}
+                    else:
+                        self._state = dict(parse_porcelain_status(completed.stdout), is_repo=True, error=None)
+            return self._state
+
+    def invalidate(self):
+        """
+        Descarta o estado lido (ex.: depois que o script do fluxo alterou o repositório).
+        """
+        with self._lock:
+            self._state = None
+
+
+class WorkspaceSnapshot:
+    """
+    Alterações na árvore do projeto desde a execução anterior, calculadas uma
+    única vez sob demanda pelo índice compartilhado (`workspace-index.json`).
+    """
+
+    def __init__(self, project_root: Path):
+        self.index = WorkspaceIndex(project_root)
+        self._changes: Optional[Dict] = None
+        self._lock = threading.Lock()
+
+    def changes(self) -> Dict:
+        """
+        Resultado de `WorkspaceIndex.update` (arquivos editados no lugar incluídos).
+        """
+        with self._lock:
+            if self._changes is None:
+                self._changes = self.index.update(stat_files=True)
+            return self._changes
+
+    def temp_paths(self) -> set:
+        """
+        Caminhos dos arquivos temporários e pastas de cache do projeto.
+        """
+        self.changes()
+        return {item['path'] for item in self.index.temp_files()}
+
+
+class ActionContext:
+    """
+    Dados compartilhados pelas ações de uma execução de fluxo.
+    """
+
+    def __init__(self, project_root: Path, workflow: str, log: Optional[Callable[[str, str], None]] = None):
+        """
+        Args:
+            project_root: Diretório do projeto (repositório Git)
+            workflow: Nome da operação em execução
+            log: Função de registro no log (mensagem, nível)
+        """
+        self.project_root = Path(project_root)
+        self.workflow = workflow
+        self.git = GitStateSnapshot(self.project_root)
+        self.workspace = WorkspaceSnapshot(self.project_root)
+        self.log = log or (lambda message, level="INFO": None)
+
+
+class ActionRunner:
+    """
+    Executa listas de ações registradas, em paralelo quando independentes.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, registry: Optional[Dict[str, Dict]] = None):
+        """
+        Args:
+            max_workers: Limite de ações simultâneas
+            registry: Registro de ações (padrão: o registro global de `register_action`)
+        """
+        self.max_workers = max(1, max_workers)
+        self.registry = _REGISTRY if registry is None else registry
+
+    def _run_action(self, action: str, context: ActionContext) -> Dict:
+        started = time.monotonic()
+        try:
+            result = dict(self.registry[action]['handler'](context))
+        except Exception as e:
+            result = action_result('failed', str(e))
+        result['action'] = action
+        result['elapsed'] = time.monotonic() - started
+        return result
+
+    def run(self, actions: List[str], context: ActionContext) -> Dict:
+        """
+        Executa as ações; cada uma espera apenas as ações de `after` presentes na lista.
+
+        Args:
+            actions: Nomes das ações, na ordem da configuração
+            context: Contexto da execução
+
+        Returns:
+            Dicionário com `success` (nenhuma falha), `elapsed` e o resultado de cada ação, na ordem da lista
+        """
+        started = time.monotonic()
+        results: Dict[str, Dict] = {}
+        remaining: Dict[str, List[str]] = {}
+
+        for action in dict.fromkeys(actions):
+            if action in self.registry:
+                remaining[action] = [dep for dep in self.registry[action]['after'] if dep in actions and dep != action]
+            else:
+                results[action] = dict(action_result('skipped', "Ação desconhecida"), action=action, elapsed=0.0)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while remaining or running:
+                for action, dependencies in list(remaining.items()):
+                    if all(dep in results for dep in dependencies):
+                        running[executor.submit(self._run_action, action, context)] = action
+                        del remaining[action]
+
+                if not running:
+                    break  # dependências circulares entre ações registradas
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+
+        for action in remaining:
+            results[action] = dict(action_result('failed', "Dependência circular entre ações"), action=action, elapsed=0.0)
+
+        ordered = [results[action] for action in dict.fromkeys(actions)]
+        return {
+            'success': all(result['status'] != 'failed' for result in ordered),
+            'elapsed': time.monotonic() - started,
+            'actions': ordered
+        }
+
+
+# ---------------------------------------------------------------------------
+# Ações padrão
+# ---------------------------------------------------------------------------
+
+@register_action('auto_save_files')
+def auto_save_files(context: ActionContext) -> Dict:
+    """
+    Confere se há arquivos abertos no editor sem salvar, antes das operações do Git.
+
+    O salvamento em si é feito pelo editor (`autoSave` em `.trae-config.json`);
+    a ação não espera por ele: procura os arquivos de trava que Vim e Emacs
+    mantêm enquanto um buffer tem alterações e informa o que mudou na árvore.
+    """
+    try:
+        settings = json.loads((context.project_root / ".trae-config.json").read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        settings = {}
+
+    changes = context.workspace.changes()
+    unsaved = sorted(path for path, _, _ in context.workspace.index.files()
+                     if any(fnmatch(path.rpartition('/')[2], pattern) for pattern in UNSAVED_BUFFER_PATTERNS))
+    if unsaved:
+        return action_result('warning', f"Arquivos com alterações não salvas no editor: {', '.join(unsaved)}")
+
+    if not settings.get('autoSave', {}).get('enabled') or \
+            not settings.get('git', {}).get('saveAllFilesBeforeGitOperations', True):
+        return action_result('warning', "Salvamento automático do editor desativado: salve os arquivos antes de continuar")
+
+    message = "Nenhum arquivo aberto sem salvar"
+    if not changes['initial']:
+        changed = len(changes['added']) + len(changes['modified']) + len(changes['removed'])
+        message += f", {changed} arquivo(s) alterado(s) desde a última execução"
+    return action_result('success', message)
+
+
+@register_action('check_git_status', after=('auto_save_files',))
+def check_git_status(context: ActionContext) -> Dict:
+    state = context.git.get()
+    if not state['is_repo']:
+        return action_result('failed', f"Não é um repositório Git: {state['error']}")
+
+    message = f"Branch {state['branch'] or '(HEAD destacado)'}: {len(state['changes'])} arquivo(s) alterado(s)"
+    if state['upstream']:
+        message += f", {state['ahead']} à frente e {state['behind']} atrás de {state['upstream']}"
+    return action_result('success', message)
+
+
+@register_action('validate_changes', after=('auto_save_files',))
+def validate_changes(context: ActionContext) -> Dict:
+    state = context.git.get()
+    if not state['is_repo']:
+        return action_result('failed', f"Não é um repositório Git: {state['error']}")
+    if state['conflicts']:
+        return action_result('failed', f"Conflitos não resolvidos: {', '.join(state['conflicts'])}")
+    if not state['changes']:
+        return action_result('failed', "Nenhuma alteração para commit")
+
+    # Pastas inteiras não rastreadas aparecem como "pasta/" no git status: o que
+    # estiver dentro delas só conta se não for ignorado pelo .gitignore
+    changed = set(state['changes'])
+    changed_dirs = tuple(path for path in changed if path.endswith('/'))
+    temporary, nested = [], []
+    for path in sorted(context.workspace.temp_paths()):
+        if path in changed or f"{path}/" in changed:
+            temporary.append(path)
+        elif path.startswith(changed_dirs):
+            nested.append(path)
+    if nested:
+        ignored = run_git(context.project_root, 'check-ignore', *nested).stdout.splitlines()
+        temporary.extend(path for path in nested if path not in ignored)
+    if temporary:
+        return action_result('warning', f"{len(state['changes'])} arquivo(s) com alterações, incluindo "
+                                        f"temporários/cache (adicione ao .gitignore): {', '.join(temporary)}")
+    return action_result('success', f"{len(state['changes'])} arquivo(s) com alterações")
+
+
+@register_action('check_local_changes', after=('auto_save_files',))
+def check_local_changes(context: ActionContext) -> Dict:
+    state = context.git.get()
+    if not state['is_repo']:
+        return action_result('failed', f"Não é um repositório Git: {state['error']}")
+    if state['changes']:
+        return action_result('warning', f"{len(state['changes'])} alteração(ões) local(is): o pull pode gerar conflitos")
+    return action_result('success', "Working directory limpo")
+
+
+@register_action('check_unpushed_commits')
+def check_unpushed_commits(context: ActionContext) -> Dict:
+    state = context.git.get()
+    if not state['is_repo']:
+        return action_result('failed', f"Não é um repositório Git: {state['error']}")
+    if not state['upstream']:
+        return action_result('warning', "Branch sem upstream configurado")
+    if not state['ahead']:
+        return action_result('warning', "Nenhum commit pendente para push")
+    return action_result('success', f"{state['ahead']} commit(s) pendente(s) para push")
+
+
+@register_action('validate_remote_connection')
+def validate_remote_connection(context: ActionContext) -> Dict:
+    state = context.git.get()
+    upstream = state.get('upstream') or ''
+    remote = upstream.split('/', 1)[0] if '/' in upstream else DEFAULT_REMOTE
+
+    try:
+        completed = run_git(context.project_root, 'ls-remote', '--exit-code', '--heads', remote)
+    except subprocess.TimeoutExpired:
+        return action_result('failed', f"Tempo limite ao contatar o remoto {remote}")
+    # Código 2: remoto acessível, mas sem branches
+    if completed.returncode not in (0, 2):
+        return action_result('failed', f"Remoto {remote} inacessível: {completed.stderr.strip()}")
+    return action_result('success', f"Conexão com {remote} verificada")
+
+
+def snapshot_working_tree(project_root: Path, message: str) -> str:
+    """
+    Grava o working directory (inclusive arquivos não rastreados) em um commit
+    avulso, filho do HEAD, sem alterar o índice nem os arquivos.
+
+    Usa um índice temporário copiado do atual, para reaproveitar os dados de
+    `stat` e só recalcular os arquivos alterados.
+
+    Returns:
+        Id do commit criado
+
+    Raises:
+        RuntimeError: Falha de algum comando do Git
+    """
+    def git(*args, env=None):
+        completed = run_git(project_root, *args, env=env)
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip() or f"git {args[0]} falhou")
+        return completed.stdout.strip()
+
+    index_file = Path(project_root) / git('rev-parse', '--git-path', 'index')
+    handle, temp_index = tempfile.mkstemp(prefix="elis-backup-", suffix=".index")
+    os.close(handle)
+    try:
+        if index_file.exists():
+            shutil.copyfile(index_file, temp_index)
+        env = dict(os.environ, GIT_INDEX_FILE=temp_index)
+        git('add', '--all', env=env)
+        tree = git('write-tree', env=env)
+        # O backup não deve falhar só porque o usuário ainda não configurou nome/e-mail
+        identity = [] if run_git(project_root, 'config', 'user.email').stdout.strip() else [
+            '-c', 'user.name=ELIS-V1', '-c', 'user.email=elis-v1@localhost']
+        return git(*identity, 'commit-tree', tree, '-p', 'HEAD', '-m', message)
+    finally:
+        os.unlink(temp_index)
+
+
+@register_action('backup_current_state', after=('auto_save_files',))
+def backup_current_state(context: ActionContext) -> Dict:
+    """
+    Guarda o estado atual (commit e alterações locais) em uma referência,
+    sem alterar o working directory.
+    """
+    state = context.git.get()
+    if not state['is_repo']:
+        return action_result('failed', f"Não é um repositório Git: {state['error']}")
+    if not state['head']:
+        return action_result('warning', "Repositório sem commits: nada para guardar")
+
+    target = state['head']
+    if state['changes']:
+        try:
+            target = snapshot_working_tree(context.project_root, f"ELIS-V1 backup antes de {context.workflow}")
+        except RuntimeError as e:
+            return action_result('failed', f"Falha ao criar o backup: {e}")
+
+    ref = BACKUP_REF_PREFIX + datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+    completed = run_git(context.project_root, 'update-ref', ref, target)
+    if completed.returncode != 0:
+        return action_result('failed', f"Falha ao gravar o backup: {completed.stderr.strip()}")
+
+    message = f"Backup em {ref} ({target[:7]})"
+    pruned = prune_backup_refs(context.project_root)
+    if pruned:
+        message += f", {pruned} backup(s) antigo(s) removido(s)"
+    return action_result('success', message)
+
+
+def prune_backup_refs(project_root: Path, keep: int = MAX_BACKUP_REFS) -> int:
+    """
+    Remove os backups de `backup_current_state` além dos `keep` mais recentes.
+
+    Returns:
+        Quantidade de referências removidas
+    """
+    # Os nomes terminam na data (AAAAMMDD-HHMMSS-μs): a ordem do nome é a cronológica
+    listed = run_git(project_root, 'for-each-ref', '--sort=-refname', '--format=%(refname)', BACKUP_REF_PREFIX)
+    if listed.returncode != 0:
+        return 0
+    stale = listed.stdout.split()[max(0, keep):]
+    if not stale:
+        return 0
+    completed = subprocess.run(['git', 'update-ref', '--stdin'], cwd=project_root, capture_output=True, text=True,
+                               input="".join(f"delete {ref}\n" for ref in stale), timeout=GIT_TIMEOUT)
+    return len(stale) if completed.returncode == 0 else 0
+
+
+@register_action('update_notifications')
+def update_notifications(context: ActionContext) -> Dict:
+    with NotificationStore(context.project_root / NOTIFICATION_DB_NAME) as store:
+        store.add("Fluxo Executado", f"Fluxo {context.workflow} concluído", "SUCCESS")
+    return action_result('success', "Notificação registrada")
+
+
+@register_action('log_activity')
+def log_activity(context: ActionContext) -> Dict:
+    state = context.git.get()
+    message = f"Atividade: fluxo {context.workflow} concluído"
+    if state['is_repo']:
+        message += f" (branch {state['branch'] or '(HEAD destacado)'}, {len(state['changes'])} alteração(ões) pendente(s))"
+    context.log(message, "INFO")
+    return action_result('success', "Atividade registrada no log")
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ELIS-V1 - Índice incremental da árvore do projeto
+Retrato persistente (tamanho e mtime de cada arquivo, mtime de cada pasta)
+montado com `os.scandir`, compartilhado pelas pré-ações, pela limpeza do
+projeto e pela verificação de estrutura. A cada atualização só são relidas
+as pastas cujo mtime mudou.
+
+Desenvolvido por: Marduka & Gustavo
+Projeto: ELIS-V1 - Passo 5
+"""
+
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+from fnmatch import translate
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+WORKSPACE_INDEX_NAME = "workspace-index.json"
+INDEX_VERSION = 1
+# Pastas listadas, mas nunca percorridas
+EXCLUDED_DIRS = frozenset({'.git', '.venv', 'venv', 'env', 'node_modules', '.tox'})
+# Pastas de cache (removidas inteiras pela limpeza, também não percorridas)
+CACHE_DIR_NAMES = frozenset({'__pycache__', '.pytest_cache', '.mypy_cache', '.ruff_cache', 'htmlcov'})
+TEMP_FILE_PATTERNS = ('*.pyc', '*.pyo', '*.tmp', '*.temp', '*.bak', '*.swp', '*~', '.coverage',
+                      '.DS_Store', 'Thumbs.db')
+# Pastas alteradas há menos que isso podem mudar de novo no mesmo tick do mtime:
+# não são marcadas como lidas e serão relidas na próxima atualização
+RACY_WINDOW_NS = 2_000_000_000
+
+_TEMP_FILE = re.compile("|".join(translate(pattern) for pattern in TEMP_FILE_PATTERNS))
+
+
+def _join(directory: str, name: str) -> str:
+    return f"{directory}/{name}" if directory else name
+
+
+class WorkspaceIndex:
+    """
+    Índice de arquivos do projeto: {pasta relativa: {mtime, entradas}}.
+
+    A lista de uma pasta só muda quando entradas são criadas, removidas ou
+    renomeadas, o que altera o mtime da pasta; arquivos editados no lugar só
+    são percebidos nas pastas relidas ou com `stat_files=True`.
+    """
+
+    def __init__(self, project_root: Path, index_file: Optional[Path] = None):
+        """
+        Args:
+            project_root: Raiz do projeto
+            index_file: Arquivo do índice (padrão: `workspace-index.json` dentro de `.git`,
+                        para não aparecer como alteração do repositório, ou na raiz)
+        """
+        self.root = Path(project_root)
+        if index_file is None:
+            git_dir = self.root / '.git'
+            index_file = (git_dir if git_dir.is_dir() else self.root) / WORKSPACE_INDEX_NAME
+        self.index_file = Path(index_file)
+        self._ignored = {self.index_file.name, f"{self.index_file.name}.tmp"}
+        # pasta relativa ('' = raiz) -> {'mtime': ns, 'entries': {nome: [tipo 'f'/'d', tamanho, mtime]}}
+        self._dirs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self.rescanned = 0
+        self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.index_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == INDEX_VERSION and isinstance(data.get('dirs'), dict):
+            self._dirs = data['dirs']
+
+    def save(self):
+        """
+        Grava o índice de forma atômica (arquivo temporário + rename).
+        """
+        with self._lock:
+            data = {'version': INDEX_VERSION, 'dirs': self._dirs}
+        temp_file = Path(f"{self.index_file}.tmp")
+        try:
+            temp_file.write_text(json.dumps(data, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+            os.replace(temp_file, self.index_file)
+        except OSError as e:
+            print(f"⚠️ Erro ao gravar índice do projeto: {e}")
+
+    @staticmethod
+    def _descend(name: str) -> bool:
+        return name not in EXCLUDED_DIRS and name not in CACHE_DIR_NAMES
+
+    def _scan(self, path: Path, directory: str) -> Dict[str, List]:
+        entries = {}
+        try:
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    if not directory and entry.name in self._ignored:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            entries[entry.name] = ['d', 0, 0]
+                        else:
+                            stat = entry.stat(follow_symlinks=False)
+                            entries[entry.name] = ['f', stat.st_size, stat.st_mtime_ns]
+                    except OSError:
+                        continue  # removido durante a leitura
+        except OSError:
+            pass
+        return entries
+
+    def _restat(self, path: Path, directory: str, entries: Dict[str, List], changes: Dict) -> Dict[str, List]:
+        """
+        Confere tamanho e mtime dos arquivos de uma pasta cuja lista não mudou.
+        """
+        updated = dict(entries)
+        for name, info in entries.items():
+            if info[0] != 'f':
+                continue
+            try:
+                stat = os.stat(path / name, follow_symlinks=False)
+            except OSError:
+                del updated[name]
+                changes['removed'].append(_join(directory, name))
+                continue
+            if [stat.st_size, stat.st_mtime_ns] != info[1:]:
+                updated[name] = ['f', stat.st_size, stat.st_mtime_ns]
+                changes['modified'].append(_join(directory, name))
+        return updated
+
+    def update(self, stat_files: bool = False) -> Dict:
+        """
+        Atualiza o índice, relendo apenas as pastas cujo mtime mudou, e grava o resultado.
+
+        Args:
+            stat_files: Confere também os arquivos das pastas não relidas (edições no lugar)
+
+        Returns:
+            Dicionário com `added`, `modified` e `removed` (arquivos, relativos à raiz),
+            `initial` (primeira indexação: listas vazias), `rescanned` e `directories`
+        """
+        started = time.time_ns()
+        with self._lock:
+            previous = self._dirs
+            initial = not previous
+            changes = {'added': [], 'modified': [], 'removed': []}
+            current: Dict[str, Dict] = {}
+            rescanned = 0
+            pending = ['']
+
+            while pending:
+                directory = pending.pop()
+                path = self.root / directory if directory else self.root
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+
+                old = previous.get(directory)
+                if old is not None and old['mtime'] == mtime:
+                    entries = self._restat(path, directory, old['entries'], changes) if stat_files else old['entries']
+                else:
+                    rescanned += 1
+                    entries = self._scan(path, directory)
+                    if not initial:
+                        old_entries = old['entries'] if old is not None else {}
+                        for name, info in entries.items():
+                            if info[0] != 'f':
+                                continue
+                            if name not in old_entries:
+                                changes['added'].append(_join(directory, name))
+                            elif old_entries[name] != info:
+                                changes['modified'].append(_join(directory, name))
+                        changes['removed'].extend(_join(directory, name) for name, info in old_entries.items()
+                                                  if info[0] == 'f' and name not in entries)
+
+                current[directory] = {'mtime': 0 if mtime >= started - RACY_WINDOW_NS else mtime,
+                                      'entries': entries}
+                pending.extend(_join(directory, name) for name, info in entries.items()
+                               if info[0] == 'd' and self._descend(name))
+
+            # Pastas que deixaram de existir (ou passaram a ser ignoradas)
+            for directory, old in previous.items():
+                if directory not in current:
+                    changes['removed'].extend(_join(directory, name) for name, info in old['entries'].items()
+                                              if info[0] == 'f')
+
+            self._dirs = current
+            self.rescanned = rescanned
+
+        self.save()
+        for paths in changes.values():
+            paths.sort()
+        changes.update(initial=initial, rescanned=rescanned, directories=len(current))
+        return changes
+
+    def files(self) -> Iterator[Tuple[str, int, int]]:
+        """
+        Arquivos indexados: (caminho relativo, tamanho, mtime em ns).
+        """
+        for directory, record in self._dirs.items():
+            for name, (kind, size, mtime) in record['entries'].items():
+                if kind == 'f':
+                    yield _join(directory, name), size, mtime
+
+    def temp_files(self) -> List[Dict]:
+        """
+        Arquivos temporários e pastas de cache encontrados na última atualização.
+
+        Returns:
+            Lista de {`path`, `kind` ('cache' ou 'temp'), `size`}, ordenada pelo caminho
+        """
+        found = []
+        for directory, record in self._dirs.items():
+            for name, (kind, size, _) in record['entries'].items():
+                if kind == 'd' and name in CACHE_DIR_NAMES:
+                    found.append({'path': _join(directory, name), 'kind': 'cache', 'size': 0})
+                elif kind == 'f' and _TEMP_FILE.match(name):
+                    found.append({'path': _join(directory, name), 'kind': 'temp', 'size': size})
+        found.sort(key=lambda item: item['path'])
+        return found
+
+    def kind(self, relative_path: str) -> Optional[str]:
+        """
+        Tipo de um caminho pelo índice: 'f', 'd' ou None se ausente (dentro de
+        pastas não percorridas, o disco é consultado).
+        """
+        relative_path = relative_path.replace("\\", "/").strip("/")
+        directory, _, name = relative_path.rpartition('/')
+        record = self._dirs.get(directory)
+        if record is not None:
+            info = record['entries'].get(name)
+            return info[0] if info else None
+
+        path = self.root / relative_path
+        if path.is_dir():
+            return 'd'
+        return 'f' if path.exists() else None
+
+    def missing(self, paths: Iterable[str]) -> List[str]:
+        """
+        Caminhos essenciais ausentes (os terminados em `/` precisam ser pastas).
+        """
+        missing = []
+        for path in paths:
+            kind = self.kind(path)
+            if kind is None or (path.endswith('/') and kind != 'd'):
+                missing.append(path)
+        return missing
+
+    def clean(self, dry_run: bool = False) -> Dict:
+        """
+        Remove os arquivos temporários e as pastas de cache indexados.
+
+        Returns:
+            Dicionário com `removed` (itens de `temp_files`), `bytes` e `errors`
+        """
+        result = {'removed': [], 'bytes': 0, 'errors': []}
+        for item in self.temp_files():
+            path = self.root / item['path']
+            try:
+                if not dry_run:
+                    if item['kind'] == 'cache':
+                        shutil.rmtree(path)
+                    else:
+                        path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                result['errors'].append(f"{item['path']}: {e}")
+                continue
+            result['removed'].append(item)
+            result['bytes'] += item['size']
+        return result
+
+
+def main():
+    import argparse
+
+    project_root = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description='ELIS-V1 workspace file index')
+    parser.add_argument('--action', default='changes', choices=('changes', 'temp', 'clean'))
+    parser.add_argument('--root', type=str, default=str(project_root), help='Project root')
+    parser.add_argument('--dry-run', action='store_true', help='List what --action clean would remove')
+    parser.add_argument('--stat-files', action='store_true',
+                        help='Also stat files in unchanged directories (detects in-place edits)')
+
+    args = parser.parse_args()
+    index = WorkspaceIndex(Path(args.root))
+    changes = index.update(stat_files=args.stat_files)
+
+    if args.action == 'changes':
+        if changes['initial']:
+            print(f"📁 Índice criado: {changes['directories']} pasta(s)")
+            return
+        print(f"🔍 Alterações desde a última execução ({changes['rescanned']}/{changes['directories']} pasta(s) relida(s)):")
+        for kind, marker in (('added', '+'), ('modified', '~'), ('removed', '-')):
+            for path in changes[kind]:
+                print(f"   {marker} {path}")
+        if not (changes['added'] or changes['modified'] or changes['removed']):
+            print("   Nenhuma alteração")
+
+    elif args.action == 'temp':
+        found = index.temp_files()
+        if not found:
+            print("✨ Nenhum arquivo temporário ou cache encontrado")
+        for item in found:
+            print(f"   • {item['path']}{'/' if item['kind'] == 'cache' else ''}")
+
+    elif args.action == 'clean':
+        result = index.clean(dry_run=args.dry_run)
+        verb = "Seriam removidos" if args.dry_run else "Removidos"
+        print(f"🧹 {verb}: {len(result['removed'])} item(ns), {result['bytes'] / 1024:.1f} KB de arquivos temporários")
+        for error in result['errors']:
+            print(f"   ⚠️ {error}")
+        if not args.dry_run:
+            index.update()
+        if result['errors']:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
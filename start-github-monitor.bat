@@ -25,7 +25,7 @@ if "%choice%"=="2" (
     echo.
     echo Iniciando monitoramento continuo...
     echo Pressione Ctrl+C para parar
-    powershell -ExecutionPolicy Bypass -File "github-monitor.ps1" -Action monitor
+    python src\ai_workflow_assistant.py --scheduler
     pause
     goto menu
 )
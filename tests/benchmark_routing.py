@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks do reconhecimento e roteamento do assistente ELIS-V1
+Projeto colaborativo desenvolvido por Marduka e Gustavo
+
+Gera arquivos `workflow-config.json` sintéticos em várias escalas, mede
+latência (p50/p99), vazão e pico de memória dos caminhos críticos e a
+qualidade das sugestões (hit@1, hit@k, MRR), e grava os resultados em JSON
+para comparação entre execuções.
+
+Uso:
+    python tests/benchmark_routing.py --sizes 10,1000,100000 --output bench.json
+    python tests/benchmark_routing.py --compare bench.json --tolerance 0.25
+"""
+
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Adicionar o diretório src ao path para importações
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from ai_workflow_assistant import AIWorkflowAssistant
+from config_snapshot import RACY_WINDOW_NS
+
+DEFAULT_SIZES = (10, 1000, 10000, 100000)
+DEFAULT_QUERIES = 2000
+# Palavras-chave por operação e padrões por intenção nas configurações sintéticas
+KEYWORDS_PER_OPERATION = 5
+OPERATIONS_PER_CATEGORY = 10
+PATTERNS_PER_INTENT = 10
+
+# Palavras-chave frequentes (como "status") acrescentadas a parte das operações no corpus de qualidade
+COMMON_KEYWORDS = ("status", "situação", "verificar")
+COMMON_KEYWORD_RATE = 0.3
+
+SYLLABLES = ["ba", "ce", "di", "fo", "gu", "la", "me", "ni", "po", "ru", "sa", "te", "vi", "zo", "ção", "ão"]
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def generate_config(size: int, seed: int = 0) -> Dict:
+    """
+    Gera uma configuração sintética com `size` palavras-chave e `size` padrões.
+
+    Args:
+        size: Quantidade de palavras-chave (e de padrões de intenção)
+        seed: Semente do gerador, para configurações reprodutíveis
+
+    Returns:
+        Configuração no formato de `workflow-config.json`
+    """
+    rng = random.Random(seed)
+    vocabulary = [_word(rng) for _ in range(max(50, size // 2))]
+
+    def phrase(min_words: int, max_words: int) -> str:
+        return " ".join(rng.choice(vocabulary) for _ in range(rng.randint(min_words, max_words)))
+
+    intent_detection = {}
+    for intent_index in range(max(1, size // PATTERNS_PER_INTENT)):
+        intent_detection[f"intent_{intent_index}"] = {
+            'patterns': [phrase(1, 4) for _ in range(min(PATTERNS_PER_INTENT, size))],
+            'confidence_threshold': rng.choice([0.5, 0.6, 0.7, 0.8]),
+            'action': f"flow_{intent_index}"
+        }
+
+    workflow_mapping: Dict[str, Dict] = {}
+    operation_count = max(1, size // KEYWORDS_PER_OPERATION)
+    for operation_index in range(operation_count):
+        category = workflow_mapping.setdefault(f"category_{operation_index // OPERATIONS_PER_CATEGORY}", {})
+        category[f"operation_{operation_index}"] = {
+            'keywords': [phrase(1, 2) for _ in range(min(KEYWORDS_PER_OPERATION, size))],
+            'description': f"Operação sintética {operation_index}",
+            'script': f"scripts/operation-{operation_index}.bat"
+        }
+
+    return {
+        'ai_recognition_patterns': {'intent_detection': intent_detection},
+        'ai_workflow_mapping': workflow_mapping,
+        'workflow_definitions': {},
+        'automation_settings': {'logging': {'log_all_workflows': False}}
+    }
+
+
+def generate_inputs(config: Dict, count: int, seed: int = 0) -> List[str]:
+    """
+    Gera entradas de usuário: metade contém padrões/palavras-chave da configuração,
+    metade é texto sem correspondência.
+    """
+    rng = random.Random(seed + 1)
+    patterns = [pattern for intent in config['ai_recognition_patterns']['intent_detection'].values()
+                for pattern in intent['patterns']]
+    keywords = [keyword for category in config['ai_workflow_mapping'].values()
+                for operation in category.values() for keyword in operation['keywords']]
+
+    inputs = []
+    for index in range(count):
+        if index % 2:
+            inputs.append(f"quero {rng.choice(patterns)} e {rng.choice(keywords)} agora")
+        else:
+            inputs.append(" ".join(_word(rng) + "x" for _ in range(rng.randint(2, 8))))
+    return inputs
+
+
+def generate_quality_corpus(size: int, count: int, seed: int = 0) -> Tuple[Dict, List[Tuple[str, str]]]:
+    """
+    Gera o corpus de qualidade das sugestões.
+
+    A configuração sintética recebe palavras-chave frequentes em parte das
+    operações; cada consulta combina uma delas com uma palavra-chave própria
+    da operação esperada.
+
+    Returns:
+        Tupla (configuração, [(entrada, operação esperada)])
+    """
+    config = generate_config(size, seed)
+    rng = random.Random(seed + 2)
+    operations = [(operation_name, operation) for category in config['ai_workflow_mapping'].values()
+                  for operation_name, operation in category.items()]
+    own_keywords = {operation_name: list(operation['keywords']) for operation_name, operation in operations}
+    for _, operation in operations:
+        if rng.random() < COMMON_KEYWORD_RATE:
+            operation['keywords'].append(rng.choice(COMMON_KEYWORDS))
+
+    queries = []
+    for _ in range(count):
+        operation_name, _ = rng.choice(operations)
+        queries.append((f"{rng.choice(COMMON_KEYWORDS)} {rng.choice(own_keywords[operation_name])}", operation_name))
+    return config, queries
+
+
+def suggestion_quality(assistant: AIWorkflowAssistant, queries: Sequence[Tuple[str, str]]) -> Dict:
+    """
+    Mede a qualidade das sugestões BM25 e da contagem simples de palavras-chave
+    (ranqueamento anterior, usado como linha de base).
+
+    Returns:
+        {'bm25': métricas, 'keyword_count': métricas}, com `hit_at_1`, `hit_at_k` e `mrr`
+    """
+    keyword_index = assistant.keyword_index
+    top_k = assistant.suggestion_ranker.top_k
+
+    def keyword_count(text: str) -> List[str]:
+        relevance = keyword_index.relevance(text)
+        ranked = sorted(relevance, key=lambda index: (-relevance[index], index))[:top_k]
+        return [keyword_index.operations[index][1] for index in ranked]
+
+    def bm25(text: str) -> List[str]:
+        return [suggestion['operation'] for suggestion in assistant.suggest_workflows(text)]
+
+    quality = {}
+    for name, ranking in (('bm25', bm25), ('keyword_count', keyword_count)):
+        hits_at_1 = hits_at_k = reciprocal_ranks = 0.0
+        for text, expected in queries:
+            ranked = ranking(text)
+            if expected in ranked:
+                position = ranked.index(expected) + 1
+                hits_at_1 += position == 1
+                hits_at_k += 1
+                reciprocal_ranks += 1 / position
+        total = max(1, len(queries))
+        quality[name] = {'hit_at_1': hits_at_1 / total, 'hit_at_k': hits_at_k / total, 'mrr': reciprocal_ranks / total}
+    return quality
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(func: Callable, arguments: Sequence, warmup: int = 10) -> Dict:
+    """
+    Mede latência, vazão e pico de memória de `func` sobre cada argumento.
+
+    A memória é medida em uma passada separada, pois o tracemalloc distorce os tempos.
+
+    Returns:
+        Estatísticas em microssegundos, chamadas por segundo e KiB
+    """
+    for argument in arguments[:warmup]:
+        func(argument)
+
+    latencies = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for argument in arguments:
+            call_started = time.perf_counter()
+            func(argument)
+            latencies.append(time.perf_counter() - call_started)
+        total = time.perf_counter() - started
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        for argument in arguments[:min(len(arguments), 200)]:
+            func(argument)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'calls': len(latencies),
+        'p50_us': _percentile(latencies, 0.50) * 1e6,
+        'p99_us': _percentile(latencies, 0.99) * 1e6,
+        'mean_us': (total / len(latencies)) * 1e6 if latencies else 0.0,
+        'throughput_per_s': len(latencies) / total if total else 0.0,
+        'peak_kib': peak / 1024
+    }
+
+
+def benchmark_size(size: int, queries: int, load_repeats: int = 3, seed: int = 0) -> Dict:
+    """
+    Executa todos os benchmarks para uma escala de configuração.
+
+    Returns:
+        Dicionário {operação: estatísticas}
+    """
+    temp_dir = Path(tempfile.mkdtemp(prefix="elis-bench-"))
+    try:
+        config = generate_config(size, seed)
+        config_file = temp_dir / "workflow-config.json"
+        config_file.write_text(json.dumps(config, ensure_ascii=False), encoding='utf-8')
+        # Arquivo recém-gravado fica na janela "racy" do snapshot (sempre confere o hash):
+        # recua o mtime para medir o caminho rápido, só pelo stat
+        past_ns = config_file.stat().st_mtime_ns - RACY_WINDOW_NS - 1_000_000_000
+        os.utime(config_file, ns=(past_ns, past_ns))
+        sources = []
+
+        def load_config(_):
+            with open(config_file, 'r', encoding='utf-8') as f:
+                json.load(f)
+
+        def construct_cold(_):
+            AIWorkflowAssistant(str(config_file), verbose=False, use_snapshot=False)
+
+        def construct_snapshot(_):
+            sources.append(AIWorkflowAssistant(str(config_file), verbose=False, use_snapshot=True).load_stats['source'])
+
+        runs = [None] * load_repeats
+        results = {
+            'config_load': measure(load_config, runs, warmup=0),
+            'construct': measure(construct_cold, runs, warmup=0)
+        }
+        construct_snapshot(None)  # grava o snapshot antes de medir o caminho rápido
+        del sources[:]
+        results['construct_snapshot'] = measure(construct_snapshot, runs, warmup=0)
+        if set(sources) != {'snapshot'}:
+            raise RuntimeError(f"construct_snapshot não usou o caminho rápido do snapshot: {sources}")
+        results['construct_snapshot']['source'] = 'snapshot'
+
+        assistant = AIWorkflowAssistant(str(config_file), verbose=False, use_snapshot=False)
+        inputs = generate_inputs(config, queries, seed)
+        results['recognize_intent'] = measure(assistant.recognize_intent, inputs)
+        results['find_workflow_by_keywords'] = measure(assistant.find_workflow_by_keywords, inputs)
+        results['suggest_workflows'] = measure(assistant.suggest_workflows, inputs)
+        results['route_request'] = measure(assistant.route_request, inputs)
+        return results
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def quality_size(size: int, queries: int, seed: int = 0) -> Dict:
+    """
+    Mede a qualidade das sugestões para uma escala de configuração.
+    """
+    temp_dir = Path(tempfile.mkdtemp(prefix="elis-bench-"))
+    try:
+        config, labeled = generate_quality_corpus(size, queries, seed)
+        config_file = temp_dir / "workflow-config.json"
+        config_file.write_text(json.dumps(config, ensure_ascii=False), encoding='utf-8')
+        assistant = AIWorkflowAssistant(str(config_file), verbose=False, use_snapshot=False)
+        return suggestion_quality(assistant, labeled)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def run_benchmarks(sizes: Sequence[int], queries: int = DEFAULT_QUERIES, load_repeats: int = 3,
+                   progress: Optional[Callable[[str], None]] = None) -> Dict:
+    """
+    Executa os benchmarks em todas as escalas.
+
+    Returns:
+        Relatório serializável com ambiente e resultados por escala
+    """
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'queries': queries,
+        'results': {},
+        'quality': {}
+    }
+    for size in sizes:
+        if progress:
+            progress(f"⏱️ Escala {size}...")
+        report['results'][str(size)] = benchmark_size(size, queries, load_repeats)
+        report['quality'][str(size)] = quality_size(size, queries)
+    return report
+
+
+def compare_reports(baseline: Dict, current: Dict, tolerance: float = 0.25,
+                    metric: str = 'p50_us') -> List[Dict]:
+    """
+    Lista as regressões de `current` em relação a `baseline`.
+
+    Args:
+        tolerance: Aumento relativo aceito (0.25 = 25%)
+        metric: Métrica comparada
+
+    Returns:
+        Regressões com escala, operação, valores e variação relativa
+    """
+    regressions = []
+    for size, operations in current['results'].items():
+        for operation, stats in operations.items():
+            previous = baseline.get('results', {}).get(size, {}).get(operation)
+            if not previous or not previous.get(metric):
+                continue
+            change = stats[metric] / previous[metric] - 1
+            if change > tolerance:
+                regressions.append({'size': size, 'operation': operation, 'baseline': previous[metric],
+                                    'current': stats[metric], 'change': change})
+    return regressions
+
+
+def print_report(report: Dict):
+    print(f"{'escala':>8} {'operação':<27} {'p50 (µs)':>11} {'p99 (µs)':>11} {'ops/s':>11} {'pico (KiB)':>11}")
+    for size, operations in report['results'].items():
+        for operation, stats in operations.items():
+            print(f"{size:>8} {operation:<27} {stats['p50_us']:>11.1f} {stats['p99_us']:>11.1f} "
+                  f"{stats['throughput_per_s']:>11.0f} {stats['peak_kib']:>11.1f}")
+
+    if report.get('quality'):
+        print(f"\n{'escala':>8} {'sugestões':<27} {'hit@1':>11} {'hit@k':>11} {'MRR':>11}")
+        for size, rankers in report['quality'].items():
+            for ranker, metrics in rankers.items():
+                print(f"{size:>8} {ranker:<27} {metrics['hit_at_1']:>11.3f} {metrics['hit_at_k']:>11.3f} "
+                      f"{metrics['mrr']:>11.3f}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='ELIS-V1 routing benchmarks')
+    parser.add_argument('--sizes', type=str, default=",".join(map(str, DEFAULT_SIZES)),
+                        help='Comma-separated keyword/pattern counts')
+    parser.add_argument('--queries', type=int, default=DEFAULT_QUERIES, help='Inputs timed per operation')
+    parser.add_argument('--load-repeats', type=int, default=3, help='Repetitions of load/construction timings')
+    parser.add_argument('--output', type=str, metavar='FILE', help='Write results as JSON')
+    parser.add_argument('--compare', type=str, metavar='FILE', help='Baseline JSON; exit 1 on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative slowdown for --compare')
+
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+
+    report = run_benchmarks(sizes, args.queries, args.load_repeats,
+                            progress=lambda message: print(message, file=sys.stderr))
+    print_report(report)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"\n💾 Resultados gravados em {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+        regressions = compare_reports(baseline, report, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regressão(ões) acima de {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"   • {regression['size']} {regression['operation']}: "
+                      f"{regression['baseline']:.1f} → {regression['current']:.1f} µs ({regression['change']:+.0%})")
+            sys.exit(1)
+        print("\n✅ Nenhuma regressão em relação à linha de base")
+
+
+if __name__ == "__main__":
+    main()
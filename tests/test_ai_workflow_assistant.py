@@ -0,0 +1,2200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes para o assistente de fluxos de trabalho do ELIS-V1
+Projeto colaborativo desenvolvido por Marduka e Gustavo
+"""
+
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Adicionar o diretório src ao path para importações
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from ai_workflow_assistant import AIWorkflowAssistant
+from intent_matcher import CompiledIntentMatcher, np
+from keyword_automaton import KeywordAutomaton
+from fuzzy_matcher import FuzzyTermIndex, edit_distance
+from suggestion_ranker import BM25_B, BM25_K1, DESCRIPTION_WEIGHT, KEYWORD_WEIGHT, SuggestionRanker
+from log_writer import BackgroundLogWriter, shared_log_writer
+from log_stats import LogStatsIndex
+from log_analytics import LogFilter, analyze_logs, default_log_paths, read_lines
+from step_engine import StepEngine, build_step_graph
+from async_runner import WorkflowRunner
+from execution_plan import compile_plan, compile_plans
+from output_capture import RingBuffer, StreamCapture
+from config_snapshot import ConfigSnapshot
+from config_watcher import ConfigWatcher
+from assistant_daemon import AssistantDaemon
+from ai_workflow_client import AssistantClient, send_request
+from telemetry import LatencyHistogram, WorkflowTelemetry
+from text_normalization import fold_text, routing_key, routing_key_mode
+from routing_cache import RoutingCache
+from git_monitor import GitMonitor, analyze_task_progress
+from notification_store import NotificationStore
+from workflow_actions import ActionContext, ActionRunner, action_result, parse_porcelain_status, prune_backup_refs
+from scheduler import DailySchedule, IntervalSchedule, JobScheduler, load_scheduler_state
+from monitor_jobs import MonitorJobs
+from usage_stats import UsageCounters
+from workspace_index import WorkspaceIndex
+from job_queue import ResourceClaim, WorkflowJobQueue
+
+
+def calculate_similarity(text1, text2):
+    """
+    Pontuação de referência: padrão contido no texto vale 0.9, senão palavras em comum / palavras do padrão.
+    """
+    if text2 in text1:
+        return 0.9
+
+    words1 = set(text1.split())
+    words2 = set(text2.split())
+    if not words2:
+        return 0.0
+    return len(words1.intersection(words2)) / len(words2)
+
+
+def reference_scores(matcher, user_input):
+    """
+    Confiança de referência de cada padrão de um matcher (apenas as maiores que zero).
+    """
+    text = matcher.normalize(user_input).strip()
+    scores = {pattern_id: calculate_similarity(text, pattern)
+              for pattern_id, pattern in enumerate(matcher.pattern_texts)}
+    return {pattern_id: confidence for pattern_id, confidence in scores.items() if confidence > 0}
+
+
+def linear_recognize(assistant, user_input):
+    """
+    Implementação de referência: varredura linear de todos os padrões.
+    """
+    user_input_lower = user_input.lower().strip()
+    patterns = assistant.config.get('ai_recognition_patterns', {}).get('intent_detection', {})
+
+    best_match = None
+    best_confidence = 0.0
+    for intent_config in patterns.values():
+        threshold = intent_config.get('confidence_threshold', 0.7)
+        for pattern in intent_config.get('patterns', []):
+            confidence = calculate_similarity(user_input_lower, pattern.lower())
+            if confidence >= threshold and confidence > best_confidence:
+                best_match = intent_config.get('action')
+                best_confidence = confidence
+
+    if best_match:
+        return best_match, best_confidence
+    return None
+
+
+def linear_find_workflow(assistant, user_input):
+    """
+    Implementação de referência da busca por palavras-chave.
+    """
+    user_input_lower = user_input.lower()
+    for category_name, category in assistant.config.get('ai_workflow_mapping', {}).items():
+        for operation_name, operation in category.items():
+            for keyword in operation.get('keywords', []):
+                if keyword.lower() in user_input_lower:
+                    return (category_name, operation_name)
+    return None
+
+
+def linear_suggest(assistant, user_input):
+    """
+    Implementação de referência das sugestões: BM25 calculado por varredura de todas as operações.
+    """
+    settings = assistant.config.get('automation_settings', {}).get('smart_suggestions', {})
+    top_k = settings.get('top_k', 5)
+    min_score = settings.get('min_score', 0.0)
+    operations = [(category_name, operation_name, operation)
+                  for category_name, category in assistant.config.get('ai_workflow_mapping', {}).items()
+                  for operation_name, operation in category.items()]
+    user_input_lower = user_input.lower()
+    input_words = set(user_input_lower.split())
+
+    keyword_lists = [[keyword.lower() for keyword in operation.get('keywords', [])] for _, _, operation in operations]
+    description_lists = [[word for word in operation.get('description', '').lower().split() if len(word) >= 3]
+                         for _, _, operation in operations]
+
+    def field_scores(term_lists, matches, field_weight):
+        average_length = sum(len(terms) for terms in term_lists) / len(term_lists)
+        # Termos na ordem de primeira ocorrência (mesma ordem de soma do ranqueador)
+        ordered_terms = list(dict.fromkeys(term for terms in term_lists for term in terms))
+        scores = [0.0] * len(term_lists)
+        for term in ordered_terms:
+            if not matches(term):
+                continue
+            frequency_by_operation = [terms.count(term) for terms in term_lists]
+            document_frequency = sum(1 for frequency in frequency_by_operation if frequency)
+            idf = math.log(1 + (len(term_lists) - document_frequency + 0.5) / (document_frequency + 0.5))
+            for index, frequency in enumerate(frequency_by_operation):
+                if frequency:
+                    scores[index] += field_weight * idf * frequency * (BM25_K1 + 1) / (
+                        frequency + BM25_K1 * (1 - BM25_B + BM25_B * len(term_lists[index]) / average_length))
+        return scores
+
+    if not operations:
+        return []
+    keyword_scores = field_scores(keyword_lists, lambda keyword: keyword in user_input_lower, KEYWORD_WEIGHT)
+    description_scores = field_scores(description_lists, lambda word: word in input_words, DESCRIPTION_WEIGHT)
+
+    suggestions = []
+    for index, (category_name, operation_name, _) in enumerate(operations):
+        score = keyword_scores[index] + description_scores[index]
+        if score > 0 and score >= min_score:
+            suggestions.append((category_name, operation_name, score, index))
+    suggestions.sort(key=lambda x: (-x[2], x[3]))
+    return [(category_name, operation_name, round(score, 4)) for category_name, operation_name, score, _ in suggestions[:top_k]]
+
+
+def make_assistant(config, temp_dir):
+    """
+    Cria um assistente a partir de uma configuração gravada em diretório temporário.
+    """
+    config.setdefault('project_info', {'name': 'ELIS-V1-TEST'})
+    config.setdefault('ai_workflow_mapping', {})
+    config.setdefault('automation_settings', {}).setdefault('logging', {'log_all_workflows': False})
+
+    config_path = Path(temp_dir) / "workflow-config.json"
+    config_path.write_text(json.dumps(config, ensure_ascii=False), encoding='utf-8')
+    return AIWorkflowAssistant(str(config_path))
+
+
+class TestIntentRecognition(unittest.TestCase):
+    """
+    Testes do reconhecimento de intenções
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_project_config_matches_linear_scan(self):
+        """
+        Testa se o matcher compilado reproduz a varredura linear na configuração do projeto
+        """
+        config = json.loads((project_root / "workflow-config.json").read_text(encoding='utf-8'))
+        config['automation_settings']['logging']['log_all_workflows'] = False
+        assistant = make_assistant(config, self.temp_dir)
+
+        commands = [
+            "Quero fazer commit das mudanças",
+            "Verificar status do projeto",
+            "Ativar ambiente Python",
+            "Instalar dependências",
+            "Rodar testes",
+            "Monitorar GitHub",
+            "  COMMITAR as mudanças  ",
+            "estado ver",
+            "",
+        ]
+        for command in commands:
+            self.assertEqual(assistant.recognize_intent(command), linear_recognize(assistant, command), command)
+
+    def test_random_configs_match_linear_scan(self):
+        """
+        Testa a equivalência com a varredura linear em configurações aleatórias
+        """
+        rng = random.Random(42)
+        vocabulary = ["git", "commit", "status", "ver", "python", "rodar", "testes",
+                      "situação", "ambiente", "mudanças", "com", "mit", "a", "o"]
+
+        for _ in range(30):
+            intents = {}
+            for i in range(rng.randint(1, 6)):
+                patterns = [" ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 3)))
+                            for _ in range(rng.randint(1, 5))]
+                intent = {'patterns': patterns, 'action': rng.choice([f"flow_{i}", None, ""])}
+                if rng.random() < 0.7:
+                    intent['confidence_threshold'] = rng.choice([0.3, 0.5, 0.7, 0.8, 0.9, 1.0])
+                intents[f"intent_{i}"] = intent
+
+            assistant = make_assistant({'ai_recognition_patterns': {'intent_detection': intents}}, self.temp_dir)
+
+            commands = [" ".join(rng.choice(vocabulary).upper() if rng.random() < 0.2 else rng.choice(vocabulary)
+                                 for _ in range(rng.randint(0, 5)))
+                        for _ in range(40)]
+            expected = [linear_recognize(assistant, command) for command in commands]
+
+            for command, result in zip(commands, expected):
+                self.assertEqual(assistant.recognize_intent(command), result, command)
+            if np is not None:
+                self.assertEqual(assistant.intent_matcher.match_many(commands, use_numpy=True), expected)
+
+    def test_priority_breaks_ties(self):
+        """
+        Testa o desempate por prioridade (e a parada antecipada na confiança máxima) contra a varredura completa
+        """
+        rng = random.Random(3)
+        vocabulary = ["git", "commit", "status", "ver", "rodar", "testes", "com", "mit", "a"]
+
+        for _ in range(30):
+            intents = {f"intent_{i}": {'patterns': [" ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 3)))
+                                                    for _ in range(rng.randint(1, 4))],
+                                       'confidence_threshold': rng.choice([0.3, 0.5, 0.8, 1.0]),
+                                       'action': f"flow_{i}"}
+                       for i in range(rng.randint(1, 5))}
+            matcher = CompiledIntentMatcher(intents)
+            priority = list(range(len(matcher.pattern_actions)))
+            rng.shuffle(priority)
+
+            for _ in range(30):
+                command = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 5)))
+                candidates = {pattern_id: confidence
+                              for pattern_id, confidence in reference_scores(matcher, command).items()
+                              if confidence >= matcher.pattern_thresholds[pattern_id]}
+                expected = None
+                if candidates:
+                    best = max(candidates.values())
+                    expected = (min((pattern_id for pattern_id, confidence in candidates.items() if confidence == best),
+                                    key=priority.__getitem__), best)
+                self.assertEqual(matcher.best_match(command, priority), expected, command)
+                if np is not None:
+                    winner = matcher.match_many([command], use_numpy=True, priority=priority)[0]
+                    self.assertEqual(winner, matcher.match(command, priority), command)
+
+    def test_upper_bound_cutoff(self):
+        """
+        Testa a parada antecipada acima de 0.9 e os padrões longos (sobreposição entre 0.9 e 1.0)
+        """
+        words = [f"palavra{i}" for i in range(20)]
+        matcher = CompiledIntentMatcher({
+            'longo': {'patterns': [" ".join(words)], 'confidence_threshold': 0.9, 'action': "longo"},
+            'curto': {'patterns': ["palavra1"], 'confidence_threshold': 0.5, 'action': "curto"}
+        })
+        command = " ".join(reversed(words[1:]))  # 19 de 20 palavras, fora de ordem
+        self.assertEqual(reference_scores(matcher, command)[0], 0.95)
+        # o padrão curto é ocorrência literal (0.9): perde para o longo sem varrer substrings
+        with unittest.mock.patch.object(matcher, '_substring_hits', side_effect=AssertionError):
+            self.assertEqual(matcher.best_match(command), (0, 0.95))
+        self.assertEqual(matcher.best_match(" ".join(words[1:5])), (1, 0.9))
+        self.assertEqual(matcher.best_match(" ".join(words)), (0, 0.9))
+
+    def test_substring_without_shared_token(self):
+        """
+        Testa se padrões contidos em palavras maiores ainda são reconhecidos
+        """
+        matcher = CompiledIntentMatcher({
+            'commit_intent': {'patterns': ["commit"], 'confidence_threshold': 0.8, 'action': "git_commit_flow"}
+        })
+        self.assertEqual(matcher.match("vamos commitar"), ("git_commit_flow", 0.9))
+        self.assertIsNone(matcher.match("status"))
+
+
+class TestKeywordRouting(unittest.TestCase):
+    """
+    Testes da busca de fluxos por palavras-chave
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def assertRoutingMatchesLinear(self, assistant, command):
+        workflow = assistant.find_workflow_by_keywords(command)
+        found = (workflow['category'], workflow['operation']) if workflow else None
+        self.assertEqual(found, linear_find_workflow(assistant, command), command)
+
+        suggestions = [(s['category'], s['operation'], s['relevance']) for s in assistant.suggest_workflows(command)]
+        self.assertEqual(suggestions, linear_suggest(assistant, command), command)
+
+    def test_automaton_finds_overlapping_keywords(self):
+        """
+        Testa se o autômato encontra palavras-chave sobrepostas e aninhadas
+        """
+        automaton = KeywordAutomaton(["he", "she", "his", "hers", "e"])
+        found = {automaton.keywords[k] for k in automaton.find("ushers")}
+        self.assertEqual(found, {"he", "she", "hers", "e"})
+        self.assertEqual(automaton.find("xyz"), set())
+
+    def test_project_config_matches_linear_scan(self):
+        """
+        Testa a equivalência com a varredura linear na configuração do projeto
+        """
+        config = json.loads((project_root / "workflow-config.json").read_text(encoding='utf-8'))
+        config['automation_settings']['logging']['log_all_workflows'] = False
+        assistant = make_assistant(config, self.temp_dir)
+
+        for command in ["Quero fazer commit das mudanças", "Verificar status do projeto",
+                        "situação do projeto e status", "Monitorar GitHub", "nada a ver", ""]:
+            self.assertRoutingMatchesLinear(assistant, command)
+
+    def test_bm25_prefers_rare_keywords(self):
+        """
+        Testa se palavras-chave frequentes não dominam o ranqueamento e o top-k/piso configuráveis
+        """
+        mapping = {'ops': {f"op_{i}": {'keywords': ["status", f"tarefa {i}"], 'description': "Operação comum"}
+                           for i in range(6)}}
+        mapping['ops']['deploy'] = {'keywords': ["implantar"], 'description': "Publicar versão"}
+        assistant = make_assistant({'ai_workflow_mapping': mapping}, self.temp_dir)
+
+        suggestions = assistant.suggest_workflows("status implantar")
+        self.assertEqual(suggestions[0]['operation'], "deploy")
+        self.assertEqual(len(suggestions), 5)
+        self.assertGreater(suggestions[0]['relevance'], 2 * suggestions[1]['relevance'])
+        self.assertAlmostEqual(suggestions[0]['relevance'],
+                               linear_suggest(assistant, "status implantar")[0][2], places=6)
+
+        ranker = SuggestionRanker(assistant.keyword_index, top_k=2, min_score=suggestions[1]['relevance'] + 0.01)
+        self.assertEqual(ranker.rank("status implantar"), [(6, ranker.scores("status implantar")[6])])
+        self.assertEqual(ranker.rank("nada"), [])
+
+    def test_random_mappings_match_linear_scan(self):
+        """
+        Testa a equivalência com a varredura linear em mapeamentos aleatórios
+        """
+        rng = random.Random(7)
+        alphabet = "abcã "
+
+        def word():
+            return "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+
+        for _ in range(30):
+            mapping = {}
+            for c in range(rng.randint(1, 4)):
+                mapping[f"cat_{c}"] = {
+                    f"op_{o}": {'description': f"op {c}.{o}",
+                                'keywords': [word().upper() if rng.random() < 0.2 else word()
+                                             for _ in range(rng.randint(0, 4))]}
+                    for o in range(rng.randint(1, 4))
+                }
+            assistant = make_assistant({'ai_workflow_mapping': mapping}, self.temp_dir)
+
+            for _ in range(30):
+                self.assertRoutingMatchesLinear(assistant, "".join(rng.choice(alphabet + "B") for _ in range(rng.randint(0, 12))))
+
+
+class TestFuzzyMatching(unittest.TestCase):
+    """
+    Testes da camada de correção aproximada
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_term_correction(self):
+        """
+        Testa a distância de edição e a correção de termos pelo índice de trigramas
+        """
+        self.assertEqual(edit_distance("stauts", "status", 2), 1)
+        self.assertEqual(edit_distance("comitar", "commitar", 2), 1)
+        self.assertEqual(edit_distance("git", "python", 1), 2)
+
+        index = FuzzyTermIndex(["status", "commit", "commitar", "testes", "git"])
+        self.assertEqual(index.correct_term("stauts"), "status")
+        self.assertEqual(index.correct_term("comitar"), "commitar")
+        self.assertIsNone(index.correct_term("status"))  # já existe
+        self.assertIsNone(index.correct_term("gti"))     # curta demais
+        self.assertIsNone(index.correct_term("zuqueta"))
+        self.assertEqual(index.correct("rodar tsetes"), ("rodar testes", [("tsetes", "testes")]))
+
+        # Vocabulário grande: apenas `max_candidates` termos por palavra são avaliados
+        rng = random.Random(3)
+        vocabulary = ["".join(rng.choice("abcdefghij") for _ in range(8)) for _ in range(5000)]
+        index = FuzzyTermIndex(vocabulary + ["implantar"], max_candidates=4)
+        self.assertEqual(index.correct_term("implnatar"), "implantar")
+
+    def test_fallback_only_when_exact_fails(self):
+        """
+        Testa o roteamento com erros de digitação e a desativação pela configuração
+        """
+        config = json.loads((project_root / "workflow-config.json").read_text(encoding='utf-8'))
+        config['automation_settings']['logging']['log_all_workflows'] = False
+        assistant = make_assistant(config, self.temp_dir)
+
+        result = assistant.route_request("verificar stauts do projeto")
+        self.assertEqual(result['workflow']['operation'], "status")
+        self.assertEqual(result['corrected_input'], "verificar status do projeto")
+        self.assertEqual(assistant.recognize_intent("comitar as mudanças")[0], "git_commit_flow")
+        self.assertEqual(assistant.find_workflow_by_keywords("comitar")['operation'], "commit")
+
+        exact = assistant.route_request("Verificar status do projeto")
+        self.assertIsNone(exact['corrected_input'])
+        self.assertEqual(exact['intent'], linear_recognize(assistant, "Verificar status do projeto")[0])
+
+        config['ai_recognition_patterns']['fuzzy_matching'] = {'enabled': False}
+        assistant = make_assistant(config, self.temp_dir)
+        self.assertIsNone(assistant.route_request("verificar stauts")['workflow'])
+
+
+class TestBatchProcessing(unittest.TestCase):
+    """
+    Testes do processamento em lote
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        config = json.loads((project_root / "workflow-config.json").read_text(encoding='utf-8'))
+        config['automation_settings']['logging']['log_all_workflows'] = False
+        self.assistant = make_assistant(config, self.temp_dir)
+        self.commands = ["Quero fazer commit das mudanças", "Verificar status do projeto",
+                         "ver estado", "Ativar ambiente Python", "nada a ver", "", "situação"] * 5
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_batch_matches_single_routing(self):
+        """
+        Testa se o lote produz os mesmos resultados do roteamento individual
+        """
+        expected = [self.assistant.route_request(command) for command in self.commands]
+        results = list(self.assistant.process_batch(iter(self.commands), batch_size=4))
+        self.assertEqual(results, expected)
+
+    @unittest.skipIf(np is None, "NumPy não instalado")
+    def test_numpy_scoring_matches_linear_scan(self):
+        """
+        Testa se a pontuação vetorizada reproduz a varredura linear
+        """
+        results = self.assistant.intent_matcher.match_many(self.commands, use_numpy=True)
+        self.assertEqual(results, [linear_recognize(self.assistant, command) for command in self.commands])
+
+
+class TestLogWriter(unittest.TestCase):
+    """
+    Testes do escritor de log em segundo plano
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = Path(self.temp_dir) / "workflow-automation.log"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_lines_written_in_order(self):
+        """
+        Testa se todas as linhas enfileiradas são gravadas, na ordem
+        """
+        writer = BackgroundLogWriter(self.log_file)
+        for i in range(1000):
+            writer.write(f"linha {i}\n")
+        self.assertTrue(writer.flush(timeout=5))
+        writer.close()
+
+        lines = self.log_file.read_text(encoding='utf-8').splitlines()
+        self.assertEqual(lines, [f"linha {i}" for i in range(1000)])
+
+    def test_shared_writer_per_path(self):
+        """
+        Testa o compartilhamento do escritor por arquivo e a remoção do atexit no close
+        """
+        writer = shared_log_writer(self.log_file)
+        self.assertIs(shared_log_writer(Path(self.temp_dir) / "." / "workflow-automation.log"), writer)
+        self.assertIsNot(shared_log_writer(Path(self.temp_dir) / "outro.log"), writer)
+        shared_log_writer(Path(self.temp_dir) / "outro.log").close()
+
+        with unittest.mock.patch('log_writer.atexit.unregister') as unregister:
+            writer.close()
+        unregister.assert_called_once_with(writer.close)
+        self.assertIsNot(shared_log_writer(self.log_file), writer)
+        shared_log_writer(self.log_file).close()
+
+    def test_size_based_rotation(self):
+        """
+        Testa a rotação por tamanho e o limite de arquivos mantidos
+        """
+        writer = BackgroundLogWriter(self.log_file, max_bytes=100, backup_count=2)
+        for i in range(30):
+            writer.write(f"entrada {i:04d} ........\n")
+            writer.flush(timeout=5)
+        writer.close()
+
+        self.assertLessEqual(self.log_file.stat().st_size, 100)
+        self.assertTrue(Path(f"{self.log_file}.1").exists())
+        self.assertTrue(Path(f"{self.log_file}.2").exists())
+        self.assertFalse(Path(f"{self.log_file}.3").exists())
+        self.assertIn("entrada 0029", self.log_file.read_text(encoding='utf-8'))
+
+
+class TestLogStats(unittest.TestCase):
+    """
+    Testes das estatísticas incrementais do log
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = Path(self.temp_dir) / "workflow-automation.log"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def append(self, text):
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_incremental_counts(self):
+        """
+        Testa se apenas as linhas novas são contabilizadas a cada atualização
+        """
+        self.append("[2026-10-01 10:00:00] [INFO] Fluxo encontrado: git_operations.commit\n"
+                    "[2026-10-01 10:00:01] [INFO] Fluxo commit executado com sucesso\n")
+        stats = LogStatsIndex(self.log_file).update()
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['workflows'], {'commit': 2})
+
+        # Linha incompleta não é contada até receber a quebra de linha
+        self.append("[2026-10-02 09:00:00] [ERROR] Erro na execução do fluxo push: código 1")
+        self.assertEqual(LogStatsIndex(self.log_file).update()['entries'], 2)
+
+        self.append("\n")
+        stats = LogStatsIndex(self.log_file).update()
+        self.assertEqual(stats['entries'], 3)
+        self.assertEqual(stats['levels'], {'INFO': 2, 'ERROR': 1})
+        self.assertEqual(stats['days'], {'2026-10-01': 2, '2026-10-02': 1})
+        self.assertEqual(stats['offset'], self.log_file.stat().st_size)
+
+    def test_rotation_keeps_totals(self):
+        """
+        Testa se um log recriado é reindexado do início sem perder os totais anteriores
+        """
+        self.append("[2026-10-01 10:00:00] [INFO] a\n" * 5)
+        LogStatsIndex(self.log_file).update()
+
+        self.log_file.write_text("[2026-10-03 10:00:00] [WARNING] b\n" * 8, encoding='utf-8')
+        stats = LogStatsIndex(self.log_file).update()
+        self.assertEqual(stats['entries'], 13)
+        self.assertEqual(stats['levels'], {'INFO': 5, 'WARNING': 8})
+        self.assertEqual((stats['rotations'], stats['rotated']['entries']), (1, 5))
+        self.assertEqual(stats['offset'], self.log_file.stat().st_size)
+
+        # Rotação pelo escritor: as linhas do arquivo antigo ainda não indexadas vêm de `.1`
+        self.append("[2026-10-03 11:00:00] [ERROR] Erro na execução do fluxo push: código 1\n")
+        os.replace(self.log_file, f"{self.log_file}.1")
+        self.append("[2026-10-04 10:00:00] [INFO] c\n")
+        stats = LogStatsIndex(self.log_file).update()
+        self.assertEqual(stats['entries'], 15)
+        self.assertEqual(stats['workflows'], {'push': 1})
+        self.assertEqual((stats['rotations'], stats['rotated']['entries']), (2, 14))
+
+
+class TestLogAnalytics(unittest.TestCase):
+    """
+    Testes da análise dos logs em streaming
+    """
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_log(self, name, lines):
+        path = self.temp_dir / name
+        path.write_text("".join(line + "\n" for line in lines), encoding='utf-8')
+        return path
+
+    def test_aggregates_and_filters(self):
+        """
+        Testa taxas de sucesso, horários e os filtros de período, nível e fluxo
+        """
+        workflow_log = self.write_log("workflow-automation.log", [
+            "[2026-10-01 09:00:00] [INFO] Fluxo encontrado: git_operations.commit",
+            "[2026-10-01 09:00:05] [INFO] Fluxo commit executado com sucesso",
+            "[2026-10-01 09:30:00] [ERROR] Erro na execução do fluxo commit: código 1",
+            "linha solta de um script",
+            "[2026-10-02 14:00:00] [ERROR] Pré-ações de deploy falharam",
+            "[2026-10-02 14:10:00] [INFO] Fluxo deploy executado com sucesso",
+        ])
+        self.write_log("github-updates.log", ["[2026-10-02 14:20:00] [ALERT] NOVA ATUALIZACAO DETECTADA!"])
+        self.write_log("workflow-automation.log.1", ["[2026-09-30 08:00:00] [INFO] Fluxo commit executado com sucesso"])
+
+        paths = default_log_paths(self.temp_dir)
+        self.assertEqual([path.name for path in paths],
+                         ["workflow-automation.log.1", "workflow-automation.log", "github-updates.log"])
+
+        report = analyze_logs(paths)
+        self.assertEqual((report['entries'], report['unparsed']), (7, 1))
+        self.assertEqual((report['first'], report['last']), ("2026-09-30 08:00:00", "2026-10-02 14:20:00"))
+        self.assertEqual(report['workflows']['commit'], {'found': 1, 'success': 2, 'failure': 1, 'success_rate': 0.6667})
+        self.assertEqual(report['workflows']['deploy']['success_rate'], 0.5)
+        self.assertEqual((report['success'], report['failure']), (3, 2))
+        self.assertEqual(report['hours'], {'08': 1, '09': 3, '14': 3})
+        self.assertEqual(report['levels'], {'INFO': 4, 'ERROR': 2, 'ALERT': 1})
+
+        report = analyze_logs([workflow_log], LogFilter(since="2026-10-01 09:10", until="2026-10-02 14:00"))
+        self.assertEqual(report['entries'], 2)
+        report = analyze_logs(paths, LogFilter(until="2026-10-01", levels=["error"]))
+        self.assertEqual(list(report['workflows']), ['commit'])
+        self.assertEqual(report['entries'], 1)
+        report = analyze_logs(paths, LogFilter(workflow="deploy"))
+        self.assertEqual((report['entries'], report['success'], report['failure']), (2, 1, 1))
+
+    def test_byte_range_shards(self):
+        """
+        Testa se faixas de bytes cobrem cada linha uma vez e se a análise paralela coincide com a sequencial
+        """
+        rng = random.Random(5)
+        lines = [f"[2026-10-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:00:00] "
+                 f"[{rng.choice(['INFO', 'ERROR'])}] Fluxo op_{rng.randint(0, 5)} executado {'x' * rng.randint(0, 40)}"
+                 for _ in range(2000)]
+        path = self.write_log("workflow-automation.log", lines)
+        size = path.stat().st_size
+
+        for _ in range(20):
+            cuts = sorted(rng.sample(range(1, size), rng.randint(1, 8)))
+            ranges = zip([0] + cuts, cuts + [size])
+            collected = [line for start, end in ranges for line in read_lines(path, start, end)]
+            self.assertEqual(b"".join(collected), path.read_bytes())
+
+        sequential = analyze_logs([path])
+        parallel = analyze_logs([path], workers=3, shard_bytes=size // 10)
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(parallel['entries'], 2000)
+
+
+class TestWorkspaceIndex(unittest.TestCase):
+    """
+    Testes do índice incremental da árvore do projeto
+    """
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        for path in ("src/app.py", "src/util.py", "docs/guia.md", "antigo/velho.txt", "README.md"):
+            (self.temp_dir / path).parent.mkdir(parents=True, exist_ok=True)
+            (self.temp_dir / path).write_text("conteúdo", encoding='utf-8')
+        self.age_tree()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def age_tree(self):
+        # mtimes no passado: fora da janela em que pastas recém-alteradas são sempre relidas
+        past = time.time() - 100
+        for directory, _, files in os.walk(self.temp_dir):
+            for name in files:
+                os.utime(os.path.join(directory, name), (past, past))
+            os.utime(directory, (past, past))
+
+    def test_incremental_changes(self):
+        """
+        Testa que só as pastas com mtime alterado são relidas e as alterações reportadas
+        """
+        index = WorkspaceIndex(self.temp_dir)
+        changes = index.update()
+        self.assertTrue(changes['initial'])
+        self.assertEqual(changes['directories'], 4)
+
+        (self.temp_dir / "src" / "novo.py").write_text("x", encoding='utf-8')
+        shutil.rmtree(self.temp_dir / "antigo")
+        with open(self.temp_dir / "docs" / "guia.md", 'a', encoding='utf-8') as f:
+            f.write(" editado")  # edição no lugar: a pasta docs mantém o mtime
+
+        # Persistido: uma nova instância continua de onde a anterior parou
+        changes = WorkspaceIndex(self.temp_dir).update()
+        self.assertFalse(changes['initial'])
+        self.assertEqual((changes['added'], changes['modified'], changes['removed']),
+                         (["src/novo.py"], [], ["antigo/velho.txt"]))
+        self.assertEqual(changes['rescanned'], 2)  # raiz (arquivo do índice) e src
+
+        changes = WorkspaceIndex(self.temp_dir).update(stat_files=True)
+        self.assertEqual((changes['added'], changes['modified'], changes['removed']), ([], ["docs/guia.md"], []))
+
+    def test_temp_files_missing_paths_and_clean(self):
+        """
+        Testa a listagem e a limpeza de temporários/cache e a verificação de caminhos essenciais
+        """
+        (self.temp_dir / "src" / "__pycache__").mkdir()
+        (self.temp_dir / "src" / "__pycache__" / "app.pyc").write_bytes(b"x" * 10)
+        (self.temp_dir / "docs" / "guia.md.bak").write_bytes(b"x" * 5)
+        (self.temp_dir / ".venv" / "lib").mkdir(parents=True)
+        (self.temp_dir / ".venv" / "lib" / "pacote.pyc").write_bytes(b"x")
+
+        index = WorkspaceIndex(self.temp_dir)
+        index.update()
+        self.assertEqual([(item['path'], item['kind']) for item in index.temp_files()],
+                         [("docs/guia.md.bak", 'temp'), ("src/__pycache__", 'cache')])
+        self.assertEqual(index.missing(["src/", "README.md", "README.md/", "tests/", ".venv/lib/", "src/app.py"]),
+                         ["README.md/", "tests/"])
+
+        result = index.clean(dry_run=True)
+        self.assertEqual((len(result['removed']), result['bytes']), (2, 5))
+        self.assertTrue((self.temp_dir / "src" / "__pycache__").exists())
+
+        result = index.clean()
+        self.assertEqual(result['errors'], [])
+        self.assertFalse((self.temp_dir / "src" / "__pycache__").exists())
+        self.assertFalse((self.temp_dir / "docs" / "guia.md.bak").exists())
+        self.assertTrue((self.temp_dir / ".venv" / "lib" / "pacote.pyc").exists())
+        index.update()
+        self.assertEqual(index.temp_files(), [])
+
+
+class TestJobQueue(unittest.TestCase):
+    """
+    Testes da fila de fluxos com exclusão por recurso
+    """
+
+    def setUp(self):
+        self.events = []
+        self.lock = threading.Lock()
+
+    def job(self, name, seconds=0.1):
+        def handler():
+            with self.lock:
+                self.events.append(('start', name))
+            time.sleep(seconds)
+            with self.lock:
+                self.events.append(('end', name))
+            return name
+        return handler
+
+    def position(self, kind, name):
+        return self.events.index((kind, name))
+
+    def test_claims_from_config(self):
+        """
+        Testa a compatibilidade entre leitores e escritores e o padrão exclusivo
+        """
+        git_read = ResourceClaim.from_config({'resources': {'read': ["git_index"]}})
+        git_write = ResourceClaim.from_config({'resources': {'read': ["network"], 'write': ["git_index"]}})
+        venv_write = ResourceClaim.from_config({'resources': {'write': ["venv"]}})
+        undeclared = ResourceClaim.from_config({'description': "sem recursos"})
+
+        self.assertFalse(git_read.conflicts(git_read))
+        self.assertTrue(git_read.conflicts(git_write))
+        self.assertTrue(git_write.conflicts(git_write))
+        self.assertFalse(git_write.conflicts(venv_write))
+        self.assertTrue(undeclared.conflicts(ResourceClaim()))
+
+        config = json.loads((project_root / "workflow-config.json").read_text(encoding='utf-8'))
+        operations = {name: ResourceClaim.from_config(operation)
+                      for category in config['ai_workflow_mapping'].values() for name, operation in category.items()}
+        self.assertTrue(operations['commit'].conflicts(operations['pull']))
+        self.assertFalse(operations['status'].conflicts(operations['check_github']))
+        self.assertFalse(operations['status'].conflicts(operations['view_notifications']))
+
+    def test_conflicting_jobs_are_serialized_in_order(self):
+        """
+        Testa leitores em paralelo, escritores exclusivos e que um escritor na fila não é ultrapassado
+        """
+        git_read, git_write = ResourceClaim(reads=["git_index"]), ResourceClaim(writes=["git_index"])
+        with WorkflowJobQueue(max_workers=4) as queue:
+            status = queue.submit('status', self.job('status', 0.3), git_read)
+            notifications = queue.submit('view_notifications', self.job('view_notifications', 0.3), git_read)
+            commit = queue.submit('commit', self.job('commit', 0.1), git_write)
+            check = queue.submit('check_github', self.job('check_github', 0.05), git_read)
+            tests = queue.submit('run_tests', self.job('run_tests', 0.05), ResourceClaim(reads=["venv"]))
+
+            snapshot = queue.snapshot()
+            self.assertEqual([job['name'] for job in snapshot['pending']], ['commit', 'check_github'])
+            self.assertTrue(queue.join(timeout=5))
+
+        self.assertEqual(check.result(), 'check_github')
+        # Leitores simultâneos; o independente não espera ninguém
+        self.assertLess(self.position('start', 'view_notifications'), self.position('end', 'status'))
+        self.assertLess(self.position('start', 'run_tests'), self.position('end', 'status'))
+        # O escritor espera os leitores, e o leitor que chegou depois espera o escritor
+        self.assertGreater(self.position('start', 'commit'), self.position('end', 'status'))
+        self.assertGreater(self.position('start', 'commit'), self.position('end', 'view_notifications'))
+        self.assertGreater(self.position('start', 'check_github'), self.position('end', 'commit'))
+        self.assertTrue(status.done() and notifications.done() and commit.done() and tests.done())
+
+    def test_worker_limit_and_errors(self):
+        """
+        Testa o limite de fluxos simultâneos e a propagação de exceções
+        """
+        def failing():
+            raise RuntimeError("falhou")
+
+        with WorkflowJobQueue(max_workers=1) as queue:
+            futures = [queue.submit(f"leitura_{i}", self.job(f"leitura_{i}", 0.05), ResourceClaim(reads=["venv"]))
+                       for i in range(3)]
+            error = queue.submit('erro', failing, ResourceClaim())
+            self.assertEqual([future.result(timeout=5) for future in futures], ['leitura_0', 'leitura_1', 'leitura_2'])
+            self.assertIsInstance(error.exception(timeout=5), RuntimeError)
+
+        self.assertEqual([kind for kind, _ in self.events], ['start', 'end'] * 3)
+        with self.assertRaises(RuntimeError):
+            queue.submit('depois', lambda: None)
+
+
+class TestStepEngine(unittest.TestCase):
+    """
+    Testes do motor de etapas
+    """
+
+    def setUp(self):
+        self.engine = StepEngine(project_root, max_workers=4)
+
+    @staticmethod
+    def sleep_command(seconds, exit_code=0):
+        return f'"{sys.executable}" -c "import sys, time; time.sleep({seconds}); print(\'ok\'); sys.exit({exit_code})"'
+
+    def test_default_dependencies_follow_list_order(self):
+        """
+        Testa se etapas sem depends_on dependem da anterior
+        """
+        graph = build_step_graph([{'action': 'a'}, {'action': 'b'}, {'action': 'c', 'depends_on': []}])
+        self.assertEqual(graph, {'a': [], 'b': ['a'], 'c': []})
+
+    def test_invalid_graphs(self):
+        """
+        Testa a rejeição de dependências desconhecidas e ciclos
+        """
+        with self.assertRaises(ValueError):
+            build_step_graph([{'action': 'a', 'depends_on': ['x']}])
+        with self.assertRaises(ValueError):
+            build_step_graph([{'action': 'a', 'depends_on': ['b']}, {'action': 'b', 'depends_on': ['a']}])
+
+    def test_independent_steps_run_concurrently(self):
+        """
+        Testa se o tempo total segue o caminho crítico e não a soma das etapas
+        """
+        definition = {'steps': [
+            {'action': 'a', 'command': self.sleep_command(0.5), 'depends_on': []},
+            {'action': 'b', 'command': self.sleep_command(0.5), 'depends_on': []},
+            {'action': 'c', 'command': self.sleep_command(0.5), 'depends_on': []},
+            {'action': 'd', 'command': self.sleep_command(0.1), 'depends_on': ['a', 'b', 'c']},
+        ]}
+        report = self.engine.run('paralelo', definition)
+
+        self.assertTrue(report['success'])
+        self.assertLess(report['elapsed'], 1.5)
+        self.assertEqual([step['action'] for step in report['steps']], ['a', 'b', 'c', 'd'])
+        self.assertEqual(report['steps'][0]['stdout'].strip(), 'ok')
+        self.assertGreaterEqual(report['steps'][3]['started'], report['steps'][0]['started'] + 0.5)
+
+    @unittest.skipIf(os.name == 'nt', "usa sh")
+    def test_timeout_kills_process_group(self):
+        """
+        Testa se o tempo limite encerra também os netos que seguram os pipes
+        """
+        pid_file = Path(tempfile.mkdtemp()) / "neto.pid"
+        self.addCleanup(shutil.rmtree, pid_file.parent, ignore_errors=True)
+        engine = StepEngine(project_root, timeout_seconds=1)
+        report = engine.run('travado', {'steps': [
+            {'action': 'neto', 'command': f"sh -c 'sleep 30 & echo $! > {pid_file}; wait'"}]})
+
+        self.assertFalse(report['success'])
+        self.assertIn("Tempo limite excedido", report['steps'][0]['stderr'])
+        self.assertLess(report['elapsed'], 5)
+
+        # O neto também foi encerrado (no máximo um zumbi à espera do init)
+        pid = int(pid_file.read_text().strip())
+        if Path("/proc").is_dir():
+            try:
+                state = Path(f"/proc/{pid}/stat").read_text().rsplit(')', 1)[1].split()[0]
+            except OSError:
+                state = None
+            self.assertIn(state, (None, 'Z'))
+        else:
+            with self.assertRaises(ProcessLookupError):
+                os.kill(pid, 0)
+
+    def test_failure_skips_dependents(self):
+        """
+        Testa se etapas dependentes de uma falha são puladas
+        """
+        definition = {'steps': [
+            {'action': 'falha', 'command': self.sleep_command(0, exit_code=3)},
+            {'action': 'depois', 'command': self.sleep_command(0)},
+            {'action': 'livre', 'command': self.sleep_command(0), 'depends_on': []},
+        ]}
+        report = self.engine.run('falha', definition)
+
+        self.assertFalse(report['success'])
+        self.assertEqual([step['status'] for step in report['steps']], ['failed', 'skipped', 'success'])
+        self.assertEqual(report['steps'][0]['returncode'], 3)
+
+    def test_interactive_step_uses_answer_or_default(self):
+        """
+        Testa o preenchimento do marcador {input} em etapas interativas
+        """
+        step = {'action': 'msg', 'command': ['echo', '{input}'], 'interactive': True, 'default_input': 'padrão'}
+        self.assertEqual(StepEngine(project_root)._prepare_command(step), ['echo', 'padrão'])
+        self.assertEqual(StepEngine(project_root, prompt_handler=lambda _: 'minha')._prepare_command(step),
+                         ['echo', 'minha'])
+
+    @unittest.skipIf(sys.platform == 'win32', "Usa comandos POSIX")
+    def test_interactive_answer_is_not_interpreted_by_shell(self):
+        """
+        Testa se aspas, `$()` e `;` na resposta chegam literais ao comando, sem executar nada
+        """
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        answer = 'fix $(touch PWNED) "quoted"; touch PWNED2'
+        engine = StepEngine(Path(temp_dir), prompt_handler=lambda _: answer)
+        echo = f'"{sys.executable}" -c "import sys; print(sys.argv[1])"'
+
+        for command in ([sys.executable, '-c', 'import sys; print(sys.argv[1])', '{input}'],
+                        f'{echo} "{{input}}"', f'{echo} {{input}}'):
+            report = engine.run('msg', {'steps': [{'action': 'msg', 'command': command, 'interactive': True}]})
+            self.assertTrue(report['success'], report['steps'][0]['stderr'])
+            self.assertEqual(report['steps'][0]['stdout'].rstrip("\n"), answer)
+        self.assertEqual(os.listdir(temp_dir), [])
+
+
+@unittest.skipIf(sys.platform == 'win32', "Usa comandos POSIX")
+class TestWorkflowRunner(unittest.TestCase):
+    """
+    Testes do executor assíncrono de fluxos
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.runner = WorkflowRunner(Path(self.temp_dir), backoff_seconds=0.01)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_timeout_kills_process_group(self):
+        """
+        Testa se o tempo limite encerra o grupo inteiro, incluindo processos filhos
+        """
+        marker = Path(self.temp_dir) / "filho-vivo"
+        command = f"(sleep 1.5; touch {marker}) & sleep 5"
+        report = asyncio.run(self.runner.run('travado', command, timeout=0.3))
+
+        self.assertFalse(report['success'])
+        self.assertTrue(report['timed_out'])
+        self.assertLess(report['elapsed'], 3)
+        asyncio.run(asyncio.sleep(1.5))
+        self.assertFalse(marker.exists())
+
+    def test_retries_until_success(self):
+        """
+        Testa as novas tentativas até o comando ter sucesso
+        """
+        counter = Path(self.temp_dir) / "tentativas"
+        command = f"echo x >> {counter}; [ $(wc -l < {counter}) -ge 3 ]"
+        report = asyncio.run(self.runner.run('instavel', command, max_retries=5))
+
+        self.assertTrue(report['success'])
+        self.assertEqual(report['attempts'], 3)
+
+        report = asyncio.run(self.runner.run('sempre-falha', "exit 2", max_retries=2))
+        self.assertFalse(report['success'])
+        self.assertEqual(report['attempts'], 3)
+        self.assertEqual(report['returncode'], 2)
+
+    def test_independent_workflows_run_concurrently(self):
+        """
+        Testa a execução simultânea de vários fluxos
+        """
+        jobs = [{'name': f"job_{i}", 'command': "sleep 0.5"} for i in range(4)]
+        reports = asyncio.run(self.runner.run_many(jobs))
+
+        self.assertEqual([report['workflow'] for report in reports], [job['name'] for job in jobs])
+        self.assertTrue(all(report['success'] for report in reports))
+        self.assertLess(max(report['elapsed'] for report in reports), 1.5)
+
+    def test_ring_buffer_keeps_last_bytes(self):
+        """
+        Testa o buffer circular e a entrega da saída ao log em blocos
+        """
+        ring = RingBuffer(8)
+        for chunk in (b"abc", b"defgh", b"ij", b"0123456789xyz"):
+            ring.write(chunk)
+            self.assertEqual(len(ring.getvalue()), min(8, ring.total))
+        self.assertEqual(ring.getvalue(), b"56789xyz")
+        self.assertEqual(ring.dropped, 15)
+        ring.write(b"!")
+        self.assertEqual(ring.getvalue(), b"6789xyz!")
+
+        chunks = []
+        capture = StreamCapture('stdout', 16, sink=lambda stream, text: chunks.append(text), chunk_bytes=10)
+        for piece in ("linha 1\nlin", "ha 2\nlinha", " çã\n", "fim"):
+            capture.feed(piece.encode('utf-8'))
+        capture.close()
+        self.assertEqual(chunks, ["linha 1\n", "linha 2\n", "linha çã\n", "fim"])
+        self.assertEqual(capture.ring.getvalue(), "linha 1\nlinha 2\nlinha çã\nfim".encode('utf-8')[-16:])
+        self.assertTrue(capture.tail().endswith("linha çã\nfim"))
+
+    def test_streaming_capture_is_bounded(self):
+        """
+        Testa a captura em streaming: console ao vivo, buffer limitado e log em blocos
+        """
+        logged = []
+        runner = WorkflowRunner(Path(self.temp_dir), capture_bytes=1024, log_chunk_bytes=4096, echo=False,
+                                output_sink=lambda name, stream, text: logged.append((name, stream, text)))
+        command = (f'"{sys.executable}" -c "import sys\n'
+                   f'for i in range(20000): print(\'linha\', i)\n'
+                   f'sys.stderr.write(\'falhou\\n\'); sys.exit(3)"')
+        report = asyncio.run(runner.run('ruidoso', command))
+
+        self.assertEqual(report['returncode'], 3)
+        self.assertEqual(report['output_bytes']['stderr'], len("falhou\n"))
+        self.assertGreater(report['output_bytes']['stdout'], 200000)
+        self.assertLessEqual(len(report['stdout_tail']), 1024)
+        self.assertTrue(report['stdout_tail'].endswith("linha 19999\n"))
+        self.assertEqual(report['stderr_tail'], "falhou\n")
+
+        stdout_chunks = [text for name, stream, text in logged if stream == 'stdout']
+        self.assertGreater(len(stdout_chunks), 10)
+        self.assertTrue(all(chunk.endswith("\n") for chunk in stdout_chunks))
+        self.assertEqual(sum(len(chunk) for chunk in stdout_chunks), report['output_bytes']['stdout'])
+        self.assertIn(('ruidoso', 'stderr', "falhou\n"), logged)
+
+        # Tempo esgotado com captura: a leitura dos pipes não prende a execução
+        report = asyncio.run(runner.run('travado', "echo inicio; sleep 5", timeout=0.3))
+        self.assertTrue(report['timed_out'])
+        self.assertLess(report['elapsed'], 3)
+        self.assertEqual(report['stdout_tail'], "inicio\n")
+
+
+
+class TestExecutionPlan(unittest.TestCase):
+    """
+    Testes dos planos de execução dos scripts
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_python_plan_runs_without_shell(self):
+        """
+        Testa o argv pré-montado de um script Python e a execução direta, sem shell
+        """
+        (self.root / "scripts").mkdir()
+        (self.root / "scripts" / "eco.py").write_text("import sys\nprint(sys.argv[1:])\n", encoding='utf-8')
+        plan = compile_plan(self.root, 'eco', {'script': "scripts/eco.py",
+                                                'parameters': "--action 'dois termos' $HOME"})
+
+        self.assertTrue(plan.valid)
+        self.assertTrue(plan.exists)
+        self.assertEqual(plan.argv, (sys.executable, str((self.root / "scripts" / "eco.py").resolve()),
+                                     '--action', 'dois termos', '$HOME'))
+        self.assertTrue(plan.matches({'script': "scripts/eco.py", 'parameters': "--action 'dois termos' $HOME"}))
+        self.assertFalse(plan.matches({'script': "scripts/eco.py"}))
+        with self.assertRaises(AttributeError):
+            plan.argv = ('rm',)
+        self.assertFalse(hasattr(plan, '__dict__'))
+
+        # Sem shell, `$HOME` chega literal ao script
+        runner = WorkflowRunner(self.root, capture_bytes=1024, echo=False)
+        report = asyncio.run(runner.run('eco', plan.argv))
+        self.assertTrue(report['success'])
+        self.assertEqual(report['stdout_tail'], "['--action', 'dois termos', '$HOME']\n")
+        self.assertEqual(report['command'], list(plan.argv))
+
+    def test_plans_compiled_on_first_use(self):
+        """
+        Testa que o carregamento não compila planos e que o primeiro uso fica guardado
+        """
+        (self.root / "eco.py").write_text("print('ok')\n", encoding='utf-8')
+        config = {'ai_workflow_mapping': {'ops': {'eco': {'script': str(self.root / "eco.py")}}},
+                  'automation_settings': {'logging': {'log_all_workflows': False}}}
+        assistant = make_assistant(config, self.temp_dir)
+        self.assertEqual(assistant._state['plans'], {})
+
+        workflow = {'category': 'ops', 'operation': 'eco', 'config': config['ai_workflow_mapping']['ops']['eco']}
+        plan = assistant._execution_plan(workflow)
+        self.assertTrue(plan.valid)
+        self.assertIs(assistant._execution_plan(workflow), plan)
+        self.assertIsNot(assistant._execution_plan({**workflow, 'config': {'script': "outro.py"}}), plan)
+
+    def test_validation_errors(self):
+        """
+        Testa os erros de validação registrados na compilação dos planos
+        """
+        (self.root / "sem-permissao").write_text("#!/bin/sh\n", encoding='utf-8')
+        mapping = {
+            'ops': {
+                'ausente': {'script': "scripts/nao-existe.py"},
+                'aspas': {'script': "sem-permissao", 'parameters': "--msg 'sem fim"},
+                'definicao': {'workflow': "fluxo_nativo"}
+            }
+        }
+        plans = compile_plans(self.root, mapping)
+
+        self.assertEqual(set(plans), {('ops', 'ausente'), ('ops', 'aspas')})
+        missing = plans[('ops', 'ausente')]
+        self.assertFalse(missing.valid)
+        self.assertFalse(missing.exists)
+        self.assertEqual(missing.errors, ("script não encontrado: scripts/nao-existe.py",))
+
+        errors = plans[('ops', 'aspas')].errors
+        self.assertTrue(any(error.startswith("parâmetros inválidos") for error in errors))
+        if os.name != 'nt':
+            self.assertIn("script sem permissão de execução: sem-permissao", errors)
+            (self.root / "fluxo.bat").write_text("@echo off\n", encoding='utf-8')
+            self.assertEqual(compile_plan(self.root, 'bat', {'script': "fluxo.bat"}).errors,
+                             ("scripts .bat só executam no Windows",))
+
+
+class TestConfigSnapshot(unittest.TestCase):
+    """
+    Testes do snapshot compilado da configuração
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_file = Path(self.temp_dir) / "workflow-config.json"
+        self.compiled = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def compile_indexes(self, config):
+        self.compiled += 1
+        return {'keys': sorted(config)}
+
+    def write_config(self, config, age_seconds=10):
+        self.config_file.write_text(json.dumps(config), encoding='utf-8')
+        past = self.config_file.stat().st_mtime - age_seconds
+        os.utime(self.config_file, (past, past))
+
+    def test_snapshot_reused_until_content_changes(self):
+        """
+        Testa o reaproveitamento do snapshot e a reconstrução após mudanças
+        """
+        self.write_config({'a': 1})
+        snapshot = ConfigSnapshot(self.config_file)
+
+        self.assertEqual(snapshot.load(self.compile_indexes)[2], 'json')
+        config, indexes, source = snapshot.load(self.compile_indexes)
+        self.assertEqual((config, indexes, source), ({'a': 1}, {'keys': ['a']}, 'snapshot'))
+
+        # Apenas o mtime mudou: reaproveita pelo hash, sem recompilar
+        os.utime(self.config_file, None)
+        self.assertEqual(snapshot.load(self.compile_indexes)[2], 'snapshot-hash')
+        self.assertEqual(self.compiled, 1)
+
+        # Conteúdo novo com o mesmo tamanho e mtime: o hash detecta a mudança
+        mtime = self.config_file.stat().st_mtime_ns
+        self.config_file.write_text(json.dumps({'b': 2}), encoding='utf-8')
+        os.utime(self.config_file, ns=(mtime, mtime))
+        config, indexes, source = snapshot.load(self.compile_indexes)
+        self.assertEqual((config, source), ({'b': 2}, 'json'))
+        self.assertEqual(self.compiled, 2)
+
+    def test_code_change_invalidates_snapshot(self):
+        """
+        Testa se mudanças no código dos índices invalidam o snapshot
+        """
+        self.write_config({'a': 1})
+        snapshot = ConfigSnapshot(self.config_file)
+        self.assertEqual(snapshot.load(self.compile_indexes)[2], 'json')
+        self.assertEqual(snapshot.load(self.compile_indexes)[2], 'snapshot')
+
+        with unittest.mock.patch('config_snapshot.code_fingerprint', return_value="outro código"):
+            self.assertEqual(snapshot.load(self.compile_indexes)[2], 'json')
+        self.assertEqual(self.compiled, 2)
+
+    def test_invalid_json_is_not_cached(self):
+        """
+        Testa se JSON inválido não gera snapshot
+        """
+        self.config_file.write_text("{inválido", encoding='utf-8')
+        self.assertIsNone(ConfigSnapshot(self.config_file).load(self.compile_indexes))
+        self.assertFalse(Path(f"{self.config_file}.snapshot").exists())
+
+    def test_assistant_uses_snapshot(self):
+        """
+        Testa se o assistente carrega índices equivalentes a partir do snapshot
+        """
+        config = json.loads((project_root / "workflow-config.json").read_text(encoding='utf-8'))
+        config['automation_settings']['logging']['log_all_workflows'] = False
+        first = make_assistant(config, self.temp_dir)
+        second = AIWorkflowAssistant(str(self.config_file), verbose=False)
+
+        self.assertEqual(first.load_stats['source'], 'json')
+        self.assertIn(second.load_stats['source'], ('snapshot', 'snapshot-hash'))
+        for command in ["fazer commit", "verificar status", "situação"]:
+            self.assertEqual(first.route_request(command), second.route_request(command))
+
+
+class TestConfigReload(unittest.TestCase):
+    """
+    Testes da recarga incremental da configuração
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = json.loads((project_root / "workflow-config.json").read_text(encoding='utf-8'))
+        self.config['automation_settings']['logging']['log_all_workflows'] = False
+        self.assistant = make_assistant(self.config, self.temp_dir)
+        self.config_file = Path(self.temp_dir) / "workflow-config.json"
+
+    def tearDown(self):
+        self.assistant.stop_config_watch()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def rewrite_config(self, content):
+        self.config_file.write_text(content, encoding='utf-8')
+        # Garantir mtime distinto mesmo em sistemas de arquivos com baixa resolução
+        stat = self.config_file.stat()
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+    def test_only_changed_segments_recompiled(self):
+        """
+        Testa se apenas a intenção e a categoria alteradas são recompiladas
+        """
+        old_state = self.assistant._state
+        intent_name = next(iter(self.config['ai_recognition_patterns']['intent_detection']))
+        category_name = next(iter(self.config['ai_workflow_mapping']))
+        operation = next(iter(self.config['ai_workflow_mapping'][category_name].values()))
+
+        self.config['ai_recognition_patterns']['intent_detection'][intent_name]['patterns'].append("zuqueta")
+        operation['keywords'].append("zuqueta")
+        self.rewrite_config(json.dumps(self.config))
+
+        summary = self.assistant.reload_config()
+        self.assertEqual(summary['intents'], [intent_name])
+        self.assertEqual(summary['categories'], [category_name])
+        self.assertEqual(self.assistant.config_version, old_state['version'] + 1)
+
+        # O estado antigo continua íntegro para solicitações em andamento
+        self.assertIsNone(old_state['intent_matcher'].match("zuqueta"))
+        intent_config = self.config['ai_recognition_patterns']['intent_detection'][intent_name]
+        self.assertEqual(self.assistant.recognize_intent("zuqueta")[0], intent_config['action'])
+        self.assertEqual(self.assistant.find_workflow_by_keywords("zuqueta")['category'], category_name)
+
+        # Índices recompilados continuam equivalentes à varredura linear
+        for command in ["fazer commit", "zuqueta", "verificar status", "xyz"]:
+            self.assertEqual(self.assistant.recognize_intent(command), linear_recognize(self.assistant, command))
+            suggestions = [(s['category'], s['operation'], s['relevance'])
+                           for s in self.assistant.suggest_workflows(command)]
+            self.assertEqual(suggestions, linear_suggest(self.assistant, command))
+
+        # Sem mudanças no conteúdo: nada a recarregar
+        self.rewrite_config(json.dumps(self.config))
+        self.assertIsNone(self.assistant.reload_config())
+
+    def test_invalid_json_keeps_current_state(self):
+        """
+        Testa se um arquivo inválido mantém a configuração atual
+        """
+        state = self.assistant._state
+        self.rewrite_config("{incompleto")
+        self.assertIsNone(self.assistant.reload_config())
+        self.assertIs(self.assistant._state, state)
+
+    def test_watcher_detects_changes_and_retries(self):
+        """
+        Testa a detecção de mudanças e a nova tentativa após falha
+        """
+        results = [False, True]
+        calls = []
+
+        def on_change():
+            calls.append(1)
+            return results[len(calls) - 1]
+
+        watcher = ConfigWatcher(self.config_file, on_change, interval=0.01)
+        self.assertFalse(watcher.check())
+
+        self.rewrite_config(json.dumps(self.config))
+        self.assertFalse(watcher.check())
+        self.assertTrue(watcher.check())
+        self.assertFalse(watcher.check())
+        self.assertEqual(len(calls), 2)
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "requer sockets Unix")
+class TestAssistantDaemon(unittest.TestCase):
+    """
+    Testes do daemon residente e do cliente por socket Unix
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        config = json.loads((project_root / "workflow-config.json").read_text(encoding='utf-8'))
+        config['automation_settings']['logging']['log_all_workflows'] = False
+        self.assistant = make_assistant(config, self.temp_dir)
+        self.socket_path = Path(self.temp_dir) / "assistant.sock"
+
+        self.daemon = AssistantDaemon(self.assistant, self.socket_path)
+        self.daemon.start()
+        self.thread = threading.Thread(target=self.daemon.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.daemon.shutdown()
+        self.thread.join(5)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_requests_match_in_process_routing(self):
+        """
+        Testa se as respostas do daemon equivalem ao roteamento local
+        """
+        with AssistantClient(self.socket_path) as client:
+            for command in ["Quero fazer commit das mudanças", "Verificar status do projeto", "nada a ver"]:
+                response = client.request('route', command)
+                self.assertTrue(response['ok'])
+                self.assertEqual(response['result'], self.assistant.route_request(command))
+
+            intent = self.assistant.recognize_intent("fazer commit")
+            self.assertEqual(client.request('recognize', "fazer commit")['result'],
+                             {'intent': intent[0], 'confidence': intent[1]})
+            self.assertEqual(client.request('ping')['result']['config_version'], self.assistant.config_version)
+
+    def test_invalid_requests(self):
+        """
+        Testa as respostas de erro do protocolo
+        """
+        self.assertFalse(send_request('route', socket_path=self.socket_path)['ok'])
+        self.assertIn('desconhecida', send_request('bogus', "x", socket_path=self.socket_path)['error'])
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as raw:
+            raw.connect(str(self.socket_path))
+            raw.sendall(b"{quebrado\n")
+            self.assertFalse(json.loads(raw.makefile('rb').readline())['ok'])
+
+    def test_single_daemon_per_socket_and_shutdown(self):
+        """
+        Testa a recusa de um segundo daemon e o encerramento pelo cliente
+        """
+        with self.assertRaises(RuntimeError):
+            AssistantDaemon(self.assistant, self.socket_path).start()
+
+        self.assertTrue(send_request('shutdown', socket_path=self.socket_path)['ok'])
+        self.thread.join(5)
+        self.assertFalse(self.socket_path.exists())
+        with self.assertRaises(ConnectionError):
+            send_request('ping', socket_path=self.socket_path)
+
+
+class TestBenchmarks(unittest.TestCase):
+    """
+    Teste rápido da suíte de benchmarks (escala mínima)
+    """
+
+    def test_report_structure_and_comparison(self):
+        """
+        Testa o formato do relatório e a detecção de regressões
+        """
+        sys.path.insert(0, str(Path(__file__).parent))
+        from benchmark_routing import compare_reports, generate_config, quality_size, run_benchmarks
+
+        config = generate_config(40)
+        keywords = sum(len(operation['keywords']) for category in config['ai_workflow_mapping'].values()
+                       for operation in category.values())
+        self.assertEqual(keywords, 40)
+
+        report = run_benchmarks([10], queries=20, load_repeats=1)
+        operations = report['results']['10']
+        self.assertIn('recognize_intent', operations)
+        self.assertEqual(operations['construct_snapshot']['source'], 'snapshot')
+        for stats in operations.values():
+            self.assertLessEqual(stats['p50_us'], stats['p99_us'])
+            self.assertGreater(stats['throughput_per_s'], 0)
+
+        slower = json.loads(json.dumps(report))
+        slower['results']['10']['route_request']['p50_us'] *= 2
+        self.assertEqual(compare_reports(report, report), [])
+        self.assertEqual([r['operation'] for r in compare_reports(report, slower)], ['route_request'])
+
+        quality = quality_size(200, queries=100)
+        self.assertGreater(quality['bm25']['mrr'], quality['keyword_count']['mrr'])
+        self.assertEqual(set(report['quality']['10']), {'bm25', 'keyword_count'})
+
+
+class TestTelemetry(unittest.TestCase):
+    """
+    Testes da telemetria por fase de execução
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_histogram_buckets_and_quantiles(self):
+        """
+        Testa a distribuição nos buckets e a estimativa de quantis
+        """
+        histogram = LatencyHistogram((0.1, 1.0))
+        for seconds in (0.05, 0.05, 0.5, 2.0):
+            histogram.observe(seconds)
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.quantile(0.5), 0.1)
+        self.assertEqual(histogram.quantile(0.99), float('inf'))
+        self.assertIsNone(LatencyHistogram().quantile(0.5))
+
+    def test_execute_workflow_records_phases(self):
+        """
+        Testa o registro das fases, a persistência e a exportação Prometheus
+        """
+        config = {
+            'ai_workflow_mapping': {'demo': {'run': {
+                'keywords': ['demo'], 'description': 'Demo', 'workflow': 'demo_flow',
+                'pre_actions': ['check_git_status'], 'post_actions': ['log_activity']
+            }}},
+            'workflow_definitions': {'demo_flow': {'steps': [{'action': 'echo', 'command': 'echo ok'}]}},
+            'automation_settings': {'logging': {'log_all_workflows': False}}
+        }
+        assistant = make_assistant(config, self.temp_dir)
+        workflow = assistant.find_workflow_by_keywords("demo")
+        self.assertTrue(assistant.execute_workflow(workflow, interactive=False))
+
+        phases = {row['phase']: row for row in assistant.telemetry.rows()}
+        self.assertEqual(set(phases), {'pre_actions', 'definition', 'post_actions', 'total'})
+        self.assertTrue(all(row['count'] == 1 and row['failures'] == 0 for row in phases.values()))
+
+        # Os agregados sobrevivem entre processos
+        reloaded = WorkflowTelemetry(Path(self.temp_dir) / "workflow-metrics.json")
+        self.assertEqual(reloaded.rows(), assistant.telemetry.rows())
+
+        exported = reloaded.to_prometheus()
+        self.assertIn('elis_workflow_phase_seconds_count{workflow="run",phase="definition"} 1', exported)
+        self.assertIn('elis_workflow_phase_total{workflow="run",phase="total",status="success"} 1', exported)
+
+    def test_concurrent_writers_merge(self):
+        """
+        Testa que dois processos gravando o mesmo arquivo não descartam os agregados um do outro
+        """
+        metrics_file = Path(self.temp_dir) / "workflow-metrics.json"
+        daemon = WorkflowTelemetry(metrics_file)
+        cli = WorkflowTelemetry(metrics_file)
+
+        daemon.record_phase('deploy', 'script', 0.2, 'success', 0)
+        cli.record_phase('status', 'script', 0.01, 'failed', 1)
+        daemon.record_phase('deploy', 'script', 0.3, 'success', 0)
+
+        merged = WorkflowTelemetry(metrics_file)
+        self.assertEqual(merged.histograms['deploy']['script'].count, 2)
+        self.assertEqual(merged.outcomes['status']['script'], {'failed': 1})
+        self.assertEqual(merged.last_exit_codes, {'deploy': 0, 'status': 1})
+        self.assertEqual(daemon.rows(), merged.rows())
+
+
+class TestRoutingCache(unittest.TestCase):
+    """
+    Testes do cache de roteamento por entrada normalizada
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_fold_text(self):
+        """
+        Testa a normalização de caixa, espaços e acentos
+        """
+        self.assertEqual(fold_text("  Verificar   SITUAÇÃO\tdo projeto "), "verificar situacao do projeto")
+        self.assertEqual(fold_text(fold_text("Ação rápida")), fold_text("Ação rápida"))
+        self.assertEqual(fold_text(""), "")
+
+    def test_routing_key_mode(self):
+        """
+        Testa quanto espaçamento a chave do cache descarta conforme os padrões
+        """
+        self.assertEqual(routing_key_mode(["commit", "status"]), 'collapse')
+        self.assertEqual(routing_key_mode(["commit", "fazer commit"]), 'strip')
+        self.assertEqual(routing_key_mode(["commit", " commit"]), 'keep')
+        self.assertEqual(routing_key("  git \t status ", 'collapse'), "git status")
+        self.assertEqual(routing_key("  git  status ", 'strip'), "git  status")
+        self.assertEqual(routing_key(" git ", 'keep'), " git ")
+
+    def test_lru_eviction_expiration_and_versions(self):
+        """
+        Testa o descarte LRU, a expiração e a invalidação por versão
+        """
+        cache = RoutingCache(max_entries=2)
+        cache.put("a", 1, "A")
+        cache.put("b", 1, "B")
+        self.assertEqual(cache.get("a", 1), "A")   # "a" passa a ser o mais recente
+        cache.put("c", 1, "C")                      # descarta "b"
+        self.assertIsNone(cache.get("b", 1))
+        self.assertIsNone(cache.get("c", 2))        # versão nova invalida
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions'], stats['invalidations']), (1, 2, 1, 1))
+
+        expiring = RoutingCache(max_entries=2, ttl_seconds=0.01)
+        expiring.put("a", 1, "A")
+        time.sleep(0.02)
+        self.assertIsNone(expiring.get("a", 1))
+        self.assertEqual(expiring.stats()['expirations'], 1)
+
+        self.assertIsNone(RoutingCache(max_entries=0).put("a", 1, "A"))
+
+    def test_assistant_reuses_results_for_equivalent_inputs(self):
+        """
+        Testa se variações de caixa (e, com `fold_accents`, de espaço e acento) reaproveitam o mesmo resultado
+        """
+        config = json.loads((project_root / "workflow-config.json").read_text(encoding='utf-8'))
+        config['automation_settings']['logging']['log_all_workflows'] = False
+
+        # Padrão: apenas minúsculas, como a varredura linear; acentos distinguem as entradas
+        assistant = make_assistant(config, self.temp_dir)
+        for command in ["Verificar situação do projeto", "verificar situacao do projeto", "  VERIFICAR   status "]:
+            self.assertEqual(assistant.route_request(command)['intent'],
+                             (linear_recognize(assistant, command) or (None,))[0], command)
+        self.assertEqual(assistant.routing_cache.stats()['hits'], 0)
+        assistant.route_request("VERIFICAR SITUAÇÃO DO PROJETO")
+        self.assertEqual(assistant.routing_cache.stats()['hits'], 1)
+
+        # Espaços nas pontas nunca mudam o resultado aqui (nenhuma frase começa ou termina com espaço)
+        self.assertEqual(assistant._state['key_whitespace'], 'strip')
+        for command in ["commit", " commit", "commit  "]:
+            self.assertEqual(assistant.route_request(command)['intent'],
+                             (linear_recognize(assistant, command) or (None,))[0], command)
+        self.assertEqual(assistant.routing_cache.stats()['hits'], 3)
+
+        config['ai_recognition_patterns']['normalization'] = {'fold_accents': True}
+        assistant = make_assistant(config, self.temp_dir)
+        first = assistant.route_request("Verificar situação do projeto")
+        second = assistant.route_request("  verificar   SITUACAO do projeto")
+        self.assertEqual({**first, 'input': None}, {**second, 'input': None})
+        self.assertEqual(second['input'], "  verificar   SITUACAO do projeto")
+        self.assertEqual(assistant.routing_cache.stats()['hits'], 1)
+
+        # Resultado em cache igual ao cálculo direto
+        for command in ["fazer commit", "nada a ver", "FAZER  commit"]:
+            cached = assistant.route_request(command)
+            self.assertEqual(cached['intent'], (assistant.recognize_intent(command) or (None,))[0])
+
+        # Nova versão da configuração: a entrada antiga não é reaproveitada
+        self.assertIsNone(assistant.route_request("zuqueta")['workflow'])
+        config['ai_workflow_mapping']['git_operations']['commit']['keywords'].append("zuqueta")
+        (Path(self.temp_dir) / "workflow-config.json").write_text(json.dumps(config), encoding='utf-8')
+        self.assertIsNotNone(assistant.reload_config())
+        self.assertEqual(assistant.route_request("zuqueta")['workflow']['operation'], "commit")
+
+
+@unittest.skipUnless(shutil.which('git'), "requer git")
+class TestGitMonitor(unittest.TestCase):
+    """
+    Testes do monitor Git contra um repositório bare local como `origin`
+    """
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.env = dict(os.environ, GIT_AUTHOR_NAME="Gustavo", GIT_AUTHOR_EMAIL="g@example.com",
+                        GIT_COMMITTER_NAME="Gustavo", GIT_COMMITTER_EMAIL="g@example.com")
+        self.git(self.temp_dir, 'init', '--quiet', '--bare', '--initial-branch=main', 'origin.git')
+        for clone in ('local', 'other'):
+            self.git(self.temp_dir, 'clone', '--quiet', 'origin.git', clone)
+            self.git(self.temp_dir / clone, 'checkout', '--quiet', '-B', 'main')
+        self.commit_and_push("Passo 1: estrutura inicial")
+        self.git(self.temp_dir / 'local', 'pull', '--quiet', 'origin', 'main')
+
+        self.monitor = GitMonitor(self.temp_dir / 'local', branch='main',
+                                  state_file=self.temp_dir / 'state.json',
+                                  notification_store=NotificationStore(self.temp_dir / 'notifications.db'),
+                                  show_notifications=False)
+
+    def tearDown(self):
+        self.monitor.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def git(self, cwd, *args):
+        subprocess.run(['git', *args], cwd=cwd, env=self.env, check=True, capture_output=True)
+
+    def commit_and_push(self, *messages):
+        other = self.temp_dir / 'other'
+        for message in messages:
+            self.git(other, 'commit', '--quiet', '--allow-empty', '-m', message)
+        self.git(other, 'push', '--quiet', 'origin', 'main')
+
+    def test_only_new_commits_are_processed(self):
+        """
+        Testa o acompanhamento pelo último commit visto
+        """
+        self.assertEqual(self.monitor.check()['new_commits'], [])
+
+        self.commit_and_push("Corrigir bug no status", "Adicionar testes")
+        report = self.monitor.check()
+        self.assertEqual([c['subject'] for c in report['new_commits']], ["Corrigir bug no status", "Adicionar testes"])
+        self.assertTrue(report['behind'])
+        self.assertEqual(report['progress'], {'Correcoes': 1, 'Implementacoes': 1, 'Testes': 1})
+
+        # Sem novidades: nada é reprocessado, mesmo com o local ainda atrasado
+        report = self.monitor.check()
+        self.assertEqual(report['new_commits'], [])
+        self.assertTrue(report['behind'])
+
+        self.commit_and_push("Documentar monitor")
+        self.assertEqual([c['subject'] for c in self.monitor.check()['new_commits']], ["Documentar monitor"])
+        titles = [n['Title'] for n in self.monitor.notifications(limit=100)]
+        self.assertEqual(titles.count("Atualizacoes Disponiveis"), 2)
+
+    def test_status_and_sync(self):
+        """
+        Testa o status local/remoto e a sincronização
+        """
+        self.git(self.temp_dir / 'local', 'commit', '--quiet', '--allow-empty', '-m', "local")
+        self.commit_and_push("remoto")
+        self.monitor.check()
+
+        status = self.monitor.status()
+        self.assertEqual((status['branch'], status['unpushed'], status['behind']), ('main', 1, 1))
+        self.assertEqual(status['last_commit']['subject'], "local")
+
+        self.git(self.temp_dir / 'local', 'reset', '--quiet', '--hard', 'HEAD~1')
+        self.assertTrue(self.monitor.sync())
+        self.assertEqual(self.monitor.status()['behind'], 0)
+        self.assertFalse(self.monitor.sync())
+
+    def test_default_store_uses_configured_retention(self):
+        """
+        Testa se o banco padrão do monitor segue a retenção do notification-config.json
+        """
+        local = self.temp_dir / 'local'
+        (local / "notification-config.json").write_text(json.dumps(
+            {'monitoring': {'max_notifications': 7, 'notification_retention_days': 30}}), encoding='utf-8')
+        with GitMonitor(local, branch='main', state_file=self.temp_dir / 'state.json',
+                        show_notifications=False) as monitor:
+            store = monitor.notification_store
+            self.assertEqual((store.max_entries, store.retention_days), (7, 30))
+            self.assertEqual(store.db_path, local / "notifications.db")
+
+    def test_merge_history_walk(self):
+        """
+        Testa a travessia com merges (equivalente a `git log ^visto remoto`)
+        """
+        other = self.temp_dir / 'other'
+        self.monitor.check()
+        self.git(other, 'checkout', '--quiet', '-b', 'feature')
+        self.git(other, 'commit', '--quiet', '--allow-empty', '-m', "feature")
+        self.git(other, 'checkout', '--quiet', 'main')
+        self.git(other, 'commit', '--quiet', '--allow-empty', '-m', "main")
+        self.git(other, 'merge', '--quiet', '--no-ff', '--no-edit', 'feature')
+        self.git(other, 'push', '--quiet', 'origin', 'main')
+
+        subjects = sorted(c['subject'] for c in self.monitor.check()['new_commits'])
+        self.assertEqual(subjects, sorted(["feature", "main", "Merge branch 'feature'"]))
+        self.assertEqual(analyze_task_progress([]), {})
+
+    def test_scheduled_monitor_jobs(self):
+        """
+        Testa as tarefas periódicas de lembrete, resumo diário e relatório semanal
+        """
+        config = {
+            'monitoring': {'enabled': True, 'check_interval_minutes': 5},
+            'notifications': {'unpushed_commits': {'enabled': True, 'reminder_interval_minutes': 30}},
+            'reports': {'daily_summary': {'enabled': True, 'time': "18:00"},
+                        'activity_tracking': {'generate_weekly_report': True}}
+        }
+        jobs = MonitorJobs(self.temp_dir / 'local', config, monitor=self.monitor)
+        scheduler = JobScheduler()
+        self.assertEqual(jobs.register(scheduler), 4)
+        self.assertEqual(sorted(scheduler.jobs), ['daily_summary', 'monitor_check', 'unpushed_reminder', 'weekly_report'])
+
+        jobs.remind_unpushed()
+        self.assertEqual(self.monitor.notifications(), [])
+
+        self.git(self.temp_dir / 'local', 'commit', '--quiet', '--allow-empty', '-m', "Implementar agendador")
+        jobs.check_remote()
+        jobs.remind_unpushed()
+        jobs.daily_summary()
+        jobs.weekly_report()
+
+        notifications = {n['Title']: n['Message'] for n in self.monitor.notifications()}
+        self.assertIn("1 commit(s) aguardando push na branch main", notifications["Commits Pendentes"])
+        self.assertIn("1 REMINDER", notifications["Resumo Diario"])
+        self.assertIn("1 commit(s) sem push", notifications["Resumo Diario"])
+        self.assertIn("2 commit(s)", notifications["Relatorio Semanal"])
+        self.assertIn("Gustavo (2)", notifications["Relatorio Semanal"])
+        self.assertIn("Passos (1)", notifications["Relatorio Semanal"])
+
+
+class TestNotificationStore(unittest.TestCase):
+    """
+    Testes do banco de notificações
+    """
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.store = NotificationStore(self.temp_dir / 'notifications.db')
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_paginated_queries(self):
+        """
+        Testa paginação por cursor e filtros por tipo, período e leitura
+        """
+        for day in range(1, 8):
+            self.store.add(f"Atualizacao {day}", "novo commit", "UPDATE", timestamp=f"2025-01-0{day} 10:00:00")
+            self.store.add(f"Progresso {day}", "Passos (1)", "PROGRESS", timestamp=f"2025-01-0{day} 10:00:00")
+
+        titles, cursor = [], None
+        while True:
+            page = self.store.query(notification_type="UPDATE", limit=3, cursor=cursor)
+            titles.extend(n['Title'] for n in page['notifications'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        self.assertEqual(titles, [f"Atualizacao {day}" for day in range(7, 0, -1)])
+
+        # Empate de horário: o cursor desempata pelo id
+        pages = [self.store.query(since="2025-01-07", limit=1)]
+        pages.append(self.store.query(since="2025-01-07", limit=1, cursor=pages[0]['next_cursor']))
+        self.assertEqual([p['notifications'][0]['Title'] for p in pages], ["Progresso 7", "Atualizacao 7"])
+        self.assertIsNone(pages[1]['next_cursor'])
+
+        self.assertEqual(self.store.count(since="2025-01-02", until="2025-01-03 23:59:59"), 4)
+        # `until` só com a data inclui o dia inteiro
+        self.assertEqual(self.store.count(since="2025-01-02", until="2025-01-03"), 4)
+        updates = self.store.query(notification_type="UPDATE", limit=100)['notifications']
+        self.assertEqual(self.store.mark_read(n['id'] for n in updates), 7)
+        self.assertEqual(self.store.count(read=False), 7)
+        self.assertTrue(all(n['Type'] == "PROGRESS" for n in self.store.query(read=False, limit=100)['notifications']))
+
+    def test_retention(self):
+        """
+        Testa os limites de quantidade e de idade
+        """
+        self.store.max_entries = 3
+        self.store.retention_days = 30
+        self.store.add("antiga", "", timestamp="2000-01-01 00:00:00")
+        for i in range(5):
+            self.store.add(f"recente {i}", "")
+        self.assertEqual(self.store.apply_retention(), 2)
+        self.assertEqual([n['Title'] for n in self.store.query()['notifications']],
+                         ["recente 4", "recente 3", "recente 2"])
+
+    def test_text_file_import(self):
+        """
+        Testa a importação do notifications.txt (apenas linhas novas a cada chamada)
+        """
+        text_file = self.temp_dir / 'notifications.txt'
+        with open(text_file, 'wb') as f:
+            f.write(b'{"Timestamp":"2025-01-01 09:00:00","Title":"Atualizacoes Disponiveis","Message":"2 novo(s)","Type":"UPDATE"}\n')
+            f.write(b'linha corrompida\n')
+            f.write('{"Timestamp":"2025-01-02 09:00:00","Title":"Sincroniza\u00e7\u00e3o","Message":"ok","Type":"SUCCESS"}\n'.encode('cp1252'))
+        self.assertEqual(self.store.import_text_file(text_file), 2)
+        self.assertEqual(self.store.import_text_file(text_file), 0)
+
+        with open(text_file, 'ab') as f:
+            f.write(b'{"Timestamp":"2025-01-03 09:00:00","Title":"Nova","Message":"","Type":"INFO"}\n')
+        self.assertEqual(self.store.import_text_file(text_file), 1)
+        self.assertEqual([n['Title'] for n in self.store.query()['notifications']],
+                         ["Nova", "Sincronização", "Atualizacoes Disponiveis"])
+
+        # Arquivos grandes: gravados em lotes, cada um com o offset lido até ali
+        with open(text_file, 'ab') as f:
+            for i in range(5):
+                f.write(f'{{"Timestamp":"2025-01-04 09:00:0{i}","Title":"Lote {i}","Type":"INFO"}}\n'.encode('utf-8'))
+        batches = []
+        original = self.store._import_batch
+        self.store._import_batch = lambda key, rows, offset: batches.append(len(rows)) or original(key, rows, offset)
+        with unittest.mock.patch('notification_store.IMPORT_BATCH_ROWS', 2):
+            self.assertEqual(self.store.import_text_file(text_file), 5)
+        self.assertEqual(batches, [2, 2, 1])
+        self.assertEqual(self.store.import_text_file(text_file), 0)
+
+
+@unittest.skipUnless(shutil.which('git'), "requer git")
+class TestWorkflowActions(unittest.TestCase):
+    """
+    Testes do registro de pré e pós-ações
+    """
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        env = dict(os.environ, GIT_AUTHOR_NAME="Gustavo", GIT_AUTHOR_EMAIL="g@example.com",
+                   GIT_COMMITTER_NAME="Gustavo", GIT_COMMITTER_EMAIL="g@example.com")
+        for args in (('init', '--quiet', '--initial-branch=main'), ('commit', '--quiet', '--allow-empty', '-m', "inicial")):
+            subprocess.run(['git', *args], cwd=self.temp_dir, env=env, check=True, capture_output=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_porcelain_parsing(self):
+        """
+        Testa a interpretação de `git status --porcelain=v2 --branch`
+        """
+        state = parse_porcelain_status(
+            "# branch.oid abc123\n# branch.head main\n# branch.upstream origin/main\n# branch.ab +2 -1\n"
+            "1 .M N... 100644 100644 100644 aaa bbb src/app.py\n"
+            "2 R. N... 100644 100644 100644 aaa bbb R100 novo nome.py\tantigo.py\n"
+            "u UU N... 100644 100644 100644 100644 aaa bbb ccc conflito.txt\n"
+            "? notas.txt\n")
+        self.assertEqual((state['head'], state['branch'], state['upstream'], state['ahead'], state['behind']),
+                         ("abc123", "main", "origin/main", 2, 1))
+        self.assertEqual(state['changes'], ["src/app.py", "novo nome.py", "conflito.txt", "notas.txt"])
+        self.assertEqual(state['conflicts'], ["conflito.txt"])
+
+    def test_shared_git_snapshot(self):
+        """
+        Testa se as ações compartilham uma única leitura do estado do Git
+        """
+        context = ActionContext(self.temp_dir, "commit")
+        report = ActionRunner().run(['check_git_status', 'validate_changes', 'check_local_changes'], context)
+        self.assertEqual([r['status'] for r in report['actions']], ['success', 'failed', 'success'])
+        self.assertFalse(report['success'])
+
+        (self.temp_dir / "novo.txt").write_text("x", encoding='utf-8')
+        context.git.invalidate()
+        logged = []
+        context.log = lambda message, level="INFO": logged.append(message)
+        report = ActionRunner().run(['check_git_status', 'validate_changes', 'check_local_changes',
+                                     'backup_current_state', 'log_activity', 'check_unpushed_commits'], context)
+        self.assertEqual([r['status'] for r in report['actions']],
+                         ['success', 'success', 'warning', 'success', 'success', 'warning'])
+        self.assertEqual(context.git.reads, 2)
+        self.assertIn("1 alteração(ões) pendente(s)", logged[0])
+
+        # O backup guarda as alterações sem tocar no working directory
+        refs = subprocess.run(['git', 'for-each-ref', '--format=%(refname)', 'refs/elis-backups/'],
+                              cwd=self.temp_dir, capture_output=True, text=True).stdout.split()
+        self.assertEqual(len(refs), 1)
+        files = subprocess.run(['git', 'ls-tree', '--name-only', refs[0]],
+                               cwd=self.temp_dir, capture_output=True, text=True).stdout.split()
+        self.assertEqual(files, ["novo.txt"])
+        status = subprocess.run(['git', 'status', '--porcelain'], cwd=self.temp_dir, capture_output=True, text=True)
+        self.assertEqual(status.stdout, "?? novo.txt\n")
+
+    def test_auto_save_check_and_backup_pruning(self):
+        """
+        Testa a conferência de arquivos não salvos (sem espera) e a remoção dos backups antigos
+        """
+        (self.temp_dir / ".trae-config.json").write_text(json.dumps({'autoSave': {'enabled': True, 'delay': 5000}}),
+                                                         encoding='utf-8')
+        started = time.monotonic()
+        result = ActionRunner().run(['auto_save_files'], ActionContext(self.temp_dir, "commit"))['actions'][0]
+        self.assertEqual(result['status'], 'success')
+        self.assertLess(time.monotonic() - started, 1.0)
+
+        (self.temp_dir / "src").mkdir()
+        (self.temp_dir / "src" / ".app.py.swp").write_bytes(b"x")
+        result = ActionRunner().run(['auto_save_files'], ActionContext(self.temp_dir, "commit"))['actions'][0]
+        self.assertEqual(result['status'], 'warning')
+        self.assertIn("src/.app.py.swp", result['message'])
+
+        for stamp in ("20260101-000000-000000", "20260102-000000-000000", "20260103-000000-000000"):
+            subprocess.run(['git', 'update-ref', f"refs/elis-backups/{stamp}", 'HEAD'], cwd=self.temp_dir, check=True)
+        self.assertEqual(prune_backup_refs(self.temp_dir, keep=2), 1)
+        refs = subprocess.run(['git', 'for-each-ref', '--format=%(refname)', 'refs/elis-backups/'],
+                              cwd=self.temp_dir, capture_output=True, text=True).stdout.split()
+        self.assertEqual(refs, ["refs/elis-backups/20260102-000000-000000", "refs/elis-backups/20260103-000000-000000"])
+        self.assertEqual(prune_backup_refs(self.temp_dir, keep=2), 0)
+
+    def test_validate_changes_flags_temp_files(self):
+        """
+        Testa o aviso de arquivos temporários/cache entre as alterações (via índice da árvore)
+        """
+        (self.temp_dir / "src" / "__pycache__").mkdir(parents=True)
+        (self.temp_dir / "src" / "__pycache__" / "app.cpython-311.pyc").write_bytes(b"x")
+        (self.temp_dir / "src" / "app.py").write_text("x", encoding='utf-8')
+
+        context = ActionContext(self.temp_dir, "commit")
+        result = ActionRunner().run(['validate_changes'], context)['actions'][0]
+        self.assertEqual(result['status'], 'warning')
+        self.assertIn("src/", result['message'])
+
+        # O índice fica dentro de .git: não aparece como alteração
+        self.assertTrue((self.temp_dir / ".git" / "workspace-index.json").exists())
+        (self.temp_dir / ".gitignore").write_text("__pycache__/\n", encoding='utf-8')
+        context = ActionContext(self.temp_dir, "commit")
+        result = ActionRunner().run(['validate_changes'], context)['actions'][0]
+        self.assertEqual((result['status'], result['message']), ('success', "2 arquivo(s) com alterações"))
+
+    def test_independent_actions_run_concurrently(self):
+        """
+        Testa a execução paralela, a ordem de `after` e ações desconhecidas
+        """
+        order = []
+
+        def slow(name):
+            def handler(context):
+                time.sleep(0.2)
+                order.append(name)
+                return action_result('success', name)
+            return handler
+
+        registry = {
+            'a': {'handler': slow('a'), 'after': ()},
+            'b': {'handler': slow('b'), 'after': ()},
+            'c': {'handler': slow('c'), 'after': ('a', 'b')},
+            'falha': {'handler': lambda context: 1 / 0, 'after': ()}
+        }
+        report = ActionRunner(max_workers=4, registry=registry).run(['c', 'a', 'b', 'falha', 'nova'], ActionContext(self.temp_dir, "demo"))
+        self.assertLess(report['elapsed'], 0.55)
+        self.assertEqual(order[-1], 'c')
+        self.assertEqual([r['action'] for r in report['actions']], ['c', 'a', 'b', 'falha', 'nova'])
+        self.assertEqual([r['status'] for r in report['actions'][3:]], ['failed', 'skipped'])
+        self.assertFalse(report['success'])
+
+    def test_failed_pre_action_stops_workflow(self):
+        """
+        Testa se uma pré-ação com falha interrompe o fluxo
+        """
+        config = {
+            'ai_workflow_mapping': {'git': {'commit': {
+                'keywords': ['commit'], 'description': 'Commit', 'workflow': 'commit_flow',
+                'pre_actions': ['check_git_status', 'validate_changes']
+            }}},
+            'workflow_definitions': {'commit_flow': {'steps': [
+                {'action': 'marcar', 'command': 'echo executado > executado.txt'}]}}
+        }
+        # Configuração fora do repositório, para que ele comece sem alterações
+        config_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, config_dir, ignore_errors=True)
+        assistant = make_assistant(config, config_dir)
+        assistant.project_root = self.temp_dir
+        workflow = assistant.find_workflow_by_keywords("commit")
+
+        self.assertFalse(assistant.execute_workflow(workflow, interactive=False))
+        self.assertFalse((self.temp_dir / "executado.txt").exists())
+
+        (self.temp_dir / "alterado.txt").write_text("x", encoding='utf-8')
+        self.assertTrue(assistant.execute_workflow(workflow, interactive=False))
+        self.assertTrue((self.temp_dir / "executado.txt").exists())
+
+    def test_invalid_plan_stops_before_pre_actions(self):
+        """
+        Testa se um fluxo que não pode rodar é recusado antes das pré-ações (sem backup)
+        """
+        config = {
+            'ai_workflow_mapping': {'git': {'push': {
+                'keywords': ['push'], 'description': 'Push', 'script': 'scripts/nao-existe.py',
+                'pre_actions': ['backup_current_state']
+            }}}
+        }
+        config_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, config_dir, ignore_errors=True)
+        assistant = make_assistant(config, config_dir)
+        assistant.project_root = self.temp_dir
+        (self.temp_dir / "alterado.txt").write_text("x", encoding='utf-8')
+
+        self.assertFalse(assistant.execute_workflow(assistant.find_workflow_by_keywords("push"), interactive=False))
+        refs = subprocess.run(['git', 'for-each-ref', 'refs/elis-backups/'],
+                              cwd=self.temp_dir, capture_output=True, text=True).stdout
+        self.assertEqual(refs, "")
+
+
+class TestScheduler(unittest.TestCase):
+    """
+    Testes do agendador de tarefas periódicas
+    """
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_daily_schedule(self):
+        """
+        Testa o cálculo das próximas execuções diárias e semanais
+        """
+        at = lambda *args: datetime(*args).timestamp()
+        daily = DailySchedule("18:00")
+        self.assertEqual(daily.next_after(at(2026, 10, 18, 17, 0)), at(2026, 10, 18, 18, 0))
+        self.assertEqual(daily.next_after(at(2026, 10, 18, 18, 0)), at(2026, 10, 19, 18, 0))
+        self.assertEqual(daily.missed(at(2026, 10, 18, 18, 0), at(2026, 10, 21, 9, 0)), 2)
+
+        weekly = DailySchedule("18:00", weekday=4)
+        self.assertEqual(weekly.next_after(at(2026, 10, 18, 12, 0)), at(2026, 10, 23, 18, 0))
+        self.assertEqual(weekly.next_after(at(2026, 10, 23, 19, 0)), at(2026, 10, 30, 18, 0))
+
+        scheduler = JobScheduler(jitter_seconds=3600, rng=random.Random(7))
+        for i in range(20):
+            job = scheduler.add(f"tarefa_{i}", lambda: None, IntervalSchedule(60))
+            self.assertTrue(0 <= job.next_run - job.base <= 6)  # jitter limitado a 10% do período
+
+    def test_overlapping_runs_are_skipped(self):
+        """
+        Testa que um tick vencido durante a execução anterior é pulado
+        """
+        active, overlaps = [], []
+
+        def slow():
+            overlaps.append(bool(active))
+            active.append(1)
+            time.sleep(0.35)
+            active.pop()
+
+        scheduler = JobScheduler(max_sleep=0.02)
+        job = scheduler.add('lenta', slow, IntervalSchedule(0.1), run_at_start=True)
+
+        async def run_for(seconds):
+            task = asyncio.ensure_future(scheduler.run())
+            await asyncio.sleep(seconds)
+            scheduler.stop()
+            await task
+
+        asyncio.run(run_for(0.8))
+        self.assertEqual(overlaps, [False] * job.runs)
+        self.assertIn(job.runs, (2, 3))
+        self.assertGreaterEqual(job.skipped, 3)
+
+    def test_missed_ticks_and_persisted_state(self):
+        """
+        Testa a recuperação de ticks perdidos (relógio adiantado) e o estado gravado
+        """
+        offset = [0.0]
+        clock = lambda: time.time() + offset[0]
+        state_file = self.temp_dir / "scheduler-state.json"
+        runs = []
+
+        scheduler = JobScheduler(state_file, max_sleep=0.02, clock=clock)
+        job = scheduler.add('verificar', lambda: runs.append(clock()), IntervalSchedule(60), run_at_start=True)
+        scheduler.add('resumo', lambda: None, DailySchedule("18:00"))
+        scheduler.start()
+        try:
+            deadline = time.time() + 2
+            while job.runs < 1 and time.time() < deadline:
+                time.sleep(0.01)
+
+            offset[0] = 3600.5  # "suspensão" de uma hora: 60 ticks vencidos, uma única execução
+            deadline = time.time() + 2
+            while job.runs < 2 and time.time() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.1)
+        finally:
+            scheduler.stop()
+
+        self.assertEqual(job.runs, 2)
+        self.assertEqual(job.missed, 59)
+        self.assertGreater(job.next_run, clock())
+
+        state = load_scheduler_state(state_file)
+        self.assertEqual(list(state['jobs']), ['verificar', 'resumo'])
+        self.assertEqual((state['jobs']['verificar']['runs'], state['jobs']['verificar']['last_status']), (2, 'success'))
+
+        # Depois de reiniciar: contadores restaurados e próxima execução a partir da última
+        restored = JobScheduler(state_file, clock=clock).add('verificar', lambda: None, IntervalSchedule(60),
+                                                             run_at_start=True)
+        self.assertEqual((restored.runs, restored.missed), (2, 59))
+        self.assertAlmostEqual(restored.next_run, runs[-1] + 60, delta=1)
+
+
+class TestUsageCounters(unittest.TestCase):
+    """
+    Testes dos contadores de uso e do roteamento ponderado pelo uso
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_decay_ranks_and_persistence(self):
+        """
+        Testa o decaimento pela meia-vida, a ordem de uso e a gravação entre sessões
+        """
+        now = [1_000_000.0]
+        path = Path(self.temp_dir) / "workflow-usage.json"
+        counters = UsageCounters(path, half_life_days=14, clock=lambda: now[0])
+        for _ in range(3):
+            counters.record("workflow:git.commit")
+        counters.record("workflow:git.status")
+
+        self.assertEqual(counters.ranks(["workflow:git.status", "workflow:nunca", "workflow:git.commit"]), [1, 2, 0])
+        self.assertEqual(counters.priors(["workflow:git.commit", "workflow:nunca"]), [0.6, 0.0])
+
+        now[0] += 14 * 86400
+        self.assertAlmostEqual(counters.count("workflow:git.commit"), 1.5)
+        for _ in range(2):
+            counters.record("workflow:git.status")  # 0.5 + 2 > 1.5: passa a ser o mais usado
+        self.assertEqual(counters.ranks(["workflow:git.commit", "workflow:git.status"]), [1, 0])
+        counters.save()
+
+        restored = UsageCounters(path, half_life_days=14, clock=lambda: now[0])
+        top = restored.top("workflow:")
+        self.assertEqual([name for name, _ in top], ["git.status", "git.commit"])
+        self.assertAlmostEqual(top[0][1], 2.5)
+        self.assertAlmostEqual(top[1][1], 1.5)
+
+        # Anos sem uso: os valores guardados são renormalizados sem perder a ordem
+        now[0] += 5 * 365 * 86400
+        restored.record("intent:git_commit_flow")
+        self.assertEqual(restored.reference, now[0])
+        self.assertEqual(restored.ranks(["workflow:git.commit", "workflow:git.status"]), [1, 0])
+        self.assertAlmostEqual(restored.count("intent:git_commit_flow"), 1.0)
+
+    def test_concurrent_saves_merge(self):
+        """
+        Testa que daemon e CLI gravando o mesmo arquivo somam os usos um do outro
+        """
+        now = [1_000_000.0]
+        path = Path(self.temp_dir) / "workflow-usage.json"
+        daemon = UsageCounters(path, half_life_days=14, clock=lambda: now[0])
+        now[0] += 86400  # referências diferentes: os valores são reescalados na mescla
+        cli = UsageCounters(path, half_life_days=14, clock=lambda: now[0])
+
+        daemon.record("workflow:git.commit")
+        daemon.save()
+        cli.record("workflow:git.status")
+        cli.record("workflow:git.commit")
+        cli.save()
+        daemon.record("workflow:git.status")
+        daemon.save()
+
+        merged = UsageCounters(path, half_life_days=14, clock=lambda: now[0])
+        self.assertAlmostEqual(merged.count("workflow:git.commit"), 2.0)
+        self.assertAlmostEqual(merged.count("workflow:git.status"), 2.0)
+        self.assertAlmostEqual(daemon.count("workflow:git.status"), 2.0)
+
+    def test_usage_reorders_routing(self):
+        """
+        Testa que fluxos e intenções mais usados vencem os empates e sobem nas sugestões
+        """
+        config = {
+            'ai_recognition_patterns': {'intent_detection': {
+                'publicar': {'patterns': ["publicar app"], 'confidence_threshold': 0.8, 'action': "deploy_flow"},
+                'liberar': {'patterns': ["publicar app"], 'confidence_threshold': 0.8, 'action': "release_flow"}
+            }},
+            'ai_workflow_mapping': {'app': {
+                'deploy': {'keywords': ["publicar"], 'description': "Publicar aplicação"},
+                'release': {'keywords': ["publicar"], 'description': "Publicar aplicação"}
+            }},
+            'automation_settings': {'smart_suggestions': {'learn_from_usage': True},
+                                    'logging': {'log_all_workflows': False}}
+        }
+        assistant = make_assistant(config, self.temp_dir)
+        command = "publicar app agora"
+
+        self.assertEqual(assistant.route_request(command)['workflow']['operation'], "deploy")
+        self.assertEqual(assistant.recognize_intent(command), ("deploy_flow", 0.9))
+        suggestions = assistant.suggest_workflows("publicar")
+        self.assertEqual([s['operation'] for s in suggestions], ["deploy", "release"])
+
+        assistant.record_usage({'category': "app", 'operation': "release"}, ("release_flow", 0.9))
+
+        # O cache de roteamento é invalidado pela versão dos contadores
+        self.assertEqual(assistant.route_request(command)['workflow']['operation'], "release")
+        self.assertEqual(assistant.recognize_intent(command), ("release_flow", 0.9))
+        suggestions = assistant.suggest_workflows("publicar")
+        self.assertEqual([s['operation'] for s in suggestions], ["release", "deploy"])
+        self.assertGreater(suggestions[0]['relevance'], suggestions[1]['relevance'])
+
+        # Nova sessão: contadores lidos do arquivo
+        self.assertTrue(assistant.usage_file.exists())
+        restarted = make_assistant(config, self.temp_dir)
+        self.assertEqual(restarted.find_workflow_by_keywords(command)['operation'], "release")
+
+        # Usos que não mudam a ordem não invalidam o cache de roteamento
+        restarted.routing_cache.clear()
+        for _ in range(5):
+            with unittest.mock.patch.object(restarted, 'execute_workflow', return_value=True):
+                self.assertTrue(restarted.process_user_request(command))
+        stats = restarted.routing_cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['invalidations']), (4, 1, 0))
+
+        # Sem `learn_from_usage` o uso não é registrado nem altera a ordem
+        config['automation_settings']['smart_suggestions']['learn_from_usage'] = False
+        disabled = make_assistant(config, self.temp_dir)
+        self.assertIsNone(disabled.usage)
+        self.assertEqual(disabled.find_workflow_by_keywords(command)['operation'], "deploy")
+
+
+if __name__ == "__main__":
+    unittest.main()